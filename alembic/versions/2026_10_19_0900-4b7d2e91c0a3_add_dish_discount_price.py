@@ -0,0 +1,26 @@
+"""add dish discount price
+
+Revision ID: 4b7d2e91c0a3
+Revises: e1cbc265f879
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d2e91c0a3'
+down_revision: str | None = 'e1cbc265f879'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('dish', sa.Column('discount_price', sa.Numeric(precision=10, scale=2), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('dish', 'discount_price')
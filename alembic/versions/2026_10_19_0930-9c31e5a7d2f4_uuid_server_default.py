@@ -0,0 +1,30 @@
+"""uuid server default
+
+Revision ID: 9c31e5a7d2f4
+Revises: 4b7d2e91c0a3
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9c31e5a7d2f4'
+down_revision: str | None = '4b7d2e91c0a3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ('menu', 'submenu', 'dish')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default='e00714c5-24bd-44ca-a80c-b35c61688909')
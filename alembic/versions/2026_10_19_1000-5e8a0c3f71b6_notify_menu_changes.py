@@ -0,0 +1,68 @@
+"""notify menu changes
+
+Revision ID: 5e8a0c3f71b6
+Revises: 9c31e5a7d2f4
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a0c3f71b6'
+down_revision: str | None = '9c31e5a7d2f4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ('menu', 'submenu', 'dish')
+
+# Полезная нагрузка: '<таблица>:<menu_id>:<submenu_id>', пустая строка вместо отсутствующего идентификатора.
+# Для блюда menu_id берётся из подменю; при каскадном удалении подменю уже нет, и menu_id пустой -
+# меню в этом случае инвалидирует уведомление самого подменю.
+NOTIFY_FUNCTION: str = """
+CREATE OR REPLACE FUNCTION notify_menu_change() RETURNS trigger AS $$
+DECLARE
+    changed RECORD;
+    changed_menu_id uuid;
+    changed_submenu_id uuid;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'menu' THEN
+        changed_menu_id := changed.id;
+    ELSIF TG_TABLE_NAME = 'submenu' THEN
+        changed_menu_id := changed.menu_id;
+        changed_submenu_id := changed.id;
+    ELSE
+        changed_submenu_id := changed.submenu_id;
+        SELECT submenu.menu_id INTO changed_menu_id FROM submenu WHERE submenu.id = changed.submenu_id;
+    END IF;
+
+    PERFORM pg_notify(
+        'menu_changes',
+        TG_TABLE_NAME || ':' || coalesce(changed_menu_id::text, '') || ':' || coalesce(changed_submenu_id::text, '')
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    for table in TABLES:
+        op.execute(
+            f'CREATE TRIGGER {table}_notify_change AFTER INSERT OR UPDATE OR DELETE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION notify_menu_change()'
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_notify_change ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS notify_menu_change()')
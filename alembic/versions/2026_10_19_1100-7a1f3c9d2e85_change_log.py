@@ -0,0 +1,80 @@
+"""change log
+
+Revision ID: 7a1f3c9d2e85
+Revises: 5e8a0c3f71b6
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1f3c9d2e85'
+down_revision: str | None = '5e8a0c3f71b6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ('menu', 'submenu', 'dish')
+OPERATIONS: dict[str, str] = {
+    'insert': 'REFERENCING NEW TABLE AS new_rows',
+    'update': 'REFERENCING NEW TABLE AS new_rows',
+    'delete': 'REFERENCING OLD TABLE AS old_rows',
+}
+
+# Триггеры уровня оператора: пакетная запись пишет в журнал одним INSERT ... SELECT из таблицы переходов.
+LOG_FUNCTION: str = """
+CREATE OR REPLACE FUNCTION log_catalogue_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity, entity_id, deleted) SELECT TG_TABLE_NAME, id, true FROM old_rows;
+    ELSE
+        INSERT INTO change_log (entity, entity_id, deleted) SELECT TG_TABLE_NAME, id, false FROM new_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'change_log',
+        sa.Column('id', sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column('txid', sa.BigInteger(), server_default=sa.text('pg_current_xact_id()::text::bigint'),
+                  nullable=False),
+        sa.Column('entity', sa.String(length=16), nullable=False),
+        sa.Column('entity_id', sa.UUID(), nullable=False),
+        sa.Column('deleted', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.create_index('ix_change_log_txid', 'change_log', ['txid'])
+    op.create_index('ix_change_log_created_at', 'change_log', ['created_at'])
+
+    op.create_table(
+        'change_log_state',
+        sa.Column('id', sa.SmallInteger(), primary_key=True),
+        sa.Column('compacted_before', sa.BigInteger(), server_default='0', nullable=False),
+    )
+    op.execute('INSERT INTO change_log_state (id) VALUES (1)')
+
+    op.execute(LOG_FUNCTION)
+    for table in TABLES:
+        for operation, referencing in OPERATIONS.items():
+            op.execute(
+                f'CREATE TRIGGER {table}_log_{operation} AFTER {operation.upper()} ON {table} {referencing} '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION log_catalogue_change()'
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for operation in OPERATIONS:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_log_{operation} ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS log_catalogue_change()')
+    op.drop_table('change_log_state')
+    op.drop_index('ix_change_log_created_at', table_name='change_log')
+    op.drop_index('ix_change_log_txid', table_name='change_log')
+    op.drop_table('change_log')
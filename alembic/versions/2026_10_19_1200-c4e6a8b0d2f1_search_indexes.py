@@ -0,0 +1,45 @@
+"""search indexes
+
+Revision ID: c4e6a8b0d2f1
+Revises: 7a1f3c9d2e85
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e6a8b0d2f1'
+down_revision: str | None = '7a1f3c9d2e85'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ('menu', 'submenu', 'dish')
+
+# Конфигурация 'simple' не зависит от языка: названия бывают и на русском, и на английском,
+# а поиск по префиксу работает по исходным словам без стемминга.
+SEARCH_VECTOR: str = (
+    "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', description), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED'
+        )
+        op.execute(f'CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)')
+        op.execute(f'CREATE INDEX ix_{table}_title_trgm ON {table} USING gin (title gin_trgm_ops)')
+        op.execute(f'CREATE INDEX ix_{table}_description_trgm ON {table} USING gin (description gin_trgm_ops)')
+    op.execute('CREATE INDEX ix_dish_effective_price ON dish ((coalesce(discount_price, price)))')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_dish_effective_price')
+    for table in TABLES:
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_description_trgm')
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_title_trgm')
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_search_vector')
+        op.execute(f'ALTER TABLE {table} DROP COLUMN search_vector')
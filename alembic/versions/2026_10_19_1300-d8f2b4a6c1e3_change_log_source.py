@@ -0,0 +1,67 @@
+"""change log source
+
+Revision ID: d8f2b4a6c1e3
+Revises: c4e6a8b0d2f1
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f2b4a6c1e3'
+down_revision: str | None = 'c4e6a8b0d2f1'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Источник изменения задаётся в транзакции через set_config('menu.change_source', ..., true).
+# После первой установки в сеансе current_setting возвращает пустую строку, а не NULL, отсюда nullif.
+LOG_FUNCTION: str = """
+CREATE OR REPLACE FUNCTION log_catalogue_change() RETURNS trigger AS $$
+DECLARE
+    change_source varchar(32) := nullif(current_setting('menu.change_source', true), '');
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity, entity_id, deleted, source)
+        SELECT TG_TABLE_NAME, id, true, change_source FROM old_rows;
+    ELSE
+        INSERT INTO change_log (entity, entity_id, deleted, source)
+        SELECT TG_TABLE_NAME, id, false, change_source FROM new_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_LOG_FUNCTION: str = """
+CREATE OR REPLACE FUNCTION log_catalogue_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity, entity_id, deleted) SELECT TG_TABLE_NAME, id, true FROM old_rows;
+    ELSE
+        INSERT INTO change_log (entity, entity_id, deleted) SELECT TG_TABLE_NAME, id, false FROM new_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.add_column('change_log', sa.Column('source', sa.String(length=32), nullable=True))
+    op.create_index(
+        'ix_change_log_untagged_txid',
+        'change_log',
+        ['txid'],
+        postgresql_where=sa.text('source IS NULL')
+    )
+    op.execute(LOG_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_LOG_FUNCTION)
+    op.drop_index('ix_change_log_untagged_txid', table_name='change_log')
+    op.drop_column('change_log', 'source')
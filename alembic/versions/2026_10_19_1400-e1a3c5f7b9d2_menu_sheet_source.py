@@ -0,0 +1,28 @@
+"""menu sheet source
+
+Revision ID: e1a3c5f7b9d2
+Revises: d8f2b4a6c1e3
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a3c5f7b9d2'
+down_revision: str | None = 'd8f2b4a6c1e3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('menu', sa.Column('sheet_source', sa.String(length=64), nullable=True))
+    op.create_index('ix_menu_sheet_source', 'menu', ['sheet_source'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_menu_sheet_source', table_name='menu')
+    op.drop_column('menu', 'sheet_source')
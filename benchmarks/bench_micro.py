@@ -0,0 +1,131 @@
+"""
+Микробенчмарки синхронизации с Google Sheets, кэша и построения полного меню.
+
+На синтетическом каталоге (benchmarks.catalogue) измеряются:
+    parse_sheet      - разбор строк листа (SheetRepository.parse_sheet);
+    diff             - сравнение листа с базой (SheetRepository.get_update_or_create_*);
+    full_menu        - построение моделей полного меню (MenuRepository._create_full_menu_models);
+    sheet_full_menu  - построение моделей для синхронизации (SheetRepository._create_full_menu_models);
+    cache_encode     - сериализация полного меню в CacheService.set_cache;
+    cache_decode     - десериализация полного меню в CacheService.get_cache.
+
+База данных и Redis не нужны: кэш работает поверх словаря в памяти.
+
+Запуск:
+    python -m benchmarks.bench_micro
+    python -m benchmarks.bench_micro --menus 20 --submenus 10 --dishes 50 --output benchmarks/results/micro.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from benchmarks.catalogue import generate_catalogue, sheet_rows
+from src.menu.models.menu_model import Menu
+from src.menu.models.models_for_full_menu import AllMenuModel
+from src.menu.repositories.menu_repository import MenuRepository
+from src.menu.repositories.sheet_repository import SheetRepository
+from src.menu.services.cache_keys import FULL_MENU
+from src.menu.services.cache_service import CacheService
+
+
+class MemoryRedis:
+    """Минимальная замена Redis для измерения сериализации кэша без сетевых задержек."""
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+
+    async def get(self, key: bytes) -> bytes | None:
+        return self.data.get(key)
+
+    async def setex(self, key: bytes, expiration: int, value: bytes) -> None:
+        self.data[key] = value
+
+
+def measure(name: str, func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """
+    Выполняет func repeat раз и печатает медиану и минимум.
+
+    :param name: Название бенчмарка.
+    :param func: Измеряемая функция.
+    :param repeat: Количество повторов.
+    :return: Медиана и минимум в миллисекундах.
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    result: dict[str, float] = {'median_ms': statistics.median(timings), 'min_ms': min(timings)}
+    print(f'{name:<16} median {result["median_ms"]:9.2f} ms   min {result["min_ms"]:9.2f} ms')
+    return result
+
+
+def run_async(coroutine_factory: Callable[[], Awaitable[Any]]) -> Callable[[], Any]:
+    """
+    Превращает асинхронную функцию без ввода-вывода в синхронную для measure.
+
+    :param coroutine_factory: Функция, возвращающая корутину.
+    :return: Синхронная функция.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(coroutine_factory())
+
+
+def main(menus: int, submenus: int, dishes: int, changed: float, repeat: int) -> dict[str, Any]:
+    catalogue: list[Menu] = generate_catalogue(menus, submenus, dishes)
+    values: list[list[str]] = sheet_rows(catalogue, changed=changed)
+    sheet_repository: SheetRepository = SheetRepository(None)  # type: ignore[arg-type]
+
+    online: tuple = SheetRepository._create_full_menu_models(catalogue)
+    offline: tuple = sheet_repository.parse_sheet(values)
+    full_menu: list[AllMenuModel] = MenuRepository._create_full_menu_models(catalogue)
+
+    async def diff() -> None:
+        await sheet_repository.get_update_or_create_menu(online[0], offline[0])
+        await sheet_repository.get_update_or_create_submenu(online[1], offline[1])
+        await sheet_repository.get_update_or_create_dish(online[2], offline[2])
+
+    cache_service: CacheService = CacheService(MemoryRedis())  # type: ignore[arg-type]
+    cache_key: bytes = FULL_MENU.key()
+
+    print(f'{menus} x {submenus} x {dishes} catalogue, {len(values)} sheet rows, {changed:.0%} changed')
+    results: dict[str, Any] = {
+        'catalogue': {'menus': menus, 'submenus': submenus, 'dishes': dishes, 'changed': changed},
+        'parse_sheet': measure('parse_sheet', lambda: sheet_repository.parse_sheet(values), repeat),
+        'diff': measure('diff', run_async(diff), repeat),
+        'full_menu': measure('full_menu', lambda: MenuRepository._create_full_menu_models(catalogue), repeat),
+        'sheet_full_menu': measure(
+            'sheet_full_menu',
+            lambda: SheetRepository._create_full_menu_models(catalogue),
+            repeat
+        ),
+        'cache_encode': measure(
+            'cache_encode',
+            run_async(lambda: cache_service.set_cache(full_menu, cache_key)),
+            repeat
+        ),
+        'cache_decode': measure('cache_decode', run_async(lambda: cache_service.get_cache(cache_key)), repeat),
+    }
+    return results
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--menus', type=int, default=10)
+    parser.add_argument('--submenus', type=int, default=10)
+    parser.add_argument('--dishes', type=int, default=10)
+    parser.add_argument('--changed', type=float, default=0.1, help='доля изменённых блюд в листе')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='файл для сохранения результатов в JSON')
+    args: argparse.Namespace = parser.parse_args()
+
+    report: dict[str, Any] = main(args.menus, args.submenus, args.dishes, args.changed, args.repeat)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
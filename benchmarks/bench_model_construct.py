@@ -0,0 +1,230 @@
+"""
+Бенчмарк построения Pydantic-моделей из строк базы данных.
+
+Для дерева из MENUS × SUBMENUS × DISHES блюд (по умолчанию 100 000) сравнивает три способа:
+    validated    - прежнее создание каждой модели с валидацией (Model(...));
+    constructed  - создание каждой модели без валидации (Model.model_construct(...));
+    adapter      - валидация всего списка одним вызовом заранее собранного TypeAdapter (текущая реализация).
+
+В pydantic 2 model_construct выполняется на Python и медленнее валидации в pydantic-core,
+поэтому репозитории используют TypeAdapter.
+
+Бенчмарки:
+    full_menu        - MenuRepository._create_full_menu_models;
+    sheet_full_menu  - SheetRepository._create_full_menu_models;
+    dish_rows        - DishModel из строк запроса блюд (DishRepository.get_dishes).
+
+Запуск:
+    python -m benchmarks.bench_model_construct
+    python -m benchmarks.bench_model_construct 10 10 100
+"""
+import gc
+import sys
+import time
+from typing import Any, Callable, Iterator
+
+from benchmarks.catalogue import generate_catalogue
+from src.menu.models.dish_model import DishDiscountModel, DishModel
+from src.menu.models.menu_model import Menu, MenuModel
+from src.menu.models.models_for_full_menu import (
+    AllMenuModel,
+    DishInfo,
+    MenuInfo,
+    SubmenuInfo,
+)
+from src.menu.models.submenu_model import SubmenuModel
+from src.menu.repositories.base_repository import validate_rows
+from src.menu.repositories.dish_repository import DISH_LIST_ADAPTER
+from src.menu.repositories.menu_repository import MenuRepository
+from src.menu.repositories.sheet_repository import SheetRepository
+
+MENUS: int = 10
+SUBMENUS: int = 100
+DISHES: int = 100
+REPEAT: int = 5
+
+
+class RowsResult:
+    """Результат запроса из готовых кортежей: то, что validate_rows использует у sqlalchemy.Result."""
+
+    def __init__(self, keys: tuple[str, ...], rows: list[tuple]):
+        self._keys: tuple[str, ...] = keys
+        self._rows: list[tuple] = rows
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self._rows)
+
+
+def full_menu(menus: list[Menu], model: Callable[..., Any]) -> list[AllMenuModel]:
+    """
+    Прежнее построение полного меню по одной модели.
+
+    :param menus: Дерево меню.
+    :param model: Способ создания модели: lambda cls, **values: cls(**values) или cls.model_construct(**values).
+    :return: Список моделей данных AllMenuModel.
+    """
+    return [
+        model(
+            AllMenuModel,
+            menu=model(
+                MenuInfo,
+                id=menu.id,
+                title=menu.title,
+                description=menu.description,
+                submenus=[
+                    model(
+                        SubmenuInfo,
+                        id=submenu.id,
+                        title=submenu.title,
+                        description=submenu.description,
+                        dishes=[
+                            model(
+                                DishInfo,
+                                id=dish.id,
+                                title=dish.title,
+                                description=dish.description,
+                                price=dish.discount_price if dish.discount_price is not None else dish.price
+                            )
+                            for dish in submenu.dishes
+                        ]
+                    )
+                    for submenu in menu.submenus
+                ]
+            )
+        )
+        for menu in menus
+    ]
+
+
+def sheet_full_menu(
+        menus: list[Menu],
+        model: Callable[..., Any]
+) -> tuple[list[MenuModel], list[SubmenuModel], list[Any]]:
+    """
+    Прежнее построение моделей для синхронизации с Google Sheets по одной модели.
+
+    :param menus: Дерево меню.
+    :param model: Способ создания модели.
+    :return: Кортеж, содержащий списки моделей меню, подменю и блюд.
+    """
+    menu_data: list[MenuModel] = []
+    submenu_data: list[SubmenuModel] = []
+    dish_data: list[Any] = []
+    for menu in menus:
+        menu_data.append(model(MenuModel, id=menu.id, title=menu.title, description=menu.description))
+        for submenu in menu.submenus:
+            submenu_data.append(
+                model(SubmenuModel, id=submenu.id, title=submenu.title, description=submenu.description,
+                      menu_id=menu.id)
+            )
+            for dish in submenu.dishes:
+                dish_data.append(
+                    [
+                        model(
+                            DishDiscountModel,
+                            id=dish.id,
+                            title=dish.title,
+                            description=dish.description,
+                            price=dish.price,
+                            submenu_id=submenu.id,
+                            discount=dish.discount_price
+                        ),
+                        menu.id
+                    ]
+                )
+    return menu_data, submenu_data, dish_data
+
+
+def validated(cls: Any, **values: Any) -> Any:
+    return cls(**values)
+
+
+def constructed(cls: Any, **values: Any) -> Any:
+    return cls.model_construct(**values)
+
+
+def run(name: str, variants: dict[str, Callable[[], Any]], objects: int) -> None:
+    """
+    Выполняет все способы построения, проверяет совпадение результатов и печатает пропускную способность.
+
+    Сборщик мусора на время замера отключается, чтобы сравнивать стоимость построения, а не сборки мусора.
+
+    :param name: Название бенчмарка.
+    :param variants: Способы построения по названию.
+    :param objects: Количество строимых объектов (для расчёта пропускной способности).
+    """
+    timings: dict[str, float] = {}
+    reference: Any = None
+    for variant, func in variants.items():
+        best: float = float('inf')
+        for _ in range(REPEAT):
+            result: Any = None
+            gc.collect()
+            gc.disable()
+            start: float = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+            gc.enable()
+        timings[variant] = best
+
+        if reference is None:
+            reference = result
+        assert result == reference, f'{name}: {variant} result differs'
+        del result
+
+    print(f'{name:<16}' + ''.join(
+        f'  {variant} {timing:6.3f} s ({objects / timing:>9,.0f} obj/s)' for variant, timing in timings.items()
+    ) + f'  x{timings["validated"] / timings["adapter"]:.1f}')
+
+
+def main(menus: int, submenus: int, dishes: int) -> None:
+    catalogue: list[Menu] = generate_catalogue(menus, submenus, dishes)
+    objects: int = menus + menus * submenus + menus * submenus * dishes
+    keys: tuple[str, ...] = ('id', 'title', 'description', 'price', 'submenu_id')
+    rows: list[tuple] = [
+        (
+            dish.id,
+            dish.title,
+            dish.description,
+            dish.discount_price if dish.discount_price is not None else dish.price,
+            dish.submenu_id
+        )
+        for menu in catalogue for submenu in menu.submenus for dish in submenu.dishes
+    ]
+    print(f'{menus} x {submenus} x {dishes} catalogue ({len(rows)} dishes)')
+
+    run(
+        'full_menu',
+        {
+            'validated': lambda: full_menu(catalogue, validated),
+            'constructed': lambda: full_menu(catalogue, constructed),
+            'adapter': lambda: MenuRepository._create_full_menu_models(catalogue),
+        },
+        objects
+    )
+    run(
+        'sheet_full_menu',
+        {
+            'validated': lambda: sheet_full_menu(catalogue, validated),
+            'constructed': lambda: sheet_full_menu(catalogue, constructed),
+            'adapter': lambda: SheetRepository._create_full_menu_models(catalogue),
+        },
+        objects
+    )
+    run(
+        'dish_rows',
+        {
+            'validated': lambda: [DishModel(**dict(zip(keys, row))) for row in rows],
+            'constructed': lambda: [DishModel.model_construct(**dict(zip(keys, row))) for row in rows],
+            'adapter': lambda: validate_rows(DISH_LIST_ADAPTER, RowsResult(keys, rows)),  # type: ignore[arg-type]
+        },
+        len(rows)
+    )
+
+
+if __name__ == '__main__':
+    sizes: list[int] = [int(arg) for arg in sys.argv[1:4]] or [MENUS, SUBMENUS, DISHES]
+    main(*sizes)
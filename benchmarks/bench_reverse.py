@@ -0,0 +1,58 @@
+"""
+Бенчмарк построения URL через reverse().
+
+Сравнивает прежнюю реализацию (словарь маршрутов и регулярное выражение на каждый вызов)
+с таблицей маршрутов, разобранной один раз при старте.
+
+Запуск:
+    python -m benchmarks.bench_reverse
+"""
+import re
+import time
+import uuid
+from typing import Callable
+
+from src.main import app
+from src.menu.api.routing import reverse
+
+ITERATIONS: int = 100_000
+
+
+def legacy_reverse(func_name: str, *args) -> str:
+    """Прежняя реализация reverse() из src/menu/tests/utils.py."""
+    routers: dict[str, str] = {item.name: item.path for item in app.routes}
+    route_path: str = routers[func_name]
+    params: list[str] = re.findall(re.compile(r'{([^{}]+)}'), route_path)
+    for param, value in zip(params, map(str, args)):
+        route_path = route_path.replace(f'{{{param}}}', value)
+    return route_path
+
+
+def run(name: str, func: Callable[..., str], ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID]) -> float:
+    """
+    Выполняет ITERATIONS вызовов func и печатает затраченное время.
+
+    :param name: Название реализации.
+    :param func: Реализация reverse().
+    :param ids: Идентификаторы меню, подменю и блюда.
+    :return: Затраченное время в секундах.
+    """
+    start: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func('get_dish', *ids)
+    elapsed: float = time.perf_counter() - start
+    print(f'{name:<12} {ITERATIONS} reversals: {elapsed:.3f} s ({elapsed / ITERATIONS * 1e6:.2f} us/op)')
+    return elapsed
+
+
+def main() -> None:
+    ids: tuple[uuid.UUID, uuid.UUID, uuid.UUID] = (uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+    assert legacy_reverse('get_dish', *ids) == reverse('get_dish', *ids)
+
+    legacy: float = run('legacy', legacy_reverse, ids)
+    compiled: float = run('precompiled', reverse, ids)
+    print(f'speedup: x{legacy / compiled:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Бенчмарк вставки строк с первичным ключом UUIDv4 и UUIDv7.
+
+Для каждой версии создаёт временную таблицу с первичным ключом uuid, вставляет ROWS строк пачками
+по BATCH_SIZE через COPY и печатает время вставки и размер индекса первичного ключа.
+
+Требует запущенный PostgreSQL из .env (DB_HOST, DB_PORT, ...).
+
+Запуск:
+    python -m benchmarks.bench_uuid_insert
+    python -m benchmarks.bench_uuid_insert 100000
+"""
+import asyncio
+import sys
+import time
+import uuid
+from typing import Callable
+
+import asyncpg
+
+from src.config import DB_HOST, DB_NAME, DB_PASS, DB_PORT, DB_USER
+from src.menu.models.base import uuid7
+
+ROWS: int = 1_000_000
+BATCH_SIZE: int = 10_000
+
+
+async def run(connection: asyncpg.Connection, name: str, generator: Callable[[], uuid.UUID], rows: int) -> float:
+    """
+    Вставляет rows строк во временную таблицу и печатает результаты.
+
+    :param connection: Соединение с базой данных.
+    :param name: Название версии UUID.
+    :param generator: Функция генерации идентификатора.
+    :param rows: Количество строк.
+    :return: Затраченное на вставку время в секундах.
+    """
+    table: str = f'bench_uuid_{name}'
+    await connection.execute(f'CREATE TEMPORARY TABLE {table} (id uuid PRIMARY KEY, title text NOT NULL)')
+
+    elapsed: float = 0.0
+    for offset in range(0, rows, BATCH_SIZE):
+        records: list[tuple[uuid.UUID, str]] = [
+            (generator(), f'Dish {number}') for number in range(offset, min(offset + BATCH_SIZE, rows))
+        ]
+        start: float = time.perf_counter()
+        await connection.copy_records_to_table(table, records=records, columns=('id', 'title'))
+        elapsed += time.perf_counter() - start
+
+    index_size: int = await connection.fetchval(f"SELECT pg_relation_size('{table}_pkey')")
+    print(f'{name:<4} {rows} rows: {elapsed:.2f} s ({rows / elapsed:,.0f} rows/s), pkey {index_size / 2 ** 20:.1f} MiB')
+
+    await connection.execute(f'DROP TABLE {table}')
+    return elapsed
+
+
+async def main(rows: int) -> None:
+    connection: asyncpg.Connection = await asyncpg.connect(
+        host=DB_HOST,
+        port=DB_PORT,
+        user=DB_USER,
+        password=DB_PASS,
+        database=DB_NAME
+    )
+    try:
+        v4: float = await run(connection, 'v4', uuid.uuid4, rows)
+        v7: float = await run(connection, 'v7', uuid7, rows)
+        print(f'speedup: x{v4 / v7:.2f}')
+    finally:
+        await connection.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS))
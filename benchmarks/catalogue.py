@@ -0,0 +1,144 @@
+"""
+Генератор синтетического каталога для бенчмарков и нагрузочных сценариев.
+
+Каталог из menus × submenus × dishes строится детерминированно по seed в трёх представлениях:
+дерево ORM-объектов (как после MenuRepository.get_full_menu_tree), строки листа Google Sheets
+(как их разбирает SheetRepository.parse_sheet) и тела пакетных запросов для заполнения через API.
+
+Запуск (печатает размер каталога и первые строки листа):
+    python -m benchmarks.catalogue 10 10 10
+"""
+import random
+import sys
+import uuid
+from decimal import Decimal
+from typing import Any
+
+from src.menu.models.dish_model import Dish
+from src.menu.models.menu_model import Menu
+from src.menu.models.submenu_model import Submenu
+
+SHEET_WIDTH: int = 7
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    """
+    Возвращает воспроизводимый UUID версии 4.
+
+    :param rng: Генератор случайных чисел.
+    :return: UUID.
+    """
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_catalogue(menus: int, submenus: int, dishes: int, seed: int = 0) -> list[Menu]:
+    """
+    Строит дерево меню, подменю и блюд.
+
+    Названия уникальны в пределах каталога (в базе на них стоит ограничение unique), у каждого
+    третьего блюда есть цена со скидкой.
+
+    :param menus: Количество меню.
+    :param submenus: Количество подменю в каждом меню.
+    :param dishes: Количество блюд в каждом подменю.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список ORM-объектов Menu с заполненными submenus и dishes.
+    """
+    rng: random.Random = random.Random(seed)
+    catalogue: list[Menu] = []
+
+    for menu_number in range(menus):
+        menu: Menu = Menu(
+            id=_uuid(rng),
+            title=f'Menu {menu_number}',
+            description=f'Menu {menu_number} description'
+        )
+        for submenu_number in range(submenus):
+            submenu: Submenu = Submenu(
+                id=_uuid(rng),
+                title=f'Submenu {menu_number}.{submenu_number}',
+                description=f'Submenu {menu_number}.{submenu_number} description',
+                menu_id=menu.id
+            )
+            for dish_number in range(dishes):
+                price: Decimal = Decimal(rng.randint(100, 100_000)) / 100
+                submenu.dishes.append(
+                    Dish(
+                        id=_uuid(rng),
+                        title=f'Dish {menu_number}.{submenu_number}.{dish_number}',
+                        description=f'Dish {menu_number}.{submenu_number}.{dish_number} description',
+                        price=price,
+                        discount_price=round(price * Decimal('0.9'), 2) if dish_number % 3 == 0 else None,
+                        submenu_id=submenu.id
+                    )
+                )
+            menu.submenus.append(submenu)
+        catalogue.append(menu)
+
+    return catalogue
+
+
+def sheet_rows(catalogue: list[Menu], changed: float = 0.0, seed: int = 0) -> list[list[str]]:
+    """
+    Строит строки листа Google Sheets для каталога.
+
+    :param catalogue: Дерево меню из generate_catalogue.
+    :param changed: Доля блюд, у которых в листе изменено описание (для бенчмарка сравнения).
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список строк листа по SHEET_WIDTH ячеек.
+    """
+    rng: random.Random = random.Random(seed)
+    rows: list[list[str]] = []
+
+    for menu in catalogue:
+        rows.append([str(menu.id), menu.title, menu.description, '', '', '', ''])
+        for submenu in menu.submenus:
+            rows.append(['', str(submenu.id), submenu.title, submenu.description, '', '', ''])
+            for dish in submenu.dishes:
+                description: str = dish.description
+                if changed and rng.random() < changed:
+                    description += ' (changed)'
+                discount: str = '10' if dish.discount_price is not None else ''
+                rows.append(['', '', str(dish.id), dish.title, description, str(dish.price), discount])
+
+    return rows
+
+
+def bulk_payloads(catalogue: list[Menu]) -> tuple[dict[str, Any], dict[str, dict], dict[tuple[str, str], dict]]:
+    """
+    Строит тела пакетных запросов для заполнения каталога через API.
+
+    :param catalogue: Дерево меню из generate_catalogue.
+    :return: Тело для /menus/bulk, тела для подменю по menu_id и тела для блюд по (menu_id, submenu_id).
+    """
+    menus: dict[str, Any] = {'create': []}
+    submenus: dict[str, dict] = {}
+    dishes: dict[tuple[str, str], dict] = {}
+
+    for menu in catalogue:
+        menu_id: str = str(menu.id)
+        menus['create'].append({'id': menu_id, 'title': menu.title, 'description': menu.description})
+        submenus[menu_id] = {'create': []}
+        for submenu in menu.submenus:
+            submenu_id: str = str(submenu.id)
+            submenus[menu_id]['create'].append(
+                {'id': submenu_id, 'title': submenu.title, 'description': submenu.description}
+            )
+            dishes[(menu_id, submenu_id)] = {
+                'create': [
+                    {'id': str(dish.id), 'title': dish.title, 'description': dish.description, 'price': str(dish.price)}
+                    for dish in submenu.dishes
+                ]
+            }
+
+    return menus, submenus, dishes
+
+
+if __name__ == '__main__':
+    sizes: list[int] = [int(arg) for arg in sys.argv[1:4]] or [10, 10, 10]
+    tree: list[Menu] = generate_catalogue(*sizes)
+    rows: list[list[str]] = sheet_rows(tree)
+    print(f'{len(tree)} menus, {sum(len(menu.submenus) for menu in tree)} submenus, '
+          f'{sum(len(submenu.dishes) for menu in tree for submenu in menu.submenus)} dishes, {len(rows)} sheet rows')
+    for row in rows[:5]:
+        print(row)
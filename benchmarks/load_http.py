@@ -0,0 +1,235 @@
+"""
+Нагрузочный сценарий HTTP API.
+
+Заполняет запущенное приложение синтетическим каталогом через пакетные ручки, затем в течение
+duration секунд concurrency клиентов выполняют смесь GET-запросов по его меню, подменю и блюдам.
+Печатает RPS и задержки p50/p95/p99 по каждой ручке и в целом, сохраняет результат в JSON и, если
+передан --compare, сравнивает его с предыдущим прогоном. В конце каталог удаляется.
+
+Требует запущенное приложение с PostgreSQL и Redis (docker compose up).
+
+Запуск:
+    python -m benchmarks.load_http
+    python -m benchmarks.load_http --concurrency 64 --duration 60 --output benchmarks/results/after.json \\
+        --compare benchmarks/results/before.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.catalogue import bulk_payloads, generate_catalogue
+from src.main import (  # noqa: F401 - таблица маршрутов строится при импорте приложения
+    app,
+)
+from src.menu.api.routing import reverse
+from src.menu.models.menu_model import Menu
+
+SCENARIO: dict[str, int] = {
+    'get_menus': 2,
+    'get_menu': 2,
+    'get_submenus': 2,
+    'get_submenu': 2,
+    'get_dishes': 4,
+    'get_dish': 6,
+    'get_full_menu': 1,
+}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Возвращает перцентиль отсортированного списка (ближайший ранг).
+
+    :param values: Отсортированные значения.
+    :param q: Перцентиль от 0 до 100.
+    :return: Значение перцентиля или 0, если значений нет.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict[str, float]:
+    """
+    Сводит задержки запросов в RPS и перцентили.
+
+    :param latencies: Задержки успешных запросов в секундах.
+    :param errors: Количество ошибок.
+    :param duration: Длительность прогона в секундах.
+    :return: Сводка с задержками в миллисекундах.
+    """
+    values: list[float] = sorted(latency * 1000 for latency in latencies)
+    return {
+        'requests': len(values),
+        'errors': errors,
+        'rps': len(values) / duration,
+        'p50_ms': percentile(values, 50),
+        'p95_ms': percentile(values, 95),
+        'p99_ms': percentile(values, 99),
+    }
+
+
+def pick_url(catalogue: list[Menu], route: str, rng: random.Random) -> str:
+    """
+    Выбирает случайную сущность каталога и строит URL ручки.
+
+    :param catalogue: Дерево меню.
+    :param route: Имя ручки.
+    :param rng: Генератор случайных чисел.
+    :return: URL запроса.
+    """
+    menu: Menu = rng.choice(catalogue)
+    submenu: Any = rng.choice(menu.submenus)
+    dish: Any = rng.choice(submenu.dishes)
+    args: dict[str, tuple] = {
+        'get_menus': (),
+        'get_full_menu': (),
+        'get_menu': (menu.id,),
+        'get_submenus': (menu.id,),
+        'get_submenu': (menu.id, submenu.id),
+        'get_dishes': (menu.id, submenu.id),
+        'get_dish': (menu.id, submenu.id, dish.id),
+    }
+    return reverse(route, *args[route])
+
+
+async def seed(client: httpx.AsyncClient, catalogue: list[Menu]) -> None:
+    """
+    Создаёт каталог через пакетные ручки.
+
+    :param client: HTTP-клиент.
+    :param catalogue: Дерево меню.
+    """
+    menus, submenus, dishes = bulk_payloads(catalogue)
+    (await client.post(reverse('bulk_menus'), json=menus)).raise_for_status()
+    for menu_id, payload in submenus.items():
+        (await client.post(reverse('bulk_submenus', menu_id), json=payload)).raise_for_status()
+    for (menu_id, submenu_id), payload in dishes.items():
+        (await client.post(reverse('bulk_dishes', menu_id, submenu_id), json=payload)).raise_for_status()
+
+
+async def worker(
+        client: httpx.AsyncClient,
+        catalogue: list[Menu],
+        deadline: float,
+        latencies: dict[str, list[float]],
+        errors: dict[str, int],
+        seed_value: int
+) -> None:
+    """
+    Выполняет запросы сценария до наступления deadline.
+
+    :param client: HTTP-клиент.
+    :param catalogue: Дерево меню.
+    :param deadline: Время окончания (time.perf_counter()).
+    :param latencies: Задержки по ручкам, дополняются на месте.
+    :param errors: Количество ошибок по ручкам, дополняется на месте.
+    :param seed_value: Начальное значение генератора случайных чисел клиента.
+    """
+    rng: random.Random = random.Random(seed_value)
+    routes: list[str] = list(SCENARIO)
+    weights: list[int] = list(SCENARIO.values())
+
+    while time.perf_counter() < deadline:
+        route: str = rng.choices(routes, weights)[0]
+        url: str = pick_url(catalogue, route, rng)
+        start: float = time.perf_counter()
+        try:
+            response: httpx.Response = await client.get(url)
+        except httpx.HTTPError:
+            errors[route] += 1
+            continue
+        if response.status_code == 200:
+            latencies[route].append(time.perf_counter() - start)
+        else:
+            errors[route] += 1
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> None:
+    """
+    Печатает изменение RPS и перцентилей относительно предыдущего прогона.
+
+    :param current: Текущий отчёт.
+    :param previous: Предыдущий отчёт.
+    """
+    print(f'\ncompared with {previous["started"]}:')
+    for route, summary in current['routes'].items():
+        before: dict[str, float] | None = previous['routes'].get(route)
+        if not before:
+            continue
+        changes: list[str] = []
+        for metric in ('rps', 'p50_ms', 'p95_ms', 'p99_ms'):
+            if before[metric]:
+                changes.append(f'{metric} {(summary[metric] / before[metric] - 1) * 100:+.1f}%')
+        print(f'{route:<14} ' + '  '.join(changes))
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    catalogue: list[Menu] = generate_catalogue(args.menus, args.submenus, args.dishes, seed=args.seed)
+    limits: httpx.Limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        await seed(client, catalogue)
+        try:
+            latencies: dict[str, list[float]] = {route: [] for route in SCENARIO}
+            errors: dict[str, int] = {route: 0 for route in SCENARIO}
+            started: float = time.perf_counter()
+            deadline: float = started + args.duration
+            await asyncio.gather(*(
+                worker(client, catalogue, deadline, latencies, errors, args.seed + number)
+                for number in range(args.concurrency)
+            ))
+            duration: float = time.perf_counter() - started
+        finally:
+            await client.post(reverse('bulk_menus'), json={'delete': [str(menu.id) for menu in catalogue]})
+
+    report: dict[str, Any] = {
+        'started': datetime.now(timezone.utc).isoformat(),
+        'base_url': args.base_url,
+        'catalogue': {'menus': args.menus, 'submenus': args.submenus, 'dishes': args.dishes},
+        'concurrency': args.concurrency,
+        'duration': duration,
+        'routes': {route: summarize(latencies[route], errors[route], duration) for route in SCENARIO},
+        'total': summarize(
+            [latency for values in latencies.values() for latency in values],
+            sum(errors.values()),
+            duration
+        ),
+    }
+
+    print(f'{"route":<14} {"requests":>9} {"errors":>7} {"rps":>9} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}')
+    for route, summary in [*report['routes'].items(), ('total', report['total'])]:
+        print(
+            f'{route:<14} {summary["requests"]:>9} {summary["errors"]:>7} {summary["rps"]:>9.1f} '
+            f'{summary["p50_ms"]:>8.2f} {summary["p95_ms"]:>8.2f} {summary["p99_ms"]:>8.2f}'
+        )
+    return report
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--menus', type=int, default=5)
+    parser.add_argument('--submenus', type=int, default=5)
+    parser.add_argument('--dishes', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='файл для сохранения результатов в JSON')
+    parser.add_argument('--compare', help='JSON предыдущего прогона для сравнения')
+    arguments: argparse.Namespace = parser.parse_args()
+
+    result: dict[str, Any] = asyncio.run(main(arguments))
+    if arguments.compare:
+        with open(arguments.compare) as previous_file:
+            compare(result, json.load(previous_file))
+    if arguments.output:
+        Path(arguments.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(arguments.output, 'w') as output_file:
+            json.dump(result, output_file, indent=2)
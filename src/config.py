@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,15 +11,60 @@ DB_PORT: str | None = os.environ.get('DB_PORT')
 DB_NAME: str | None = os.environ.get('DB_NAME')
 DB_USER: str | None = os.environ.get('DB_USER')
 DB_PASS: str | None = os.environ.get('DB_PASS')
+DB_REPLICA_URLS: list[str] = [url for url in os.environ.get('DB_REPLICA_URLS', '').split(',') if url]
+DB_REPLICA_MAX_LAG: float = float(os.environ.get('DB_REPLICA_MAX_LAG', '1.0'))
+DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.environ.get('DB_REPLICA_LAG_CHECK_INTERVAL', '1.0'))
+DB_REPLICA_LAG_CHECK_TIMEOUT: float = float(os.environ.get('DB_REPLICA_LAG_CHECK_TIMEOUT', '0.5'))
 
 REDIS_PORT: str | int | None = os.environ.get('REDIS_PORT')
 REDIS_HOST: str | None = os.environ.get('REDIS_HOST')
 
+CACHE_NAMESPACE: str = os.environ.get('CACHE_NAMESPACE', 'menu')
+CACHE_SCHEMA_VERSION: str = os.environ.get('CACHE_SCHEMA_VERSION', '3')
+CACHE_STALE_WHILE_REVALIDATE: bool = os.environ.get('CACHE_STALE_WHILE_REVALIDATE', '0') == '1'
+CACHE_WARMING: bool = os.environ.get('CACHE_WARMING', '1') == '1'
+CACHE_WARM_DEBOUNCE: float = float(os.environ.get('CACHE_WARM_DEBOUNCE', '0.5'))
+CACHE_INVALIDATION: str = os.environ.get('CACHE_INVALIDATION', 'notify')
+CACHE_INVALIDATION_LISTENER: bool = os.environ.get('CACHE_INVALIDATION_LISTENER', '1') == '1'
+CACHE_INVALIDATION_BATCH_INTERVAL: float = float(os.environ.get('CACHE_INVALIDATION_BATCH_INTERVAL', '0.05'))
+
+CHANGE_FEED_MAX_PENDING: int = int(os.environ.get('CHANGE_FEED_MAX_PENDING', '32'))
+CHANGE_FEED_HEARTBEAT: float = float(os.environ.get('CHANGE_FEED_HEARTBEAT', '15'))
+SEARCH_CACHE_TTL: int = int(os.environ.get('SEARCH_CACHE_TTL', '30'))
+
+CHANGE_LOG_RETENTION: timedelta = timedelta(hours=float(os.environ.get('CHANGE_LOG_RETENTION_HOURS', '168')))
+
 RABBITMQ_HOST: str | None = os.environ.get('RABBITMQ_HOST')
 RABBITMQ_USERNAME: str | None = os.environ.get('RABBITMQ_USERNAME')
 RABBITMQ_PASSWORD: str | None = os.environ.get('RABBITMQ_PASSWORD')
 RABBITMQ_PORT: str | None = os.environ.get('RABBITMQ_PORT')
 
-SPREADSHEET_URL: str | None = os.environ.get('SPREADSHEET_URL')
+# Таблицы Google Sheets через запятую; SPREADSHEET_URL - одна таблица, как раньше.
+SPREADSHEET_URLS: list[str] = [
+    url.strip() for url in os.environ.get('SPREADSHEET_URLS', os.environ.get('SPREADSHEET_URL', '')).split(',')
+    if url.strip()
+]
+SHEET_SYNC_CONCURRENCY: int = int(os.environ.get('SHEET_SYNC_CONCURRENCY', '4'))
+SHEET_SYNC_LOCK_TIMEOUT: int = int(os.environ.get('SHEET_SYNC_LOCK_TIMEOUT', '600'))
+SHEET_SYNC_CHUNK_SIZE: int = int(os.environ.get('SHEET_SYNC_CHUNK_SIZE', '1000'))
+SHEET_SYNC_MIN_INTERVAL: float = float(os.environ.get('SHEET_SYNC_MIN_INTERVAL', '5'))
+SHEET_SYNC_MAX_INTERVAL: float = float(os.environ.get('SHEET_SYNC_MAX_INTERVAL', '300'))
+SHEET_SYNC_BACKOFF_FACTOR: float = float(os.environ.get('SHEET_SYNC_BACKOFF_FACTOR', '2'))
+# Часы без правок, например 23-7: в это время таблицы проверяются раз в SHEET_SYNC_MAX_INTERVAL секунд.
+SHEET_SYNC_QUIET_HOURS: tuple[int, ...] | None = tuple(
+    int(hour) for hour in os.environ['SHEET_SYNC_QUIET_HOURS'].split('-')
+) if os.environ.get('SHEET_SYNC_QUIET_HOURS') else None
+SHEET_SYNC_TIMEZONE: str = os.environ.get('SHEET_SYNC_TIMEZONE', 'Europe/Minsk')
+SHEET_FETCH_TIMEOUT: float = float(os.environ.get('SHEET_FETCH_TIMEOUT', '10'))
+SHEET_FETCH_RETRIES: int = int(os.environ.get('SHEET_FETCH_RETRIES', '3'))
+SHEET_FETCH_BACKOFF: float = float(os.environ.get('SHEET_FETCH_BACKOFF', '1'))
+SHEET_FETCH_BACKOFF_MAX: float = float(os.environ.get('SHEET_FETCH_BACKOFF_MAX', '30'))
+
+METRICS_WORKER_PORT: int = int(os.environ.get('METRICS_WORKER_PORT', '9100'))
+
+TRACING_ENABLED: bool = os.environ.get('TRACING_ENABLED', '0') == '1'
+TRACING_SQL_BUDGET: int = int(os.environ.get('TRACING_SQL_BUDGET', '5'))
+TRACING_REDIS_BUDGET: int = int(os.environ.get('TRACING_REDIS_BUDGET', '10'))
+TRACING_N_PLUS_ONE_THRESHOLD: int = int(os.environ.get('TRACING_N_PLUS_ONE_THRESHOLD', '3'))
 
 BASE_DIR: Path = Path(__file__).parent.parent
@@ -1,18 +1,28 @@
-from typing import AsyncGenerator
+import asyncio
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Iterator
 
 from aioredis import Redis, from_url
+from sqlalchemy import Engine, Select, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from src.config import (
     DB_HOST,
     DB_NAME,
     DB_PASS,
     DB_PORT,
+    DB_REPLICA_LAG_CHECK_INTERVAL,
+    DB_REPLICA_LAG_CHECK_TIMEOUT,
+    DB_REPLICA_MAX_LAG,
+    DB_REPLICA_URLS,
     DB_USER,
     RABBITMQ_HOST,
     RABBITMQ_PASSWORD,
@@ -21,14 +31,138 @@ from src.config import (
     REDIS_HOST,
     REDIS_PORT,
 )
+from src.metrics import InstrumentedConnection, instrument_engines
 
 DATABASE_URL: str = f'postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
 REDIS_URL: str = f'redis://{REDIS_HOST}:{REDIS_PORT}'
 RABBITMQ_URL: str = f'amqp://{RABBITMQ_USERNAME}:{RABBITMQ_PASSWORD}@{RABBITMQ_HOST}:{RABBITMQ_PORT}'
 
+REPLICA_LAG_QUERY: str = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+USE_PRIMARY: str = 'use_primary'
+USE_REPLICA: str = 'use_replica'
+REPLICA_ENGINE: str = 'replica_engine'
+# Чтения, результат которых сохраняется в кэш, идут в основную базу: иначе данные отстающей реплики
+# попали бы в кэш под поколением, уже увеличенным после записи, и хранились бы до конца TTL.
+primary_reads: ContextVar[bool] = ContextVar('primary_reads', default=False)
+
 engine: AsyncEngine = create_async_engine(DATABASE_URL)
+
+
+class ReplicaPool:
+    """
+    Пул реплик для чтения.
+
+    Реплика выбирается по кругу среди тех, чьё отставание от основной базы не превышает
+    DB_REPLICA_MAX_LAG. Если недавно (в пределах того же окна) в этом процессе была запись,
+    чтение идёт в основную базу, чтобы клиент видел собственные изменения.
+    """
+
+    def __init__(self, urls: list[str]):
+        self.engines: list[AsyncEngine] = [create_async_engine(url) for url in urls]
+        self._lag: dict[AsyncEngine, float] = {}
+        self._checked_at: float = float('-inf')
+        self._last_write_at: float = float('-inf')
+        self._cycle: Iterator[AsyncEngine] = itertools.cycle(self.engines)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def mark_write(self) -> None:
+        """
+        Запомнить время записи в основную базу.
+        """
+        self._last_write_at = time.monotonic()
+
+    async def check_lag(self) -> None:
+        """
+        Обновить отставание реплик, если с прошлой проверки прошло больше DB_REPLICA_LAG_CHECK_INTERVAL.
+
+        Реплики опрашиваются параллельно, каждая не дольше DB_REPLICA_LAG_CHECK_TIMEOUT секунд, поэтому
+        зависшая реплика не задерживает запрос, на который пришлась проверка. Недоступная или не ответившая
+        вовремя реплика считается бесконечно отстающей.
+        """
+        now: float = time.monotonic()
+        if now - self._checked_at < DB_REPLICA_LAG_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+
+        await asyncio.gather(*(self._check_replica_lag(replica) for replica in self.engines))
+
+    async def _check_replica_lag(self, replica: AsyncEngine) -> None:
+        try:
+            self._lag[replica] = await asyncio.wait_for(self._get_replica_lag(replica), DB_REPLICA_LAG_CHECK_TIMEOUT)
+        except Exception as e:
+            print('Replica lag check error: ', repr(e))
+            self._lag[replica] = float('inf')
+
+    @staticmethod
+    async def _get_replica_lag(replica: AsyncEngine) -> float:
+        async with replica.connect() as connection:
+            return float(await connection.scalar(text(REPLICA_LAG_QUERY)))
+
+    def choose(self) -> AsyncEngine | None:
+        """
+        Выбрать реплику для чтения.
+
+        :return: Движок реплики или None, если читать нужно из основной базы.
+        """
+        if time.monotonic() - self._last_write_at < DB_REPLICA_MAX_LAG:
+            return None
+        for _ in range(len(self.engines)):
+            replica: AsyncEngine = next(self._cycle)
+            if self._lag.get(replica, float('inf')) <= DB_REPLICA_MAX_LAG:
+                return replica
+        return None
+
+
+replica_pool: ReplicaPool = ReplicaPool(DB_REPLICA_URLS)
+instrument_engines([engine, *replica_pool.engines])
+
+
+class RoutingSession(Session):
+    """
+    Сессия, направляющая SELECT из методов только для чтения на реплику, а остальные запросы - в основную базу.
+
+    Реплика выбирается при первом чтении и закрепляется за сессией: запросы одного чтения (например,
+    дополнительные SELECT из selectinload) не попадают на реплики с разным отставанием.
+    После первой записи сессия до конца работает с основной базой (read-your-writes).
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if not replica_pool or self.info.get(USE_PRIMARY):
+            return engine.sync_engine
+
+        if not isinstance(clause, Select):
+            self.info[USE_PRIMARY] = True
+            replica_pool.mark_write()
+            return engine.sync_engine
+
+        if not self.info.get(USE_REPLICA):
+            return engine.sync_engine
+        if REPLICA_ENGINE not in self.info:
+            self.info[REPLICA_ENGINE] = replica_pool.choose()
+        replica: AsyncEngine | None = self.info[REPLICA_ENGINE]
+        return (replica or engine).sync_engine
+
+
+@event.listens_for(RoutingSession, 'before_flush')
+def route_flush_to_primary(session: Session, flush_context: Any, instances: Any) -> None:
+    """
+    Направляет сессию в основную базу перед записью изменений ORM, включая SELECT, выполняемые при flush.
+    """
+    if replica_pool:
+        session.info[USE_PRIMARY] = True
+        replica_pool.mark_write()
+
+
 async_session_maker = async_sessionmaker(
     bind=engine,
+    sync_session_class=RoutingSession,
     autoflush=False,
     autocommit=False,
     expire_on_commit=False
@@ -47,5 +181,5 @@ async def get_async_session_() -> AsyncSession:
 
 
 async def get_redis() -> Redis:
-    async with await from_url(REDIS_URL) as redis:
+    async with await from_url(REDIS_URL, connection_class=InstrumentedConnection) as redis:
         yield redis
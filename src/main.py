@@ -1,25 +1,57 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from aioredis import from_url
 from fastapi import FastAPI
 
+from src.config import CACHE_INVALIDATION, CACHE_INVALIDATION_LISTENER, TRACING_ENABLED
 from src.database import REDIS_URL
+from src.menu.api.changes_api import router as router_changes
 from src.menu.api.dish_api import router as router_dish
 from src.menu.api.menu_api import router as router_menu
+from src.menu.api.metrics_api import router as router_metrics
+from src.menu.api.routing import route_table
+from src.menu.api.search_api import router as router_search
 from src.menu.api.submenu_api import router as router_submenu
+from src.menu.api.sync_api import router as router_sync
+from src.menu.services.cache_warmer import CacheWarmer
+from src.menu.services.invalidation_listener import InvalidationListener
+from src.metrics import InstrumentedConnection, MetricsMiddleware
+from src.tracing import TracingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
-    async with await from_url(REDIS_URL) as redis:
-        await redis.flushdb(asynchronous=True)
+    async with await from_url(REDIS_URL, connection_class=InstrumentedConnection) as redis:
+        try:
+            await CacheWarmer(redis).warm()
+        except Exception as e:
+            print('Cache warming error: ', e)
 
-    yield
+        listener: asyncio.Task | None = None
+        if CACHE_INVALIDATION == 'notify' and CACHE_INVALIDATION_LISTENER:
+            listener = asyncio.create_task(InvalidationListener(redis).run())
+
+        yield
+
+        if listener is not None:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
 
 
 app: FastAPI = FastAPI(lifespan=lifespan)
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(router_menu)
 app.include_router(router_submenu)
 app.include_router(router_dish)
+app.include_router(router_changes)
+app.include_router(router_search)
+app.include_router(router_sync)
+app.include_router(router_metrics)
+
+route_table.build(app.routes)
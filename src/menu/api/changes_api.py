@@ -0,0 +1,65 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from src.menu.api.dependencies import get_change_log_service
+from src.menu.models.change_log_model import ChangesModel
+from src.menu.services.change_feed import change_hub
+from src.menu.services.change_log_service import ChangeLogService
+
+router = APIRouter(
+    prefix='/api/v1',
+    tags=['Changes']
+)
+
+SSE_HEADERS: dict[str, str] = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no'
+}
+
+
+@router.get(
+    '/changes',
+    response_model=ChangesModel
+)
+async def get_changes(
+        since: int | None = None,
+        change_log_service: ChangeLogService = Depends(get_change_log_service)
+) -> ChangesModel:
+    """
+    Получить изменения каталога с указанной версии.
+
+    Клиент передаёт version из предыдущего ответа. Если since не передан или записи журнала
+    с этой версии уже удалены, ответ содержит resync=True: клиенту нужно загрузить каталог
+    целиком (например, через /menus/full) и продолжить с полученной версии.
+
+    :param since: Версия из предыдущего ответа.
+    :param change_log_service: Сервис для работы с журналом изменений (внедрение зависимости).
+    :return: Модель изменений.
+    """
+    return await change_log_service.get_changes(since)
+
+
+@router.get('/changes/stream')
+async def get_changes_stream() -> StreamingResponse:
+    """
+    Подписаться на изменения всех меню (Server-Sent Events).
+
+    События: refetch - перезапросить данные целиком (при подключении, после обрыва и если клиент
+    не успевает читать события), change - список изменённых пар [menu_id, submenu_id].
+
+    :return: Поток событий.
+    """
+    return StreamingResponse(change_hub.events(), media_type='text/event-stream', headers=SSE_HEADERS)
+
+
+@router.get('/menus/{menu_id}/changes/stream')
+async def get_menu_changes_stream(menu_id: UUID) -> StreamingResponse:
+    """
+    Подписаться на изменения одного меню (Server-Sent Events).
+
+    :param menu_id: Идентификатор меню.
+    :return: Поток событий.
+    """
+    return StreamingResponse(change_hub.events(menu_id), media_type='text/event-stream', headers=SSE_HEADERS)
@@ -3,11 +3,16 @@ from fastapi import BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_async_session, get_redis
+from src.menu.repositories.change_log_repository import ChangeLogRepository
 from src.menu.repositories.dish_repository import DishRepository
 from src.menu.repositories.menu_repository import MenuRepository
+from src.menu.repositories.search_repository import SearchRepository
 from src.menu.repositories.submenu_repository import SubmenuRepository
+from src.menu.services.cache_warmer import CacheWarmer
+from src.menu.services.change_log_service import ChangeLogService
 from src.menu.services.dish_service import DishService
 from src.menu.services.menu_service import MenuService
+from src.menu.services.search_service import SearchService
 from src.menu.services.submenu_service import SubmenuService
 
 
@@ -25,7 +30,7 @@ async def get_menu_service(
     :return: Экземпляр сервиса для работы с меню.
     """
     menu_repository: MenuRepository = MenuRepository(session)
-    return MenuService(menu_repository, redis, background_tasks)
+    return MenuService(menu_repository, redis, background_tasks, CacheWarmer(redis))
 
 
 async def get_submenu_service(
@@ -42,7 +47,7 @@ async def get_submenu_service(
     :return: Экземпляр сервиса для работы с подменю.
     """
     submenu_repository: SubmenuRepository = SubmenuRepository(session)
-    return SubmenuService(submenu_repository, redis, background_tasks)
+    return SubmenuService(submenu_repository, redis, background_tasks, CacheWarmer(redis))
 
 
 async def get_dish_service(
@@ -59,4 +64,28 @@ async def get_dish_service(
     :return: Экземпляр сервиса для работы с блюдами.
     """
     dish_repository: DishRepository = DishRepository(session)
-    return DishService(dish_repository, redis, background_tasks)
+    return DishService(dish_repository, redis, background_tasks, CacheWarmer(redis))
+
+
+async def get_change_log_service(session: AsyncSession = Depends(get_async_session)) -> ChangeLogService:
+    """
+    Получение сервиса для работы с журналом изменений.
+
+    :param session: Асинхронная сессия базы данных.
+    :return: Экземпляр сервиса для работы с журналом изменений.
+    """
+    return ChangeLogService(ChangeLogRepository(session))
+
+
+async def get_search_service(
+        session: AsyncSession = Depends(get_async_session),
+        redis: Redis = Depends(get_redis)
+) -> SearchService:
+    """
+    Получение сервиса для поиска.
+
+    :param session: Асинхронная сессия базы данных.
+    :param redis: Объект Redis.
+    :return: Экземпляр сервиса для поиска.
+    """
+    return SearchService(SearchRepository(session), redis)
@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, status
 
 from src.menu.api.dependencies import get_dish_service
+from src.menu.models.bulk_model import BulkResult
 from src.menu.models.dish_model import DishModel
-from src.menu.schemas.dish_schema import DishCreate, DishUpdate
+from src.menu.schemas.dish_schema import DishBulk, DishCreate, DishUpdate
 from src.menu.services.dish_service import DishService
 
 router = APIRouter(
@@ -37,7 +38,6 @@ async def get_dishes(
     response_model=DishModel
 )
 async def get_dish(
-        request: Request,
         menu_id: UUID,
         submenu_id: UUID,
         dish_id: UUID,
@@ -46,12 +46,13 @@ async def get_dish(
     """
     Получить информацию о конкретном блюде по его идентификатору.
 
-    :param request: Объект запроса.
+    :param menu_id: Идентификатор меню.
+    :param submenu_id: Идентификатор подменю.
     :param dish_id: Идентификатор блюда.
     :param dish_service: Сервис для работы с блюдами (внедрение зависимости).
     :return: Модель блюда.
     """
-    return await dish_service.get_dish(request.url.path, dish_id)
+    return await dish_service.get_dish(menu_id, submenu_id, dish_id)
 
 
 @router.post(
@@ -121,3 +122,25 @@ async def delete_dish(
     :return: Модель удаленного блюда.
     """
     return await dish_service.delete_dish(menu_id, submenu_id, dish_id)
+
+
+@router.post(
+    '/menus/{menu_id}/submenus/{submenu_id}/dishes/bulk',
+    response_model=BulkResult
+)
+async def bulk_dishes(
+        menu_id: UUID,
+        submenu_id: UUID,
+        dish_bulk: DishBulk,
+        dish_service: DishService = Depends(get_dish_service)
+) -> BulkResult:
+    """
+    Пакетно создать, обновить и удалить блюда подменю в одной транзакции.
+
+    :param menu_id: Идентификатор меню.
+    :param submenu_id: Идентификатор подменю.
+    :param dish_bulk: Списки блюд для создания, обновления и удаления.
+    :param dish_service: Сервис для работы с блюдами (внедрение зависимости).
+    :return: Результаты по каждому элементу запроса.
+    """
+    return await dish_service.bulk_dishes(menu_id, submenu_id, dish_bulk)
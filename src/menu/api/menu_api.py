@@ -1,11 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, status
 
 from src.menu.api.dependencies import get_menu_service
+from src.menu.models.bulk_model import BulkResult
 from src.menu.models.menu_model import MenuDetailModel, MenuModel
 from src.menu.models.models_for_full_menu import AllMenuModel
-from src.menu.schemas.menu_schema import MenuCreate, MenuUpdate
+from src.menu.schemas.menu_schema import MenuBulk, MenuCreate, MenuUpdate
 from src.menu.services.menu_service import MenuService
 
 router = APIRouter(
@@ -70,19 +71,17 @@ async def create_menu(
     response_model=MenuDetailModel
 )
 async def get_menu(
-        request: Request,
         menu_id: UUID,
         menu_service: MenuService = Depends(get_menu_service)
 ) -> MenuDetailModel:
     """
     Получить детали конкретного меню по его идентификатору.
 
-    :param request: Объект запроса.
     :param menu_id: Идентификатор меню.
     :param menu_service: Сервис для работы с меню (внедрение зависимости).
     :return: Модель деталей меню.
     """
-    return await menu_service.get_menu(request.url.path, menu_id)
+    return await menu_service.get_menu(menu_id)
 
 
 @router.patch(
@@ -90,7 +89,6 @@ async def get_menu(
     response_model=MenuModel
 )
 async def update_menu(
-        request: Request,
         menu_id: UUID,
         menu_update: MenuUpdate,
         menu_service: MenuService = Depends(get_menu_service)
@@ -98,13 +96,12 @@ async def update_menu(
     """
     Обновить информацию о меню.
 
-    :param request: Объект запроса.
     :param menu_id: Идентификатор меню, которое нужно обновить.
     :param menu_update: Схема данных для обновления информации о меню.
     :param menu_service: Сервис для работы с меню (внедрение зависимости).
     :return: Модель обновленного меню.
     """
-    return await menu_service.update_menu(request.url.path, menu_id, menu_update)
+    return await menu_service.update_menu(menu_id, menu_update)
 
 
 @router.delete(
@@ -123,3 +120,21 @@ async def delete_menu(
     :return: Модель удаленного меню.
     """
     return await menu_service.delete_menu(menu_id)
+
+
+@router.post(
+    '/menus/bulk',
+    response_model=BulkResult
+)
+async def bulk_menus(
+        menu_bulk: MenuBulk,
+        menu_service: MenuService = Depends(get_menu_service)
+) -> BulkResult:
+    """
+    Пакетно создать, обновить и удалить меню в одной транзакции.
+
+    :param menu_bulk: Списки меню для создания, обновления и удаления.
+    :param menu_service: Сервис для работы с меню (внедрение зависимости).
+    :return: Результаты по каждому элементу запроса.
+    """
+    return await menu_service.bulk_menus(menu_bulk)
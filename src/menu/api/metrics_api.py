@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Отдать метрики в формате Prometheus.
+
+    :return: Текстовое представление всех метрик процесса.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,76 @@
+import re
+from typing import Iterable
+
+from starlette.routing import BaseRoute
+
+PATH_PARAM_PATTERN: re.Pattern = re.compile(r'{([^{}:]+)(?::[^{}]+)?}')
+
+
+class RouteTemplate:
+    """Предварительно разобранный путь маршрута."""
+    __slots__ = ('path', 'params', 'template')
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self.params: tuple[str, ...] = tuple(PATH_PARAM_PATTERN.findall(path))
+        self.template: str = PATH_PARAM_PATTERN.sub('{}', path)
+
+    def format(self, *args) -> str:
+        """
+        Подставляет значения параметров в путь.
+
+        :param args: Значения параметров в порядке их появления в пути.
+        :return: Строка с сформированным URL.
+        """
+        if len(self.params) != len(args):
+            raise ValueError(f'Expected {len(self.params)} arguments, but got {len(args)}.')
+        return self.template.format(*args)
+
+
+class RouteTable:
+    """Таблица именованных маршрутов, построенная один раз при старте приложения."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, RouteTemplate] = {}
+
+    def build(self, routes: Iterable[BaseRoute]) -> None:
+        """
+        Разбирает пути маршрутов и сохраняет их шаблоны.
+
+        :param routes: Маршруты приложения или роутеров.
+        """
+        for route in routes:
+            name: str | None = getattr(route, 'name', None)
+            path: str | None = getattr(route, 'path', None)
+            if name and path:
+                self._routes[name] = RouteTemplate(path)
+
+    def reverse(self, func_name: str, *args) -> str:
+        """
+        Возвращает URL для указанного маршрута, подставляя значения параметров из args.
+        Примеры:
+            reverse('delete_menu', menu_id)
+            reverse('get_menus')
+        *если переопредели имя ручки, то указываем новое
+        :param func_name: Имя маршрута.
+        :param args: Значения параметров в порядке их появления в URL.
+        :return: Строка с сформированным URL.
+        """
+        route: RouteTemplate | None = self._routes.get(func_name)
+        if route is None:
+            raise ValueError(f"Route with name '{func_name}' not found.")
+        return route.format(*args)
+
+
+route_table: RouteTable = RouteTable()
+
+
+def reverse(func_name: str, *args) -> str:
+    """
+    Возвращает URL для указанного маршрута из общей таблицы маршрутов.
+
+    :param func_name: Имя маршрута.
+    :param args: Значения параметров в порядке их появления в URL.
+    :return: Строка с сформированным URL.
+    """
+    return route_table.reverse(func_name, *args)
@@ -0,0 +1,56 @@
+from decimal import Decimal
+from typing import Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from src.menu.api.dependencies import get_search_service
+from src.menu.models.search_model import SearchResultModel
+from src.menu.schemas.search_schema import SearchQuery
+from src.menu.services.search_service import SearchService
+
+router = APIRouter(
+    prefix='/api/v1',
+    tags=['Search']
+)
+
+
+@router.get(
+    '/search',
+    response_model=SearchResultModel
+)
+async def search(
+        q: str | None = Query(default=None, max_length=100),
+        menu_id: UUID | None = None,
+        submenu_id: UUID | None = None,
+        min_price: Decimal | None = Query(default=None, ge=0),
+        max_price: Decimal | None = Query(default=None, ge=0),
+        sort: Literal['relevance', 'price', '-price'] = 'relevance',
+        limit: int = Query(default=20, ge=1, le=100),
+        search_service: SearchService = Depends(get_search_service)
+) -> SearchResultModel:
+    """
+    Поиск меню, подменю и блюд по названию и описанию.
+
+    Слова запроса совпадают по префиксу, опечатки в названиях и описаниях допускаются (нечёткий поиск).
+    Фильтры по цене, меню и подменю и сортировка по цене применяются к блюдам.
+
+    :param q: Текст запроса.
+    :param menu_id: Идентификатор меню.
+    :param submenu_id: Идентификатор подменю.
+    :param min_price: Минимальная действующая цена блюда.
+    :param max_price: Максимальная действующая цена блюда.
+    :param sort: Сортировка блюд: relevance, price или -price.
+    :param limit: Максимальное количество результатов каждого вида.
+    :param search_service: Сервис для поиска (внедрение зависимости).
+    :return: Модель результатов поиска.
+    """
+    return await search_service.search(SearchQuery(
+        q=q,
+        menu_id=menu_id,
+        submenu_id=submenu_id,
+        min_price=min_price,
+        max_price=max_price,
+        sort=sort,
+        limit=limit
+    ))
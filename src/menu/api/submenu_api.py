@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, status
 
 from src.menu.api.dependencies import get_submenu_service
+from src.menu.models.bulk_model import BulkResult
 from src.menu.models.submenu_model import SubmenuDetailModel, SubmenuModel
-from src.menu.schemas.submenu_schema import SubmenuCreate, SubmenuUpdate
+from src.menu.schemas.submenu_schema import SubmenuBulk, SubmenuCreate, SubmenuUpdate
 from src.menu.services.submenu_service import SubmenuService
 
 router = APIRouter(
@@ -36,7 +37,6 @@ async def get_submenus(
     response_model=SubmenuDetailModel
 )
 async def get_submenu(
-        request: Request,
         menu_id: UUID,
         submenu_id: UUID,
         submenu_service: SubmenuService = Depends(get_submenu_service)
@@ -44,13 +44,12 @@ async def get_submenu(
     """
     Получить подробную информацию о конкретном подменю.
 
-    :param request: Объект запроса.
     :param menu_id: Идентификатор меню, к которому относится подменю.
     :param submenu_id: Идентификатор подменю.
     :param submenu_service: Сервис для работы с подменю (внедрение зависимости).
     :return: Модель подменю с деталями.
     """
-    return await submenu_service.get_submenu_detail(request.url.path, menu_id, submenu_id)
+    return await submenu_service.get_submenu_detail(menu_id, submenu_id)
 
 
 @router.post(
@@ -79,7 +78,6 @@ async def create_submenu(
     response_model=SubmenuModel
 )
 async def update_submenu(
-        request: Request,
         menu_id: UUID,
         submenu_id: UUID,
         submenu_update: SubmenuUpdate,
@@ -88,14 +86,13 @@ async def update_submenu(
     """
     Обновить информацию о подменю.
 
-    :param request: Объект запроса.
     :param menu_id: Идентификатор меню, к которому относится подменю.
     :param submenu_id: Идентификатор подменю, которое нужно обновить.
     :param submenu_update: Схема данных для обновления информации о подменю.
     :param submenu_service: Сервис для работы с подменю (внедрение зависимости).
     :return: Модель обновленного подменю.
     """
-    return await submenu_service.update_submenu(request.url.path, menu_id, submenu_id, submenu_update)
+    return await submenu_service.update_submenu(menu_id, submenu_id, submenu_update)
 
 
 @router.delete(
@@ -116,3 +113,23 @@ async def delete_submenu(
     :return: Модель удаленного подменю.
     """
     return await submenu_service.delete_submenu(menu_id, submenu_id)
+
+
+@router.post(
+    '/menus/{menu_id}/submenus/bulk',
+    response_model=BulkResult
+)
+async def bulk_submenus(
+        menu_id: UUID,
+        submenu_bulk: SubmenuBulk,
+        submenu_service: SubmenuService = Depends(get_submenu_service)
+) -> BulkResult:
+    """
+    Пакетно создать, обновить и удалить подменю в одной транзакции.
+
+    :param menu_id: Идентификатор меню.
+    :param submenu_bulk: Списки подменю для создания, обновления и удаления.
+    :param submenu_service: Сервис для работы с подменю (внедрение зависимости).
+    :return: Результаты по каждому элементу запроса.
+    """
+    return await submenu_service.bulk_submenus(menu_id, submenu_bulk)
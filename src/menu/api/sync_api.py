@@ -0,0 +1,31 @@
+from celery.result import AsyncResult
+from fastapi import APIRouter, status
+
+from src.menu.models.sync_model import SyncTaskModel
+from src.menu.worker.celery_app import celery_app
+
+router = APIRouter(
+    prefix='/api/v1',
+    tags=['Sync']
+)
+
+SYNC_TASK_NAME: str = 'src.menu.worker.tasks.excel_sync_task.sync_excel_to_db'
+
+
+@router.post(
+    '/sync',
+    response_model=SyncTaskModel,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def sync_now() -> SyncTaskModel:
+    """
+    Запустить синхронизацию с Google Sheets, не дожидаясь расписания.
+
+    Задача ставится в очередь Celery и обрабатывает все таблицы независимо от их интервалов;
+    после неё расписание каждой таблицы считается заново. Обработчик синхронный: публикация
+    в RabbitMQ блокирующая и выполняется в пуле потоков.
+
+    :return: Модель с идентификатором задачи.
+    """
+    result: AsyncResult = celery_app.send_task(SYNC_TASK_NAME, kwargs={'force': True})
+    return SyncTaskModel(task_id=result.id)
@@ -0,0 +1,96 @@
+import asyncio
+
+import click
+from aioredis import from_url
+
+from src.config import CACHE_NAMESPACE
+from src.database import REDIS_URL
+from src.menu.services.cache_keys import CACHE_PREFIX, KeyFamily, family_of
+from src.menu.services.invalidation_listener import InvalidationListener
+
+
+async def _flush_cache(everything: bool, stale_only: bool) -> int:
+    """
+    Удаляет ключи кэша.
+
+    :param everything: Очистить всю базу Redis (FLUSHDB).
+    :param stale_only: Удалить только ключи предыдущих версий схемы кэша.
+    :return: Количество удалённых ключей (-1 для FLUSHDB).
+    """
+    async with await from_url(REDIS_URL) as redis:
+        if everything:
+            await redis.flushdb(asynchronous=True)
+            return -1
+
+        deleted: int = 0
+        batch: list[bytes] = []
+        async for key in redis.scan_iter(match=f'{CACHE_NAMESPACE}:*', count=1000):
+            if stale_only and key.startswith(CACHE_PREFIX):
+                continue
+            batch.append(key)
+            if len(batch) >= 1000:
+                deleted += await redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await redis.unlink(*batch)
+        return deleted
+
+
+async def _cache_stats(with_memory: bool) -> dict[str, list[int]]:
+    """
+    Собирает количество ключей и занимаемую память по семействам ключей кэша.
+
+    :param with_memory: Считать память ключей (MEMORY USAGE для каждого ключа).
+    :return: Словарь: имя семейства -> [количество ключей, байт памяти].
+    """
+    stats: dict[str, list[int]] = {}
+    async with await from_url(REDIS_URL) as redis:
+        async for key in redis.scan_iter(match=CACHE_PREFIX + b'*', count=1000):
+            family: KeyFamily | None = family_of(key)
+            family_stats: list[int] = stats.setdefault(family.name if family else 'unknown', [0, 0])
+            family_stats[0] += 1
+            if with_memory:
+                family_stats[1] += await redis.memory_usage(key) or 0
+    return stats
+
+
+async def _listen_invalidations() -> None:
+    """Слушает уведомления об изменениях меню и инвалидирует кэш, пока процесс не будет остановлен."""
+    async with await from_url(REDIS_URL) as redis:
+        await InvalidationListener(redis).run()
+
+
+@click.group()
+def cli() -> None:
+    """Административные команды RestaurantMenuAPI."""
+
+
+@cli.command('flush-cache')
+@click.option('--all', 'everything', is_flag=True, help='Очистить всю базу Redis (FLUSHDB).')
+@click.option('--stale-only', is_flag=True, help='Удалить только ключи предыдущих версий схемы кэша.')
+def flush_cache(everything: bool, stale_only: bool) -> None:
+    """Очистить кэш приложения."""
+    deleted: int = asyncio.run(_flush_cache(everything, stale_only))
+    if deleted < 0:
+        click.echo('Redis database flushed')
+    else:
+        click.echo(f'Deleted {deleted} keys')
+
+
+@cli.command('cache-stats')
+@click.option('--memory', is_flag=True, help='Посчитать занимаемую память (MEMORY USAGE для каждого ключа).')
+def cache_stats(memory: bool) -> None:
+    """Показать количество ключей кэша по семействам."""
+    stats: dict[str, list[int]] = asyncio.run(_cache_stats(memory))
+    for name, (count, size) in sorted(stats.items()):
+        click.echo(f'{name:<20} {count:>8} keys' + (f' {size:>12} bytes' if memory else ''))
+
+
+@cli.command('listen-invalidations')
+def listen_invalidations() -> None:
+    """Инвалидировать кэш по уведомлениям PostgreSQL в отдельном процессе."""
+    asyncio.run(_listen_invalidations())
+
+
+if __name__ == '__main__':
+    cli()
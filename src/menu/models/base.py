@@ -1,15 +1,38 @@
+import os
+import time
 import uuid
 
-from sqlalchemy import UUID
+from sqlalchemy import UUID, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
-class Base(DeclarativeBase):
+def uuid7() -> uuid.UUID:
+    """
+    Генерирует UUID версии 7 (RFC 9562): 48 бит времени в миллисекундах и 74 случайных бита.
+
+    Такие идентификаторы возрастают со временем, поэтому новые записи попадают в конец индекса
+    первичного ключа, а не в случайные его страницы.
+
+    :return: UUID версии 7.
+    """
+    timestamp_ms: int = time.time_ns() // 1_000_000
+    value: int = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class TableBase(DeclarativeBase):
+    """Декларативная база всех таблиц: их общие метаданные использует alembic."""
+
+
+class Base(TableBase):
+    """Базовая модель таблиц каталога с первичным ключом UUID."""
     __abstract__ = True
 
     id: Mapped[str] = mapped_column(
         UUID,
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=str(uuid.uuid4())
+        default=uuid7,
+        server_default=text('gen_random_uuid()')
     )
@@ -0,0 +1,17 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BulkItemResult(BaseModel):
+    """Модель данных (Pydantic) для результата операции над одним элементом пакетного запроса."""
+    action: Literal['create', 'update', 'delete']
+    id: UUID | None
+    status_code: int
+    detail: str | None = None
+
+
+class BulkResult(BaseModel):
+    """Модель данных (Pydantic) для результата пакетного запроса."""
+    results: list[BulkItemResult]
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import BigInteger, DateTime, Identity, SmallInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.menu.models.base import TableBase
+from src.menu.models.dish_model import DishModel
+from src.menu.models.menu_model import MenuModel
+from src.menu.models.submenu_model import SubmenuModel
+
+Item = TypeVar('Item')
+
+
+class ChangeLog(TableBase):
+    """
+    Модель базы данных для журнала изменений меню, подменю и блюд.
+
+    Записи добавляют триггеры таблиц (см. миграцию change_log). Версия записи - номер транзакции txid,
+    source - источник изменения, заданный транзакцией (см. tag_change_source), или NULL.
+    """
+    __tablename__ = 'change_log'
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    txid: Mapped[int] = mapped_column(BigInteger, server_default=text('pg_current_xact_id()::text::bigint'))
+    entity: Mapped[str] = mapped_column(String(16))
+    entity_id: Mapped[UUID]
+    deleted: Mapped[bool]
+    source: Mapped[str | None] = mapped_column(String(32))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text('now()'))
+
+
+class ChangeLogState(TableBase):
+    """Модель базы данных для состояния журнала изменений: версия, до которой записи удалены при сжатии."""
+    __tablename__ = 'change_log_state'
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    compacted_before: Mapped[int] = mapped_column(BigInteger, server_default='0')
+
+
+class EntityChanges(BaseModel, Generic[Item]):
+    """Модель данных (Pydantic) для изменений сущностей одного вида."""
+    upserts: list[Item] = []
+    deletes: list[UUID] = []
+
+
+class ChangesModel(BaseModel):
+    """Модель данных (Pydantic) для изменений каталога с указанной версии."""
+    version: int
+    resync: bool = False
+    menus: EntityChanges[MenuModel] = EntityChanges[MenuModel]()
+    submenus: EntityChanges[SubmenuModel] = EntityChanges[SubmenuModel]()
+    dishes: EntityChanges[DishModel] = EntityChanges[DishModel]()
@@ -1,7 +1,8 @@
+import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from pydantic import UUID4, BaseModel
+from pydantic import BaseModel
 from sqlalchemy import UUID, ForeignKey, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +19,7 @@ class Dish(Base):
     title: Mapped[str] = mapped_column(unique=True)
     description: Mapped[str]
     price: Mapped[float] = mapped_column(Numeric(precision=10, scale=2))
+    discount_price: Mapped[float | None] = mapped_column(Numeric(precision=10, scale=2), nullable=True)
     submenu_id: Mapped[str] = mapped_column(UUID, ForeignKey('submenu.id', ondelete='CASCADE'))
 
     submenu: Mapped[list['Submenu']] = relationship('Submenu', back_populates='dishes')
@@ -25,11 +27,11 @@ class Dish(Base):
 
 class DishModel(BaseModel):
     """Модель данных (Pydantic) для блюда."""
-    id: UUID4
+    id: uuid.UUID
     title: str
     description: str
     price: Decimal
-    submenu_id: UUID4
+    submenu_id: uuid.UUID
 
 
 class DishDiscountModel(DishModel):
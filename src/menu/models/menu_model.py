@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
+from uuid import UUID
 
-from pydantic import UUID4, BaseModel
+from pydantic import BaseModel
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.menu.models.base import Base
@@ -15,13 +17,15 @@ class Menu(Base):
 
     title: Mapped[str] = mapped_column(unique=True)
     description: Mapped[str]
+    # Идентификатор таблицы Google Sheets, из которой синхронизируется меню; None - меню создано через API.
+    sheet_source: Mapped[str | None] = mapped_column(String(64), index=True)
 
     submenus: Mapped[list['Submenu']] = relationship('Submenu', back_populates='menu')
 
 
 class MenuModel(BaseModel):
     """Модель данных (Pydantic) для меню."""
-    id: UUID4
+    id: UUID
     title: str
     description: str
 
@@ -0,0 +1,19 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.menu.models.dish_model import DishModel
+from src.menu.models.menu_model import MenuModel
+from src.menu.models.submenu_model import SubmenuModel
+
+
+class DishSearchModel(DishModel):
+    """Модель данных (Pydantic) для найденного блюда с идентификатором его меню."""
+    menu_id: UUID
+
+
+class SearchResultModel(BaseModel):
+    """Модель данных (Pydantic) для результатов поиска."""
+    menus: list[MenuModel] = []
+    submenus: list[SubmenuModel] = []
+    dishes: list[DishSearchModel] = []
@@ -1,6 +1,7 @@
+import uuid
 from typing import TYPE_CHECKING
 
-from pydantic import UUID4, BaseModel
+from pydantic import BaseModel
 from sqlalchemy import UUID, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,10 +26,10 @@ class Submenu(Base):
 
 class SubmenuModel(BaseModel):
     """Модель данных (Pydantic) для подменю."""
-    id: UUID4
+    id: uuid.UUID
     title: str
     description: str
-    menu_id: UUID4
+    menu_id: uuid.UUID
 
 
 class SubmenuDetailModel(SubmenuModel):
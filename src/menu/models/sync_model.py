@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class SyncTaskModel(BaseModel):
+    """Модель данных (Pydantic) для поставленной в очередь синхронизации с Google Sheets."""
+    task_id: str
@@ -1,17 +1,83 @@
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Result, Select, select
+from pydantic import TypeAdapter
+from sqlalchemy import Result, Select, delete, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
 
+from src.database import USE_PRIMARY, USE_REPLICA, primary_reads, replica_pool
+from src.menu.models.base import Base
+from src.menu.models.bulk_model import BulkItemResult
 from src.menu.models.dish_model import Dish, DishModel
 from src.menu.models.menu_model import Menu, MenuModel
 from src.menu.models.submenu_model import Submenu, SubmenuModel
+from src.menu.schemas.dish_schema import DishBulk
+from src.menu.schemas.menu_schema import MenuBulk
+from src.menu.schemas.submenu_schema import SubmenuBulk
+from src.metrics import track_repository_method
+
+Method = TypeVar('Method', bound=Callable[..., Awaitable[Any]])
+Model = TypeVar('Model')
+
+
+def read_only(method: Method) -> Method:
+    """
+    Помечает метод репозитория как только читающий: его SELECT могут выполняться на реплике.
+
+    Если сессия уже писала в основную базу, результат сохраняется в кэш (primary_reads) или реплики
+    не настроены, метод работает с основной базой.
+
+    :param method: Асинхронный метод репозитория.
+    :return: Обёрнутый метод.
+    """
+    @functools.wraps(method)
+    async def wrapper(self: 'BaseRepository', *args: Any, **kwargs: Any) -> Any:
+        if not replica_pool or self.session.info.get(USE_PRIMARY) or primary_reads.get():
+            return await method(self, *args, **kwargs)
+
+        await replica_pool.check_lag()
+        previous: bool = self.session.info.get(USE_REPLICA, False)
+        self.session.info[USE_REPLICA] = True
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self.session.info[USE_REPLICA] = previous
+
+    return wrapper  # type: ignore[return-value]
+
+
+def validate_rows(adapter: TypeAdapter[list[Model]], result: Result) -> list[Model]:
+    """
+    Строит модели из строк результата одним вызовом заранее собранного TypeAdapter.
+
+    Колонки результата должны называться как поля модели. Валидация всего списка за один вызов
+    заметно быстрее создания моделей по одной (см. benchmarks/bench_model_construct.py).
+
+    :param adapter: TypeAdapter списка моделей.
+    :param result: Результат запроса.
+    :return: Список моделей.
+    """
+    keys: tuple[str, ...] = tuple(result.keys())
+    return adapter.validate_python([dict(zip(keys, row)) for row in result])
 
 
 class BaseRepository:
     def __init__(self, session: AsyncSession):
         self.session: AsyncSession = session
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Оборачивает публичные асинхронные методы репозитория, чтобы время их SQL-запросов
+        учитывалось в метриках под именем метода.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith('_') and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, track_repository_method(f'{cls.__name__}.{name}', attribute))
+
     async def get_menu_by_id(self, menu_id: UUID | str) -> MenuModel:
         """
         Получение меню по его уникальному идентификатору.
@@ -44,3 +110,89 @@ class BaseRepository:
         query: Select = select(Dish).where(Dish.id == dish_id)
         result: Result = await self.session.execute(query)
         return result.scalar()
+
+    async def _bulk_write(
+            self,
+            model: type[Base],
+            parent: dict[str, UUID],
+            bulk: MenuBulk | SubmenuBulk | DishBulk,
+            not_found_detail: str
+    ) -> list[BulkItemResult]:
+        """
+        Пакетное создание, обновление и удаление записей в одной транзакции.
+
+        Все элементы проверяются одним запросом: обновляемые и удаляемые записи должны существовать
+        и принадлежать родителю, а названия не должны быть заняты другими записями. Элементы, не прошедшие
+        проверку, пропускаются, остальные записываются по одному запросу на каждый вид операции.
+
+        :param model: ORM-модель таблицы.
+        :param parent: Внешние ключи родителя, например {'submenu_id': submenu_id}.
+        :param bulk: Схема данных пакетного запроса.
+        :param not_found_detail: Текст ошибки для ненайденной записи.
+        :return: Результаты по каждому элементу в порядке: создание, обновление, удаление.
+        """
+        ids: set[UUID] = {item.id for item in (*bulk.create, *bulk.update)} | set(bulk.delete)
+        titles: set[str] = {item.title for item in (*bulk.create, *bulk.update)}
+        rows: list[Any] = []
+        if ids or titles:
+            query: Select = select(model.id, model.title, *(getattr(model, key) for key in parent)).where(
+                or_(model.id.in_(ids), model.title.in_(titles))
+            )
+            rows = list(await self.session.execute(query))
+
+        existing_ids: set[UUID] = {row.id for row in rows}
+        owned_ids: set[UUID] = {
+            row.id for row in rows
+            if all(getattr(row, key) == value for key, value in parent.items())
+        }
+        deleted_ids: set[UUID] = owned_ids & set(bulk.delete)
+        title_owners: dict[str, UUID] = {row.title: row.id for row in rows if row.id not in deleted_ids}
+
+        results: list[BulkItemResult] = []
+        rows_to_create: list[dict[str, Any]] = []
+        rows_to_update: list[dict[str, Any]] = []
+
+        for item in bulk.create:
+            if item.id in existing_ids:
+                results.append(BulkItemResult(
+                    action='create', id=item.id, status_code=status.HTTP_409_CONFLICT, detail='id already exists'
+                ))
+            elif title_owners.setdefault(item.title, item.id) != item.id:
+                results.append(BulkItemResult(
+                    action='create', id=item.id, status_code=status.HTTP_409_CONFLICT, detail='title already exists'
+                ))
+            else:
+                existing_ids.add(item.id)
+                rows_to_create.append({**item.model_dump(), **parent})
+                results.append(BulkItemResult(action='create', id=item.id, status_code=status.HTTP_201_CREATED))
+
+        for item in bulk.update:
+            if item.id not in owned_ids or item.id in deleted_ids:
+                results.append(BulkItemResult(
+                    action='update', id=item.id, status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail
+                ))
+            elif title_owners.setdefault(item.title, item.id) != item.id:
+                results.append(BulkItemResult(
+                    action='update', id=item.id, status_code=status.HTTP_409_CONFLICT, detail='title already exists'
+                ))
+            else:
+                rows_to_update.append(item.model_dump())
+                results.append(BulkItemResult(action='update', id=item.id, status_code=status.HTTP_200_OK))
+
+        for item_id in bulk.delete:
+            if item_id in deleted_ids:
+                results.append(BulkItemResult(action='delete', id=item_id, status_code=status.HTTP_200_OK))
+            else:
+                results.append(BulkItemResult(
+                    action='delete', id=item_id, status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail
+                ))
+
+        if deleted_ids:
+            await self.session.execute(delete(model).where(model.id.in_(deleted_ids)))
+        if rows_to_update:
+            await self.session.execute(update(model), rows_to_update)
+        if rows_to_create:
+            await self.session.execute(insert(model).values(rows_to_create))
+        await self.session.commit()
+
+        return results
@@ -0,0 +1,177 @@
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Connection,
+    Result,
+    Select,
+    delete,
+    event,
+    exists,
+    func,
+    literal_column,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.menu.models.change_log_model import (
+    ChangeLog,
+    ChangeLogState,
+    ChangesModel,
+    EntityChanges,
+)
+from src.menu.models.dish_model import Dish, DishModel
+from src.menu.models.menu_model import Menu, MenuModel
+from src.menu.models.submenu_model import Submenu, SubmenuModel
+from src.menu.repositories.base_repository import (
+    BaseRepository,
+    read_only,
+    validate_rows,
+)
+from src.menu.repositories.dish_repository import DISH_LIST_ADAPTER, DishRepository
+from src.menu.repositories.sheet_repository import (
+    MENU_LIST_ADAPTER,
+    SUBMENU_LIST_ADAPTER,
+)
+
+# Номер самой старой незавершённой транзакции: все транзакции с меньшим номером уже завершены,
+# и их записи журнала видны целиком. Это и есть текущая версия каталога.
+CURRENT_VERSION: Any = literal_column('pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+
+
+def tag_change_source(session: AsyncSession, source: str) -> None:
+    """
+    Помечает все записи журнала изменений, сделанные через сессию, источником source.
+
+    Источник задаётся в начале каждой транзакции сессии (set_config действует до конца транзакции,
+    поэтому не переходит к другим пользователям соединения из пула).
+
+    :param session: Асинхронная сессия базы данных.
+    :param source: Источник изменений, например 'sheet_sync'.
+    """
+    def set_source(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+        connection.execute(text("SELECT set_config('menu.change_source', :source, true)"), {'source': source})
+
+    event.listen(session.sync_session, 'after_begin', set_source)
+
+
+class ChangeLogRepository(BaseRepository):
+
+    @read_only
+    async def get_changes(self, since: int | None) -> ChangesModel:
+        """
+        Получение изменений каталога с указанной версии.
+
+        Версия - номер транзакции, до которого все транзакции завершены. Записи журнала выбираются
+        по номеру транзакции в полуинтервале [since, version), поэтому транзакция, завершившаяся
+        позже транзакций с большими номерами, не будет пропущена. Для каждой сущности берётся
+        последняя операция; созданные и изменённые сущности возвращаются в текущем состоянии.
+
+        :param since: Версия, полученная клиентом в предыдущем ответе, или None для первой синхронизации.
+        :return: Модель изменений; resync=True, если клиенту нужно загрузить каталог целиком.
+        """
+        state: Any = (await self.session.execute(
+            select(CURRENT_VERSION.label('version'), ChangeLogState.compacted_before)
+        )).one()
+        if since is None or since < state.compacted_before:
+            return ChangesModel(version=state.version, resync=True)
+
+        version: int = max(state.version, since)
+        query: Select = select(ChangeLog.entity, ChangeLog.entity_id, ChangeLog.deleted).where(
+            ChangeLog.txid >= since,
+            ChangeLog.txid < version
+        ).distinct(ChangeLog.entity, ChangeLog.entity_id).order_by(
+            ChangeLog.entity, ChangeLog.entity_id, ChangeLog.id.desc()
+        )
+        upserts: dict[str, list[UUID]] = {'menu': [], 'submenu': [], 'dish': []}
+        deletes: dict[str, list[UUID]] = {'menu': [], 'submenu': [], 'dish': []}
+        for entity, entity_id, deleted in await self.session.execute(query):
+            (deletes if deleted else upserts)[entity].append(entity_id)
+
+        return ChangesModel(
+            version=version,
+            menus=EntityChanges[MenuModel](
+                upserts=await self._get_rows(
+                    MENU_LIST_ADAPTER,
+                    select(Menu.id, Menu.title, Menu.description),
+                    Menu.id,
+                    upserts['menu']
+                ),
+                deletes=deletes['menu']
+            ),
+            submenus=EntityChanges[SubmenuModel](
+                upserts=await self._get_rows(
+                    SUBMENU_LIST_ADAPTER,
+                    select(Submenu.id, Submenu.title, Submenu.description, Submenu.menu_id),
+                    Submenu.id,
+                    upserts['submenu']
+                ),
+                deletes=deletes['submenu']
+            ),
+            dishes=EntityChanges[DishModel](
+                upserts=await self._get_rows(DISH_LIST_ADAPTER, DishRepository._get_dish_query(), Dish.id,
+                                             upserts['dish']),
+                deletes=deletes['dish']
+            )
+        )
+
+    async def check_untagged_changes(self, since: int | None) -> tuple[int, bool]:
+        """
+        Получение текущей версии и проверка, были ли с версии since изменения без источника.
+
+        Изменения с источником (например, записи самой синхронизации с Google Sheets) не учитываются.
+        Запрос использует частичный индекс по txid для записей без источника.
+
+        :param since: Версия, с которой проверяются изменения, или None.
+        :return: Кортеж: текущая версия и признак изменений (всегда True, если since не задана).
+        """
+        if since is None:
+            return (await self.session.execute(select(CURRENT_VERSION))).scalar_one(), True
+
+        changed: Any = exists().where(ChangeLog.txid >= since, ChangeLog.source.is_(None))
+        row: Any = (await self.session.execute(select(CURRENT_VERSION, changed))).one()
+        return row[0], row[1]
+
+    async def _get_rows(self, adapter: TypeAdapter, query: Select, id_column: Any, ids: list[UUID]) -> list:
+        """
+        Получение текущего состояния изменённых сущностей.
+
+        Сущности, удалённые после выбранной версии, пропускаются: их удаление попадёт в следующую версию.
+
+        :param adapter: TypeAdapter списка моделей.
+        :param query: Запрос колонок модели.
+        :param id_column: Колонка идентификатора.
+        :param ids: Идентификаторы сущностей.
+        :return: Список моделей.
+        """
+        if not ids:
+            return []
+        result: Result = await self.session.execute(query.where(id_column.in_(ids)))
+        return validate_rows(adapter, result)
+
+    async def compact(self, retention: timedelta) -> int:
+        """
+        Удаление записей журнала старше retention.
+
+        Версия, до которой записи удалены, сохраняется: клиенты с более старой версией получат resync.
+
+        :param retention: Срок хранения записей.
+        :return: Количество удалённых записей.
+        """
+        deleted: Any = delete(ChangeLog).where(ChangeLog.created_at < func.now() - retention).returning(
+            ChangeLog.txid
+        ).cte('deleted')
+        query: Any = update(ChangeLogState).values(
+            compacted_before=func.greatest(
+                ChangeLogState.compacted_before,
+                select(func.coalesce(func.max(deleted.c.txid) + 1, 0)).scalar_subquery()
+            )
+        ).returning(select(func.count()).select_from(deleted).scalar_subquery())
+        count: int = (await self.session.execute(query)).scalar_one()
+        await self.session.commit()
+        return count
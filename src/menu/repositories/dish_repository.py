@@ -1,41 +1,79 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, status
-from sqlalchemy import Delete, Result, Select, Update, delete, select, update
-
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Result,
+    Select,
+    Update,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from starlette import status
+from starlette.exceptions import HTTPException
+
+from src.menu.models.bulk_model import BulkItemResult
 from src.menu.models.dish_model import Dish, DishModel
-from src.menu.repositories.base_repository import BaseRepository
-from src.menu.schemas.dish_schema import DishCreate, DishUpdate
+from src.menu.repositories.base_repository import (
+    BaseRepository,
+    read_only,
+    validate_rows,
+)
+from src.menu.schemas.dish_schema import DishBulk, DishCreate, DishUpdate
+
+DISH_LIST_ADAPTER: TypeAdapter[list[DishModel]] = TypeAdapter(list[DishModel])
 
 
 class DishRepository(BaseRepository):
 
+    @staticmethod
+    def _get_dish_query() -> Select:
+        """
+        Формирует запрос блюд с действующей ценой: ценой по скидке, если она задана, иначе обычной ценой.
+
+        :return: Запрос SQLAlchemy.
+        """
+        return select(
+            Dish.id,
+            Dish.title,
+            Dish.description,
+            func.coalesce(Dish.discount_price, Dish.price).label('price'),
+            Dish.submenu_id
+        )
+
+    @read_only
     async def get_dish(self, dish_id: UUID) -> DishModel:
         """
         Получение информации о блюде по его уникальному идентификатору.
 
         :param dish_id: Уникальный идентификатор блюда (UUID).
-        :return: Модель данных DishModel.
+        :return: Модель данных DishModel с действующей ценой.
         :raise HTTPException: Исключение с кодом 404, если блюдо не найдено.
         """
-        db_dish: Any = await self.get_dish_by_id(dish_id)
-        if not db_dish:
+        result: Result = await self.session.execute(self._get_dish_query().where(Dish.id == dish_id))
+        dish: Any = result.first()
+        if not dish:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='dish not found')
 
-        return db_dish
+        return DishModel(**dish._mapping)
 
+    @read_only
     async def get_dishes(self, submenu_id: UUID) -> list[DishModel]:
         """
         Получение списка блюд для указанного подменю.
 
         :param submenu_id: Уникальный идентификатор подменю (UUID).
-        :return: Список моделей данных DishModel.
+        :return: Список моделей данных DishModel с действующими ценами.
         """
-        query: Select = select(Dish).where(Dish.submenu_id == submenu_id)
+        query: Select = self._get_dish_query().where(Dish.submenu_id == submenu_id)
         result: Result = await self.session.execute(query)
 
-        return list(result.scalars().all())
+        return validate_rows(DISH_LIST_ADAPTER, result)
 
     async def update_dish(self, dish_id: UUID, dish_update: DishUpdate) -> DishModel:
         """
@@ -65,12 +103,22 @@ class DishRepository(BaseRepository):
         :param dish_create: Схема данных для создания нового блюда.
         :return: Модель данных созданного блюда.
         """
-        db_dish: Dish = Dish(**dish_create.model_dump(), submenu_id=submenu_id)
-        self.session.add(db_dish)
+        query: Insert = (
+            insert(Dish)
+            .values(**dish_create.model_dump(exclude_none=True), submenu_id=submenu_id)
+            .returning(
+                Dish.id,
+                Dish.title,
+                Dish.description,
+                func.coalesce(Dish.discount_price, Dish.price).label('price'),
+                Dish.submenu_id
+            )
+        )
+        result: Result = await self.session.execute(query)
+        dish: DishModel = DishModel(**result.one()._mapping)
         await self.session.commit()
-        await self.session.refresh(db_dish)
 
-        return db_dish
+        return dish
 
     async def delete_dish(self, dish_id: UUID | str) -> DishModel:
         """
@@ -90,3 +138,17 @@ class DishRepository(BaseRepository):
         await self.session.commit()
 
         return db_dish
+
+    async def bulk_dishes(self, submenu_id: UUID, dish_bulk: DishBulk) -> list[BulkItemResult]:
+        """
+        Пакетное создание, обновление и удаление блюд подменю в одной транзакции.
+
+        :param submenu_id: Уникальный идентификатор подменю (UUID).
+        :param dish_bulk: Схема данных пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        :raise HTTPException: Исключение с кодом 404, если подменю не найдено.
+        """
+        if not await self.get_submenu_by_id(submenu_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='submenu not found')
+
+        return await self._bulk_write(Dish, {'submenu_id': submenu_id}, dish_bulk, 'dish not found')
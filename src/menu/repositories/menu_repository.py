@@ -1,21 +1,33 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, status
-from sqlalchemy import Delete, Result, Select, Update, delete, func, select, update
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Result,
+    Select,
+    Update,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.orm import selectinload
+from starlette import status
+from starlette.exceptions import HTTPException
 
+from src.menu.models.bulk_model import BulkItemResult
 from src.menu.models.dish_model import Dish
 from src.menu.models.menu_model import Menu, MenuDetailModel, MenuModel
-from src.menu.models.models_for_full_menu import (
-    AllMenuModel,
-    DishInfo,
-    MenuInfo,
-    SubmenuInfo,
-)
+from src.menu.models.models_for_full_menu import AllMenuModel
 from src.menu.models.submenu_model import Submenu
-from src.menu.repositories.base_repository import BaseRepository
-from src.menu.schemas.menu_schema import MenuCreate, MenuUpdate
+from src.menu.repositories.base_repository import BaseRepository, read_only
+from src.menu.schemas.menu_schema import MenuBulk, MenuCreate, MenuUpdate
+
+MENU_DETAIL_LIST_ADAPTER: TypeAdapter[list[MenuDetailModel]] = TypeAdapter(list[MenuDetailModel])
+FULL_MENU_ADAPTER: TypeAdapter[list[AllMenuModel]] = TypeAdapter(list[AllMenuModel])
 
 
 class MenuRepository(BaseRepository):
@@ -48,6 +60,22 @@ class MenuRepository(BaseRepository):
 
         return await self.session.execute(menu_query)
 
+    @staticmethod
+    def _menu_detail_values(menu: Any) -> dict[str, Any]:
+        """
+        Возвращает значения полей MenuDetailModel из строки запроса к таблице меню.
+
+        :param menu: Результат запроса к таблице меню.
+        :return: Словарь значений полей модели.
+        """
+        return {
+            'id': menu.id,
+            'title': menu.title,
+            'description': menu.description,
+            'submenus_count': int(menu.submenu_count) if menu.submenu_count is not None else 0,
+            'dishes_count': int(menu.total_dish_count) if menu.total_dish_count is not None else 0
+        }
+
     @staticmethod
     def _create_menu_detail_model(menu: Any) -> MenuDetailModel:
         """
@@ -56,29 +84,21 @@ class MenuRepository(BaseRepository):
         :param menu: Результат запроса к таблице меню.
         :return: Экземпляр модели данных MenuDetailModel.
         """
-        return MenuDetailModel(
-            id=menu.id,
-            title=menu.title,
-            description=menu.description,
-            submenus_count=int(menu.submenu_count) if menu.submenu_count is not None else 0,
-            dishes_count=int(menu.total_dish_count) if menu.total_dish_count is not None else 0
-        )
+        return MenuDetailModel(**MenuRepository._menu_detail_values(menu))
 
+    @read_only
     async def get_menus(self) -> list[MenuDetailModel]:
         """
         Получение списка меню.
 
+        Модели всех строк валидируются одним вызовом MENU_DETAIL_LIST_ADAPTER.
+
         :return: Список моделей данных MenuModel.
         """
         result_menus: Result = await self._get_menu_query()
-        menus: list[MenuDetailModel] = []
-
-        for menu in result_menus:
-            menu_detail: MenuDetailModel = self._create_menu_detail_model(menu)
-            menus.append(menu_detail)
-
-        return menus
+        return MENU_DETAIL_LIST_ADAPTER.validate_python([self._menu_detail_values(menu) for menu in result_menus])
 
+    @read_only
     async def get_menu_detail(self, menu_id: UUID) -> MenuDetailModel:
         """
         Получение подробной информации о конкретном меню.
@@ -103,14 +123,24 @@ class MenuRepository(BaseRepository):
         :param menu_create: Схема данных для создания нового меню.
         :return: Модель данных созданного меню.
         """
-        db_menu: Menu = Menu(**menu_create.model_dump())
-        self.session.add(db_menu)
+        query: Insert = (
+            insert(Menu)
+            .values(**menu_create.model_dump(exclude_none=True))
+            .returning(Menu.id, Menu.title, Menu.description)
+        )
+        result: Result = await self.session.execute(query)
+        menu: MenuModel = MenuModel(**result.one()._mapping)
         await self.session.commit()
-        await self.session.refresh(db_menu)
 
-        return db_menu
+        return menu
 
-    async def get_full_menu(self) -> list[AllMenuModel]:
+    async def get_full_menu_tree(self, sheet_source: str | None = None) -> list[Menu]:
+        """
+        Загружает все меню вместе с подменю и блюдами.
+
+        :param sheet_source: Идентификатор таблицы Google Sheets; если задан, загружаются только её меню.
+        :return: Список ORM-объектов Menu с загруженными связями.
+        """
         menu_query: Select = (
             select(Menu)
             .options(
@@ -118,37 +148,59 @@ class MenuRepository(BaseRepository):
                 .selectinload(Submenu.dishes)
             )
         )
+        if sheet_source is not None:
+            menu_query = menu_query.where(Menu.sheet_source == sheet_source)
         result: Result = await self.session.execute(menu_query)
-        menus = result.scalars().all()
-
-        result_all: list[AllMenuModel] = [
-            AllMenuModel(
-                menu=MenuInfo(
-                    id=menu.id,
-                    title=menu.title,
-                    description=menu.description,
-                    submenus=[
-                        SubmenuInfo(
-                            id=submenu.id,
-                            title=submenu.title,
-                            description=submenu.description,
-                            dishes=[
-                                DishInfo(
-                                    id=dish.id,
-                                    title=dish.title,
-                                    description=dish.description,
-                                    price=dish.price
-                                )
+        return list(result.scalars().all())
+
+    @read_only
+    async def get_full_menu(self) -> list[AllMenuModel]:
+        """
+        Получение полного меню вместе со всеми подменю и блюдами с действующими ценами.
+
+        :return: Список моделей данных AllMenuModel.
+        """
+        menus: list[Menu] = await self.get_full_menu_tree()
+        return self._create_full_menu_models(menus)
+
+    @staticmethod
+    def _create_full_menu_models(menus: list[Menu]) -> list[AllMenuModel]:
+        """
+        Строит модели полного меню из загруженного дерева меню.
+
+        Дерево собирается из словарей и валидируется одним вызовом FULL_MENU_ADAPTER,
+        что быстрее создания каждой модели по отдельности.
+
+        :param menus: Список ORM-объектов Menu с загруженными подменю и блюдами.
+        :return: Список моделей данных AllMenuModel.
+        """
+        return FULL_MENU_ADAPTER.validate_python([
+            {
+                'menu': {
+                    'id': menu.id,
+                    'title': menu.title,
+                    'description': menu.description,
+                    'submenus': [
+                        {
+                            'id': submenu.id,
+                            'title': submenu.title,
+                            'description': submenu.description,
+                            'dishes': [
+                                {
+                                    'id': dish.id,
+                                    'title': dish.title,
+                                    'description': dish.description,
+                                    'price': dish.discount_price if dish.discount_price is not None else dish.price
+                                }
                                 for dish in submenu.dishes
                             ]
-                        )
+                        }
                         for submenu in menu.submenus
                     ]
-                )
-            )
+                }
+            }
             for menu in menus
-        ]
-        return result_all
+        ])
 
     async def update_menu(self, menu_id: UUID, menu_update: MenuUpdate) -> MenuModel:
         """
@@ -187,3 +239,12 @@ class MenuRepository(BaseRepository):
         await self.session.commit()
 
         return existing_menu
+
+    async def bulk_menus(self, menu_bulk: MenuBulk) -> list[BulkItemResult]:
+        """
+        Пакетное создание, обновление и удаление меню в одной транзакции.
+
+        :param menu_bulk: Схема данных пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        """
+        return await self._bulk_write(Menu, {}, menu_bulk, 'menu not found')
@@ -0,0 +1,148 @@
+import re
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    Result,
+    Select,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.menu.models.base import Base
+from src.menu.models.dish_model import Dish
+from src.menu.models.menu_model import Menu
+from src.menu.models.search_model import DishSearchModel, SearchResultModel
+from src.menu.models.submenu_model import Submenu
+from src.menu.repositories.base_repository import (
+    BaseRepository,
+    read_only,
+    validate_rows,
+)
+from src.menu.repositories.sheet_repository import (
+    MENU_LIST_ADAPTER,
+    SUBMENU_LIST_ADAPTER,
+)
+from src.menu.schemas.search_schema import SearchQuery
+
+DISH_SEARCH_LIST_ADAPTER: TypeAdapter[list[DishSearchModel]] = TypeAdapter(list[DishSearchModel])
+WORD_PATTERN: re.Pattern = re.compile(r'\w+')
+
+
+class SearchMatch:
+    """Условие совпадения и релевантность поискового запроса для одной таблицы."""
+    __slots__ = ('condition', 'rank')
+
+    def __init__(self, model: type[Base], text: str | None):
+        """
+        Строит условие: все слова запроса совпадают по префиксу (tsvector) или запрос нечётко совпадает
+        с названием либо описанием (pg_trgm, word similarity - выдерживает опечатки).
+
+        :param model: ORM-модель таблицы с колонкой search_vector.
+        :param text: Текст запроса.
+        """
+        words: list[str] = WORD_PATTERN.findall(text.lower()) if text else []
+        self.condition: ColumnElement[bool] | None = None
+        self.rank: ColumnElement[Any] | None = None
+        if not words:
+            return
+
+        search_vector: ColumnElement[Any] = literal_column(f'{model.__tablename__}.search_vector', TSVECTOR)
+        ts_query: ColumnElement[Any] = func.to_tsquery('simple', ' & '.join(f'{word}:*' for word in words))
+        query: ColumnElement[str] = literal(' '.join(words))
+        self.condition = or_(
+            search_vector.op('@@')(ts_query),
+            query.op('<%')(model.title),
+            query.op('<%')(model.description)
+        )
+        self.rank = func.ts_rank(search_vector, ts_query) + func.word_similarity(query, model.title)
+
+    def apply(self, query: Select, model: type[Base]) -> Select:
+        """
+        Добавляет к запросу условие совпадения и сортировку по релевантности.
+
+        :param query: Запрос.
+        :param model: ORM-модель таблицы.
+        :return: Запрос с условием и сортировкой.
+        """
+        if self.condition is None or self.rank is None:
+            return query.order_by(model.title)
+        return query.where(self.condition).order_by(self.rank.desc(), model.title)
+
+
+class SearchRepository(BaseRepository):
+
+    @read_only
+    async def search(self, search_query: SearchQuery) -> SearchResultModel:
+        """
+        Поиск меню, подменю и блюд.
+
+        Фильтр по цене применим только к блюдам, поэтому при нём меню и подменю не ищутся;
+        при фильтре по подменю не ищутся меню.
+
+        :param search_query: Схема данных поискового запроса.
+        :return: Модель результатов поиска.
+        """
+        result: SearchResultModel = SearchResultModel(dishes=await self._search_dishes(search_query))
+        if search_query.has_price_filter:
+            return result
+
+        result.submenus = await self._search_submenus(search_query)
+        if search_query.submenu_id is None:
+            result.menus = await self._search_menus(search_query)
+        return result
+
+    async def _search_menus(self, search_query: SearchQuery) -> list:
+        query: Select = select(Menu.id, Menu.title, Menu.description)
+        if search_query.menu_id is not None:
+            query = query.where(Menu.id == search_query.menu_id)
+        query = SearchMatch(Menu, search_query.q).apply(query, Menu).limit(search_query.limit)
+
+        result: Result = await self.session.execute(query)
+        return validate_rows(MENU_LIST_ADAPTER, result)
+
+    async def _search_submenus(self, search_query: SearchQuery) -> list:
+        query: Select = select(Submenu.id, Submenu.title, Submenu.description, Submenu.menu_id)
+        if search_query.menu_id is not None:
+            query = query.where(Submenu.menu_id == search_query.menu_id)
+        if search_query.submenu_id is not None:
+            query = query.where(Submenu.id == search_query.submenu_id)
+        query = SearchMatch(Submenu, search_query.q).apply(query, Submenu).limit(search_query.limit)
+
+        result: Result = await self.session.execute(query)
+        return validate_rows(SUBMENU_LIST_ADAPTER, result)
+
+    async def _search_dishes(self, search_query: SearchQuery) -> list[DishSearchModel]:
+        price: ColumnElement[Any] = func.coalesce(Dish.discount_price, Dish.price)
+        query: Select = select(
+            Dish.id,
+            Dish.title,
+            Dish.description,
+            price.label('price'),
+            Dish.submenu_id,
+            Submenu.menu_id
+        ).join(Submenu, Submenu.id == Dish.submenu_id)
+        if search_query.menu_id is not None:
+            query = query.where(Submenu.menu_id == search_query.menu_id)
+        if search_query.submenu_id is not None:
+            query = query.where(Dish.submenu_id == search_query.submenu_id)
+        if search_query.min_price is not None:
+            query = query.where(price >= search_query.min_price)
+        if search_query.max_price is not None:
+            query = query.where(price <= search_query.max_price)
+
+        match: SearchMatch = SearchMatch(Dish, search_query.q)
+        if search_query.sort == 'relevance':
+            query = match.apply(query, Dish)
+        else:
+            if match.condition is not None:
+                query = query.where(match.condition)
+            query = query.order_by(price.desc() if search_query.sort == '-price' else price, Dish.title)
+
+        result: Result = await self.session.execute(query.limit(search_query.limit))
+        return validate_rows(DISH_SEARCH_LIST_ADAPTER, result)
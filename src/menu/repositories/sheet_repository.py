@@ -1,28 +1,55 @@
+import asyncio
+import hashlib
 import json
+import random
 from decimal import Decimal
 from typing import Any, Union
 from uuid import UUID
 
 import gspread
+from google.auth.exceptions import GoogleAuthError, TransportError
 from gspread import Client, Spreadsheet
+from gspread.exceptions import APIError, GSpreadException
+from gspread.utils import extract_id_from_url
+from pydantic import TypeAdapter
+from requests import RequestException
+from sqlalchemy import Result, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import BASE_DIR, SPREADSHEET_URL
+from src.config import (
+    BASE_DIR,
+    SHEET_FETCH_BACKOFF,
+    SHEET_FETCH_BACKOFF_MAX,
+    SHEET_FETCH_RETRIES,
+    SHEET_FETCH_TIMEOUT,
+)
 from src.menu.models.dish_model import DishDiscountModel, DishModel
-from src.menu.models.menu_model import MenuModel
-from src.menu.models.models_for_full_menu import AllMenuModel, MenuInfo
+from src.menu.models.menu_model import Menu, MenuModel
 from src.menu.models.submenu_model import SubmenuModel
 from src.menu.repositories.dish_repository import DishRepository
 from src.menu.repositories.menu_repository import MenuRepository
 from src.menu.repositories.submenu_repository import SubmenuRepository
-from src.menu.schemas.dish_schema import DishCreate, DishUpdate
-from src.menu.schemas.menu_schema import MenuCreate, MenuUpdate
+from src.menu.schemas.dish_schema import DishSheetCreate, DishSheetUpdate
+from src.menu.schemas.menu_schema import MenuCreate, MenuSheetCreate, MenuUpdate
 from src.menu.schemas.submenu_schema import SubmenuCreate, SubmenuUpdate
+from src.metrics import SHEET_FETCH_RETRY_ATTEMPTS
+
+MENU_LIST_ADAPTER: TypeAdapter[list[MenuModel]] = TypeAdapter(list[MenuModel])
+SUBMENU_LIST_ADAPTER: TypeAdapter[list[SubmenuModel]] = TypeAdapter(list[SubmenuModel])
+DISH_DISCOUNT_LIST_ADAPTER: TypeAdapter[list[DishDiscountModel]] = TypeAdapter(list[DishDiscountModel])
+RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class SheetFetchError(Exception):
+    """Данные Google Sheets не получены. В отличие от пустого листа, синхронизация в этом случае не выполняется."""
 
 
 class SheetRepository:
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, spreadsheet_url: str | None = None):
+        self.session: AsyncSession = session
+        self.spreadsheet_url: str | None = spreadsheet_url
+        self.source: str | None = extract_id_from_url(spreadsheet_url) if spreadsheet_url else None
         self.menu_repository: MenuRepository = MenuRepository(session)
         self.submenu_repository: SubmenuRepository = SubmenuRepository(session)
         self.dish_repository: DishRepository = DishRepository(session)
@@ -76,23 +103,97 @@ class SheetRepository:
             return True
         return False
 
-    @staticmethod
-    def _get_values() -> list[list]:
+    async def get_values(self) -> list[list]:
         """
         Получает данные из Google Sheets.
 
+        gspread выполняет запросы синхронно, поэтому загрузка идёт в пуле потоков и не блокирует цикл событий.
+        Попытка ограничена SHEET_FETCH_TIMEOUT секундами. При таймауте, сетевой ошибке, ошибке сервера
+        или превышении квоты (429) запрос повторяется до SHEET_FETCH_RETRIES раз с экспоненциальной задержкой
+        и случайным разбросом; при 429 задержка не меньше Retry-After, а если ждать дольше
+        SHEET_FETCH_BACKOFF_MAX секунд, попытка переносится на следующий запуск синхронизации.
+
         :return: Список списков значений из листа таблицы.
+        :raises SheetFetchError: Если данные не получены.
         """
-        try:
-            client: Client = gspread.service_account(BASE_DIR / 'service_account.json')
-            sh: Spreadsheet = client.open_by_url(SPREADSHEET_URL)
-            values: list[list] = sh.sheet1.get_all_values()
-            return values
-        except Exception:
-            print('Data retrieval error')
-            return [[]]
+        attempt: int = 0
+        while True:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(self._fetch_values), SHEET_FETCH_TIMEOUT)
+            except (asyncio.TimeoutError, RequestException, TransportError, APIError) as e:
+                reason: str | None = self._get_retry_reason(e)
+                delay: float = self._get_retry_delay(e, attempt)
+                if reason is None or attempt == SHEET_FETCH_RETRIES or delay > SHEET_FETCH_BACKOFF_MAX:
+                    raise SheetFetchError(f'Data retrieval error: {e!r}') from e
+                SHEET_FETCH_RETRY_ATTEMPTS.labels(self.source, reason).inc()
+                await asyncio.sleep(delay)
+                attempt += 1
+            except (GSpreadException, GoogleAuthError, OSError, ValueError) as e:
+                raise SheetFetchError(f'Data retrieval error: {e!r}') from e
+
+    def _fetch_values(self) -> list[list]:
+        """
+        Загружает значения первого листа таблицы.
+
+        wait_for не прерывает поток, поэтому тот же таймаут задаётся и HTTP-клиенту gspread:
+        зависший запрос завершится сам, а не займёт поток пула навсегда.
+
+        :return: Список списков значений из листа таблицы.
+        """
+        client: Client = gspread.service_account(BASE_DIR / 'service_account.json')
+        client.http_client.set_timeout(SHEET_FETCH_TIMEOUT)
+        sh: Spreadsheet = client.open_by_url(self.spreadsheet_url)
+        return sh.sheet1.get_all_values()
 
-    def parse_sheet(self) -> tuple[list[MenuModel], list[SubmenuModel], list[DishDiscountModel | Any]]:
+    @staticmethod
+    def _get_retry_reason(error: Exception) -> str | None:
+        """
+        Определяет, стоит ли повторять запрос после ошибки.
+
+        :param error: Ошибка получения данных.
+        :return: Причина повтора (timeout, quota, server, network) или None, если повтор не поможет.
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            return 'timeout'
+        if isinstance(error, APIError):
+            if error.response.status_code == 429:
+                return 'quota'
+            return 'server' if error.response.status_code in RETRY_STATUS_CODES else None
+        return 'network'
+
+    @staticmethod
+    def _get_retry_delay(error: Exception, attempt: int) -> float:
+        """
+        Вычисляет задержку перед повтором.
+
+        :param error: Ошибка получения данных.
+        :param attempt: Номер неудачной попытки, начиная с 0.
+        :return: Задержка в секундах.
+        """
+        delay: float = min(
+            SHEET_FETCH_BACKOFF * 2 ** attempt + random.uniform(0, SHEET_FETCH_BACKOFF),
+            SHEET_FETCH_BACKOFF_MAX
+        )
+        if isinstance(error, APIError) and error.response.status_code == 429:
+            retry_after: str = error.response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return max(delay, float(retry_after))
+        return delay
+
+    @staticmethod
+    def get_fingerprint(values: list[list]) -> bytes:
+        """
+        Вычисляет отпечаток содержимого листа.
+
+        :param values: Список списков значений листа.
+        :return: 16 байт хэша BLAKE2b.
+        """
+        return hashlib.blake2b(json.dumps(values).encode(), digest_size=16).digest()
+
+    def parse_sheet(
+            self,
+            values: list[list]
+    ) -> tuple[list[MenuModel], list[SubmenuModel], list[DishDiscountModel | Any]]:
         """
             Разбирает данные листа и создает объекты моделей меню, подменю и блюд.
 
@@ -102,7 +203,6 @@ class SheetRepository:
         menu_data: list[MenuModel] = []
         submenu_data: list[SubmenuModel] = []
         dish_data: list[DishDiscountModel | Any] = []
-        values: list[list] = self._get_values()
 
         menu_id: UUID | None = None
         submenu_id: UUID | None = None
@@ -184,49 +284,74 @@ class SheetRepository:
                             )
         return menu_data, submenu_data, dish_data
 
-    async def get_full_menu(self) -> tuple[list[MenuModel], list[SubmenuModel], list[DishModel | Any]]:
+    async def get_full_menu(self) -> tuple[list[MenuModel], list[SubmenuModel], list[DishDiscountModel | Any]]:
         """
-        Получает полное меню из удалённого источника данных.
+        Получает полное меню таблицы из базы данных вместе с ценами по скидке.
 
         :return: Кортеж, содержащий списки моделей меню, подменю и блюд.
         """
-        menu_data: list[MenuModel] = []
-        submenu_data: list[SubmenuModel] = []
-        dish_data: list[DishModel | Any] = []
+        menus: list[Menu] = await self.menu_repository.get_full_menu_tree(self.source)
+        return self._create_full_menu_models(menus)
 
-        full_menu: list[AllMenuModel] = await self.menu_repository.get_full_menu()
+    async def claim_menus(self, menu_ids: list[UUID]) -> set[UUID]:
+        """
+        Закрепляет за таблицей меню из листа, у которых ещё нет таблицы (созданные через API или до
+        появления нескольких таблиц).
 
-        for data in full_menu:
-            menu: MenuInfo = data.menu
-            menu_data.append(
-                MenuModel(
-                    id=menu.id,
-                    title=menu.title,
-                    description=menu.description,
-                )
-            )
+        :param menu_ids: Идентификаторы меню из листа.
+        :return: Идентификаторы меню из листа, закреплённых за другими таблицами.
+        """
+        if not menu_ids:
+            return set()
+        await self.session.execute(
+            update(Menu).where(Menu.id.in_(menu_ids), Menu.sheet_source.is_(None)).values(sheet_source=self.source)
+        )
+        result: Result = await self.session.execute(
+            select(Menu.id).where(Menu.id.in_(menu_ids), Menu.sheet_source != self.source)
+        )
+        await self.session.commit()
+        return set(result.scalars().all())
+
+    @staticmethod
+    def _create_full_menu_models(
+            menus: list[Menu]
+    ) -> tuple[list[MenuModel], list[SubmenuModel], list[DishDiscountModel | Any]]:
+        """
+        Строит модели меню, подменю и блюд из загруженного дерева меню.
+
+        Модели каждого вида валидируются одним вызовом заранее собранного TypeAdapter.
+
+        :param menus: Список ORM-объектов Menu с загруженными подменю и блюдами.
+        :return: Кортеж, содержащий списки моделей меню, подменю и блюд.
+        """
+        menu_values: list[dict[str, Any]] = []
+        submenu_values: list[dict[str, Any]] = []
+        dish_values: list[dict[str, Any]] = []
+        dish_menu_ids: list[UUID] = []
+
+        for menu in menus:
+            menu_values.append({'id': menu.id, 'title': menu.title, 'description': menu.description})
             for submenu in menu.submenus:
-                submenu_data.append(
-                    SubmenuModel(
-                        id=submenu.id,
-                        title=submenu.title,
-                        description=submenu.description,
-                        menu_id=menu.id
-                    )
+                submenu_values.append(
+                    {'id': submenu.id, 'title': submenu.title, 'description': submenu.description, 'menu_id': menu.id}
                 )
                 for dish in submenu.dishes:
-                    dish_data.append(
-                        [
-                            DishModel(
-                                id=dish.id,
-                                title=dish.title,
-                                description=dish.description,
-                                price=dish.price,
-                                submenu_id=submenu.id
-                            ),
-                            menu.id
-                        ]
+                    dish_values.append(
+                        {
+                            'id': dish.id,
+                            'title': dish.title,
+                            'description': dish.description,
+                            'price': dish.price,
+                            'submenu_id': submenu.id,
+                            'discount': dish.discount_price
+                        }
                     )
+                    dish_menu_ids.append(menu.id)
+
+        menu_data: list[MenuModel] = MENU_LIST_ADAPTER.validate_python(menu_values)
+        submenu_data: list[SubmenuModel] = SUBMENU_LIST_ADAPTER.validate_python(submenu_values)
+        dishes: list[DishDiscountModel] = DISH_DISCOUNT_LIST_ADAPTER.validate_python(dish_values)
+        dish_data: list[DishDiscountModel | Any] = [[dish, menu_id] for dish, menu_id in zip(dishes, dish_menu_ids)]
 
         return menu_data, submenu_data, dish_data
 
@@ -271,16 +396,16 @@ class SheetRepository:
 
         return submenus_to_delete_ids
 
-    async def delete_menus(self, menu_data_online: list[MenuModel], menu_data_offline: list[MenuModel]) -> list[str]:
+    async def delete_menus(self, menu_data_online: list[MenuModel], menu_data_offline: list[MenuModel]) -> list[UUID]:
         """
         Удаляет меню, которых нет в списке оффлайн данных.
 
         :param menu_data_online: Список моделей данных меню онлайн.
         :param menu_data_offline: Список моделей данных меню оффлайн.
         """
-        online_menu_ids: list[str] = [menu.id for menu in menu_data_online]
-        offline_menu_ids: list[str] = [menu.id for menu in menu_data_offline]
-        menus_to_delete_ids: list[str] = [menu_id for menu_id in online_menu_ids if menu_id not in offline_menu_ids]
+        online_menu_ids: list[UUID] = [menu.id for menu in menu_data_online]
+        offline_menu_ids: list[UUID] = [menu.id for menu in menu_data_offline]
+        menus_to_delete_ids: list[UUID] = [menu_id for menu_id in online_menu_ids if menu_id not in offline_menu_ids]
 
         for menu_id in menus_to_delete_ids:
             await self.menu_repository.delete_menu(menu_id)
@@ -322,7 +447,7 @@ class SheetRepository:
         await self.menu_repository.update_menu(menu_id, menu_update)
 
     async def create_menu(self, menu_create: MenuCreate) -> None:
-        await self.menu_repository.create_menu(menu_create)
+        await self.menu_repository.create_menu(MenuSheetCreate(**menu_create.model_dump(), sheet_source=self.source))
 
     @staticmethod
     async def get_update_or_create_submenu(
@@ -396,8 +521,10 @@ class SheetRepository:
                                 offline_dish[1],
                                 offline_dish[0].submenu_id,
                                 offline_dish[0].id,
-                                DishUpdate(**json.loads(offline_dish[0].model_dump_json())),
-                                offline_dish[2]
+                                DishSheetUpdate(
+                                    **json.loads(offline_dish[0].model_dump_json()),
+                                    discount_price=offline_dish[0].discount
+                                )
                             ]
                         )
                     break
@@ -406,14 +533,16 @@ class SheetRepository:
                     [
                         offline_dish[1],
                         offline_dish[0].submenu_id,
-                        DishCreate(**json.loads(offline_dish[0].model_dump_json())),
-                        offline_dish[2]
+                        DishSheetCreate(
+                            **json.loads(offline_dish[0].model_dump_json()),
+                            discount_price=offline_dish[0].discount
+                        )
                     ]
                 )
         return dishes_update, dishes_create
 
-    async def update_dish(self, dish_id: UUID, dish_update: DishUpdate) -> None:
+    async def update_dish(self, dish_id: UUID, dish_update: DishSheetUpdate) -> None:
         await self.dish_repository.update_dish(dish_id, dish_update)
 
-    async def create_dish(self, submenu_id: UUID, dish_create: DishCreate) -> DishModel:
+    async def create_dish(self, submenu_id: UUID, dish_create: DishSheetCreate) -> DishModel:
         return await self.dish_repository.create_dish(submenu_id, dish_create)
@@ -1,13 +1,29 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, status
-from sqlalchemy import Delete, Result, Select, Update, delete, func, select, update
-
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Result,
+    Select,
+    Update,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from starlette import status
+from starlette.exceptions import HTTPException
+
+from src.menu.models.bulk_model import BulkItemResult
 from src.menu.models.dish_model import Dish
 from src.menu.models.submenu_model import Submenu, SubmenuDetailModel, SubmenuModel
-from src.menu.repositories.base_repository import BaseRepository
-from src.menu.schemas.submenu_schema import SubmenuCreate, SubmenuUpdate
+from src.menu.repositories.base_repository import BaseRepository, read_only
+from src.menu.schemas.submenu_schema import SubmenuBulk, SubmenuCreate, SubmenuUpdate
+
+SUBMENU_DETAIL_LIST_ADAPTER: TypeAdapter[list[SubmenuDetailModel]] = TypeAdapter(list[SubmenuDetailModel])
 
 
 class SubmenuRepository(BaseRepository):
@@ -35,6 +51,23 @@ class SubmenuRepository(BaseRepository):
 
         return await self.session.execute(submenu_query)
 
+    @staticmethod
+    def _submenu_detail_values(submenu: Any, menu_id: UUID) -> dict[str, Any]:
+        """
+        Возвращает значения полей SubmenuDetailModel из строки запроса к подменю.
+
+        :param submenu: Результат запроса к подменю.
+        :param menu_id: Уникальный идентификатор меню.
+        :return: Словарь значений полей модели.
+        """
+        return {
+            'id': submenu.id,
+            'title': submenu.title,
+            'menu_id': menu_id,
+            'description': submenu.description,
+            'dishes_count': int(submenu.dish_count) if submenu.dish_count is not None else 0
+        }
+
     @staticmethod
     def _create_submenu_detail_model(submenu: Any, menu_id: UUID) -> SubmenuDetailModel:
         """
@@ -44,29 +77,23 @@ class SubmenuRepository(BaseRepository):
         :param menu_id: Уникальный идентификатор меню.
         :return: Модель данных SubmenuDetailModel.
         """
-        return SubmenuDetailModel(
-            id=submenu.id,
-            title=submenu.title,
-            menu_id=menu_id,
-            description=submenu.description,
-            dishes_count=int(submenu.dish_count) if submenu.dish_count is not None else 0
-        )
+        return SubmenuDetailModel(**SubmenuRepository._submenu_detail_values(submenu, menu_id))
 
+    @read_only
     async def get_submenus(self, menu_id: UUID) -> list[SubmenuDetailModel]:
         """
         Получение списка подменю для конкретного меню.
 
+        Модели всех строк валидируются одним вызовом SUBMENU_DETAIL_LIST_ADAPTER.
+
         :param menu_id: Уникальный идентификатор меню, для которого нужно
         получить подменю.
         :return: Список моделей данных SubmenuModel.
         """
         result_submenus: Result = await self._get_submenu_query(menu_id)
-        submenus: list[SubmenuDetailModel] = []
-
-        for submenu in result_submenus:
-            submenu_detail: SubmenuDetailModel = self._create_submenu_detail_model(submenu, menu_id)
-            submenus.append(submenu_detail)
-        return submenus
+        return SUBMENU_DETAIL_LIST_ADAPTER.validate_python(
+            [self._submenu_detail_values(submenu, menu_id) for submenu in result_submenus]
+        )
 
     async def create_submenu(self, menu_id: UUID, submenu_create: SubmenuCreate) -> SubmenuModel:
         """
@@ -77,13 +104,18 @@ class SubmenuRepository(BaseRepository):
         :param submenu_create: Схема данных для создания нового подменю.
         :return: Модель данных созданного подменю.
         """
-        db_submenu: Submenu = Submenu(menu_id=menu_id, **submenu_create.model_dump())
-        self.session.add(db_submenu)
+        query: Insert = (
+            insert(Submenu)
+            .values(menu_id=menu_id, **submenu_create.model_dump(exclude_none=True))
+            .returning(Submenu.id, Submenu.title, Submenu.description, Submenu.menu_id)
+        )
+        result: Result = await self.session.execute(query)
+        submenu: SubmenuModel = SubmenuModel(**result.one()._mapping)
         await self.session.commit()
-        await self.session.refresh(db_submenu)
 
-        return db_submenu
+        return submenu
 
+    @read_only
     async def get_submenu_detail(self, menu_id: UUID, submenu_id: UUID) -> SubmenuDetailModel:
         """
         Получение подробной информации о конкретном подменю.
@@ -144,3 +176,17 @@ class SubmenuRepository(BaseRepository):
         await self.session.commit()
 
         return existing_submenu
+
+    async def bulk_submenus(self, menu_id: UUID, submenu_bulk: SubmenuBulk) -> list[BulkItemResult]:
+        """
+        Пакетное создание, обновление и удаление подменю в одной транзакции.
+
+        :param menu_id: Уникальный идентификатор меню (UUID).
+        :param submenu_bulk: Схема данных пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        :raise HTTPException: Исключение с кодом 404, если меню не найдено.
+        """
+        if not await self.get_menu_by_id(menu_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='menu not found')
+
+        return await self._bulk_write(Submenu, {'menu_id': menu_id}, submenu_bulk, 'submenu not found')
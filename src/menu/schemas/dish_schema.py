@@ -1,6 +1,9 @@
+from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.menu.models.base import uuid7
 
 
 class DishBase(BaseModel):
@@ -12,9 +15,31 @@ class DishBase(BaseModel):
 
 class DishCreate(DishBase):
     """Модель данных для создания нового блюда."""
-    id: UUID | None = None
+    id: UUID = Field(default_factory=uuid7)
 
 
 class DishUpdate(DishBase):
     """Модель данных для обновления информации о блюде."""
     pass
+
+
+class DishBulkUpdate(DishUpdate):
+    """Модель данных для обновления блюда в пакетном запросе."""
+    id: UUID
+
+
+class DishBulk(BaseModel):
+    """Модель данных для пакетного создания, обновления и удаления блюд."""
+    create: list[DishCreate] = Field(default_factory=list)
+    update: list[DishBulkUpdate] = Field(default_factory=list)
+    delete: list[UUID] = Field(default_factory=list)
+
+
+class DishSheetCreate(DishCreate):
+    """Модель данных для создания блюда из Google Sheets вместе с ценой по скидке."""
+    discount_price: Decimal | None = None
+
+
+class DishSheetUpdate(DishUpdate):
+    """Модель данных для обновления блюда из Google Sheets вместе с ценой по скидке."""
+    discount_price: Decimal | None = None
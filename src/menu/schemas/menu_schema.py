@@ -1,6 +1,8 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.menu.models.base import uuid7
 
 
 class MenuBase(BaseModel):
@@ -11,9 +13,26 @@ class MenuBase(BaseModel):
 
 class MenuCreate(MenuBase):
     """Модель данных для создания нового меню."""
-    id: UUID | None = None
+    id: UUID = Field(default_factory=uuid7)
 
 
 class MenuUpdate(MenuBase):
     """Модель данных для обновления информации о меню."""
     pass
+
+
+class MenuBulkUpdate(MenuUpdate):
+    """Модель данных для обновления меню в пакетном запросе."""
+    id: UUID
+
+
+class MenuBulk(BaseModel):
+    """Модель данных для пакетного создания, обновления и удаления меню."""
+    create: list[MenuCreate] = Field(default_factory=list)
+    update: list[MenuBulkUpdate] = Field(default_factory=list)
+    delete: list[UUID] = Field(default_factory=list)
+
+
+class MenuSheetCreate(MenuCreate):
+    """Модель данных для создания меню из Google Sheets вместе с идентификатором таблицы."""
+    sheet_source: str | None = None
@@ -0,0 +1,21 @@
+from decimal import Decimal
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchQuery(BaseModel):
+    """Модель данных для поискового запроса по меню, подменю и блюдам."""
+    q: str | None = None
+    menu_id: UUID | None = None
+    submenu_id: UUID | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    sort: Literal['relevance', 'price', '-price'] = 'relevance'
+    limit: int = 20
+
+    @property
+    def has_price_filter(self) -> bool:
+        """Задан ли фильтр по цене (он применим только к блюдам)."""
+        return self.min_price is not None or self.max_price is not None
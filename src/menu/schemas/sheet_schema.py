@@ -0,0 +1,42 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.menu.schemas.dish_schema import DishSheetCreate, DishSheetUpdate
+from src.menu.schemas.menu_schema import MenuCreate, MenuUpdate
+from src.menu.schemas.submenu_schema import SubmenuCreate, SubmenuUpdate
+
+
+class SheetChunk(BaseModel):
+    """
+    Модель данных для части изменений листа, применяемой отдельной задачей Celery в одной транзакции.
+
+    Изменения одного меню всегда попадают в одну часть, поэтому меню создаётся раньше своих подменю и блюд.
+    """
+    menus_update: list[tuple[UUID, MenuUpdate]] = []
+    menus_create: list[MenuCreate] = []
+    submenus_update: list[tuple[UUID, UUID, SubmenuUpdate]] = []
+    submenus_create: list[tuple[UUID, SubmenuCreate]] = []
+    dishes_update: list[tuple[UUID, UUID, UUID, DishSheetUpdate]] = []
+    dishes_create: list[tuple[UUID, UUID, DishSheetCreate]] = []
+
+    @property
+    def size(self) -> int:
+        changes: tuple[list, ...] = (
+            self.menus_update, self.menus_create, self.submenus_update,
+            self.submenus_create, self.dishes_update, self.dishes_create
+        )
+        return sum(len(items) for items in changes)
+
+    def extend(self, other: 'SheetChunk') -> None:
+        """
+        Добавляет изменения другой части.
+
+        :param other: Часть изменений.
+        """
+        self.menus_update.extend(other.menus_update)
+        self.menus_create.extend(other.menus_create)
+        self.submenus_update.extend(other.submenus_update)
+        self.submenus_create.extend(other.submenus_create)
+        self.dishes_update.extend(other.dishes_update)
+        self.dishes_create.extend(other.dishes_create)
@@ -1,6 +1,8 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.menu.models.base import uuid7
 
 
 class SubmenuBase(BaseModel):
@@ -11,9 +13,21 @@ class SubmenuBase(BaseModel):
 
 class SubmenuCreate(SubmenuBase):
     """Модель данных для создания нового подменю."""
-    id: UUID | None = None
+    id: UUID = Field(default_factory=uuid7)
 
 
 class SubmenuUpdate(SubmenuBase):
     """Модель данных для обновления информации о подменю."""
     pass
+
+
+class SubmenuBulkUpdate(SubmenuUpdate):
+    """Модель данных для обновления подменю в пакетном запросе."""
+    id: UUID
+
+
+class SubmenuBulk(BaseModel):
+    """Модель данных для пакетного создания, обновления и удаления подменю."""
+    create: list[SubmenuCreate] = Field(default_factory=list)
+    update: list[SubmenuBulkUpdate] = Field(default_factory=list)
+    delete: list[UUID] = Field(default_factory=list)
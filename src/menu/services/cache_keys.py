@@ -0,0 +1,108 @@
+from uuid import UUID
+
+from src.config import CACHE_NAMESPACE, CACHE_SCHEMA_VERSION
+
+CACHE_PREFIX: bytes = f'{CACHE_NAMESPACE}:v{CACHE_SCHEMA_VERSION}:'.encode()
+CODE_LENGTH: int = 2
+
+
+def _id_bytes(entity_id: UUID | str) -> bytes:
+    """
+    Возвращает 16 байт UUID для компактного ключа.
+
+    :param entity_id: Идентификатор сущности (UUID или его строковое представление).
+    :return: Байтовое представление UUID.
+    """
+    if isinstance(entity_id, UUID):
+        return entity_id.bytes
+    return UUID(str(entity_id)).bytes
+
+
+class KeyFamily:
+    """Семейство ключей кэша: короткий двухбайтовый код и число идентификаторов в ключе."""
+    __slots__ = ('name', 'code', 'arity')
+
+    def __init__(self, name: str, code: bytes, arity: int = 0):
+        if len(code) != CODE_LENGTH:
+            raise ValueError(f'Key family code must be {CODE_LENGTH} bytes long.')
+        self.name: str = name
+        self.code: bytes = code
+        self.arity: int = arity
+
+    def key(self, *ids: UUID | str) -> bytes:
+        """
+        Строит канонический ключ семейства.
+
+        :param ids: Идентификаторы сущностей в порядке меню, подменю, блюдо.
+        :return: Ключ без префикса пространства имён.
+        """
+        if len(ids) != self.arity:
+            raise ValueError(f"Key family '{self.name}' expects {self.arity} ids, but got {len(ids)}.")
+        return self.code + b''.join(map(_id_bytes, ids))
+
+    def wrap(self, key: bytes) -> bytes:
+        """
+        Строит служебный ключ, производный от другого ключа (блокировка, устаревшее значение).
+
+        :param key: Исходный ключ без префикса.
+        :return: Производный ключ без префикса.
+        """
+        return self.code + key
+
+    def __repr__(self) -> str:
+        return f'KeyFamily({self.name!r}, {self.code!r})'
+
+
+MENUS: KeyFamily = KeyFamily('menus', b'ml')
+FULL_MENU: KeyFamily = KeyFamily('full_menu', b'mf')
+MENU: KeyFamily = KeyFamily('menu', b'md', 1)
+SUBMENUS: KeyFamily = KeyFamily('submenus', b'sl', 1)
+SUBMENU: KeyFamily = KeyFamily('submenu', b'sd', 2)
+DISHES: KeyFamily = KeyFamily('dishes', b'dl', 2)
+DISH: KeyFamily = KeyFamily('dish', b'dd', 3)
+SEARCH: KeyFamily = KeyFamily('search', b'sr')
+
+GENERATION_EPOCH: KeyFamily = KeyFamily('generation_epoch', b'ge')
+GENERATION_GLOBAL: KeyFamily = KeyFamily('generation_global', b'gg')
+GENERATION_MENU: KeyFamily = KeyFamily('generation_menu', b'gm', 1)
+GENERATION_SUBMENU: KeyFamily = KeyFamily('generation_submenu', b'gs', 1)
+
+LOCK: KeyFamily = KeyFamily('lock', b'lk')
+STALE: KeyFamily = KeyFamily('stale', b'st')
+WARM_SCOPES: KeyFamily = KeyFamily('warm_scopes', b'ws')
+WARM_DEBOUNCE: KeyFamily = KeyFamily('warm_debounce', b'wd')
+SYNC_SNAPSHOT: KeyFamily = KeyFamily('sync_snapshot', b'ss')
+SYNC_SCHEDULE: KeyFamily = KeyFamily('sync_schedule', b'sy')
+
+CHANGES: KeyFamily = KeyFamily('changes', b'ch')
+
+KEY_FAMILIES: dict[bytes, KeyFamily] = {
+    family.code: family
+    for family in (
+        MENUS, FULL_MENU, MENU, SUBMENUS, SUBMENU, DISHES, DISH, SEARCH,
+        GENERATION_EPOCH, GENERATION_GLOBAL, GENERATION_MENU, GENERATION_SUBMENU,
+        LOCK, STALE, WARM_SCOPES, WARM_DEBOUNCE, SYNC_SNAPSHOT, SYNC_SCHEDULE, CHANGES,
+    )
+}
+
+
+def namespaced(key: bytes) -> bytes:
+    """
+    Добавляет к ключу префикс пространства имён и версии схемы кэша.
+
+    :param key: Ключ без префикса.
+    :return: Ключ с префиксом.
+    """
+    return CACHE_PREFIX + key
+
+
+def family_of(key: bytes) -> KeyFamily | None:
+    """
+    Определяет семейство ключа.
+
+    :param key: Ключ с префиксом пространства имён или без него.
+    :return: Семейство ключа или None, если ключ не принадлежит текущей схеме кэша.
+    """
+    if key.startswith(CACHE_PREFIX):
+        key = key[len(CACHE_PREFIX):]
+    return KEY_FAMILIES.get(key[:CODE_LENGTH])
@@ -1,21 +1,54 @@
+import asyncio
 import pickle
-from typing import Any
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
+from uuid import UUID
 
 from aioredis import Redis
+from starlette.background import BackgroundTasks
+
+from src.config import CACHE_INVALIDATION, CACHE_STALE_WHILE_REVALIDATE
+from src.database import primary_reads
+from src.menu.services import cache_keys
+from src.menu.services.cache_keys import namespaced
+from src.menu.services.change_feed import (
+    CHANGES_CHANNEL,
+    REFETCH_MESSAGE,
+    change_message,
+)
+from src.metrics import observe_cache
+
+if TYPE_CHECKING:
+    from src.menu.services.cache_warmer import CacheWarmer
+
+LOCK_EXPIRATION_MS: int = 5000
+LOCK_POLL_INTERVAL: float = 0.05
+STALE_EXPIRATION: int = 86400
+
+RELEASE_LOCK_SCRIPT: str = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
 
 
 class CacheService:
-    def __init__(self, redis: Redis):
+    _in_flight: dict[bytes, asyncio.Future] = {}
+
+    def __init__(self, redis: Redis, stale_while_revalidate: bool = CACHE_STALE_WHILE_REVALIDATE):
         self.redis: Redis = redis
+        self.stale_while_revalidate: bool = stale_while_revalidate
 
-    async def get_cache(self, cache_key: str) -> Any | None:
+    async def get_cache(self, cache_key: bytes) -> Any | None:
         """
         Получить данные из кэша по ключу.
 
         :param cache_key: Ключ кэша.
         :return: Сериализованные данные или None, если данных нет в кэше.
         """
-        cached_result: Any = await self.redis.get(cache_key)
+        cached_result: Any = await self.redis.get(namespaced(cache_key))
 
         if cached_result:
             result_data: Any = pickle.loads(cached_result)
@@ -24,7 +57,7 @@ class CacheService:
 
         return result_data
 
-    async def set_cache(self, result: Any, cache_key: str, expiration: int = 3600) -> None:
+    async def set_cache(self, result: Any, cache_key: bytes, expiration: int = 3600) -> None:
         """
         Установить данные в кэш по ключу.
 
@@ -33,7 +66,7 @@ class CacheService:
         :param expiration: Время жизни кэша в секундах (по умолчанию 1 час).
         """
         serialized_result: bytes = pickle.dumps(result)
-        await self.redis.setex(cache_key, expiration, serialized_result)
+        await self.redis.setex(namespaced(cache_key), expiration, serialized_result)
 
     async def delete_cache(self, *args) -> None:
         """
@@ -41,63 +74,269 @@ class CacheService:
 
         :param args: Переменное количество ключей кэша.
         """
-        await self.redis.unlink(*args, 'get_full_menu')
-
-    async def delete_related_cache(self, service: str, **kwargs) -> None:
-        """
-        Удалить связанные сущности из кэша в зависимости от типа сервиса.
-
-        :param service: Тип сервиса ('menu', 'submenu' или 'dish').
-        :param kwargs: Параметры для определения сущности (menu_id, submenu_id, dish_id).
-        """
-        caches_to_delete: list[str] = []
-        patterns: list[str] = []
-        cache_template: str = ''
-
-        match service:
-            case 'menu':
-                cache_template = f'/api/v1/menus/{kwargs["menu_id"]}'
-                cache_template_get_dishes: str = f'get_dishes:{kwargs["menu_id"]}:*'
-
-                caches_to_delete.extend(
-                    [
-                        'get_menus',
-                        f'get_submenus:{kwargs["menu_id"]}',
-                        cache_template
-                    ]
-                )
-                patterns.extend([f'{cache_template}:*', cache_template_get_dishes])
-            case 'submenu':
-                cache_template = f'/api/v1/menus/{kwargs["menu_id"]}/submenus/{kwargs["submenu_id"]}'
-
-                caches_to_delete.extend(
-                    [
-                        'get_menus',
-                        f'get_submenus:{kwargs["menu_id"]}',
-                        f'/api/v1/menus/{kwargs["menu_id"]}',
-                        f'get_dishes:{kwargs["menu_id"]}:{kwargs["submenu_id"]}',
-                        cache_template
-                    ]
-                )
-
-                patterns.append(f'{cache_template}:*')
-            case 'dish':
-                caches_to_delete.extend(
-                    [
-                        'get_menus',
-                        f'/api/v1/menus/{kwargs["menu_id"]}/submenus/{kwargs["submenu_id"]}/dishes/{kwargs["dish_id"]}',
-                        f'/api/v1/menus/{kwargs["menu_id"]}',
-                        f'/api/v1/menus/{kwargs["menu_id"]}/submenus/{kwargs["submenu_id"]}',
-                        f'get_dishes:{kwargs["menu_id"]}:{kwargs["submenu_id"]}',
-                        f'get_submenus:{kwargs["menu_id"]}',
-                    ]
-                )
-
-        caches_to_delete.extend([cache_template, 'get_full_menu'])
-
-        for pattern in patterns:
-            result: Any = await self.redis.scan(match=pattern)
-            for key in result[1]:
-                caches_to_delete.append(key.decode('utf-8'))
-
-        await self.redis.unlink(*caches_to_delete)
+        await self.redis.unlink(*map(namespaced, args))
+
+    async def rename_cache(self, cache_key: bytes, new_cache_key: bytes) -> None:
+        """
+        Переименовать ключ кэша, сохранив его время жизни.
+
+        :param cache_key: Ключ кэша.
+        :param new_cache_key: Новый ключ кэша.
+        """
+        await self.redis.rename(namespaced(cache_key), namespaced(new_cache_key))
+
+    async def acquire_lock(self, key: bytes, expiration: int) -> str | None:
+        """
+        Захватить блокировку Redis без ожидания.
+
+        :param key: Ключ, для которого берётся блокировка.
+        :param expiration: Время жизни блокировки в секундах.
+        :return: Токен владельца или None, если блокировка занята.
+        """
+        token: str = uuid.uuid4().hex
+        if await self.redis.set(namespaced(cache_keys.LOCK.wrap(key)), token, ex=expiration, nx=True):
+            return token
+        return None
+
+    async def release_lock(self, key: bytes, token: str) -> None:
+        """
+        Снять блокировку Redis.
+
+        Блокировку снимает только её владелец: если она истекла и её захватил другой процесс, она сохранится.
+
+        :param key: Ключ, для которого взята блокировка.
+        :param token: Токен владельца.
+        """
+        await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, namespaced(cache_keys.LOCK.wrap(key)), token)
+
+    @staticmethod
+    def _generation_scopes(menu_id: UUID | str | None = None, submenu_id: UUID | str | None = None) -> list[bytes]:
+        """
+        Возвращает ключи счётчиков поколений, от которых зависит запись кэша.
+
+        Все записи зависят от счётчика эпохи (см. invalidate_all). Записи без идентификаторов (списки меню,
+        полное меню) зависят от глобального счётчика, записи уровня меню - от счётчика меню,
+        записи уровня подменю - от счётчиков меню и подменю.
+
+        :param menu_id: Уникальный идентификатор меню.
+        :param submenu_id: Уникальный идентификатор подменю.
+        :return: Список ключей счётчиков поколений.
+        """
+        epoch: bytes = namespaced(cache_keys.GENERATION_EPOCH.key())
+        if menu_id is None:
+            return [epoch, namespaced(cache_keys.GENERATION_GLOBAL.key())]
+
+        scopes: list[bytes] = [epoch, namespaced(cache_keys.GENERATION_MENU.key(menu_id))]
+        if submenu_id is not None:
+            scopes.append(namespaced(cache_keys.GENERATION_SUBMENU.key(submenu_id)))
+        return scopes
+
+    async def versioned_key(
+            self,
+            cache_key: bytes,
+            menu_id: UUID | str | None = None,
+            submenu_id: UUID | str | None = None
+    ) -> bytes:
+        """
+        Добавляет к ключу кэша текущие значения счётчиков поколений его областей.
+
+        :param cache_key: Базовый ключ кэша.
+        :param menu_id: Уникальный идентификатор меню.
+        :param submenu_id: Уникальный идентификатор подменю.
+        :return: Ключ кэша с номерами поколений.
+        """
+        generations: list[bytes | None] = await self.redis.mget(self._generation_scopes(menu_id, submenu_id))
+        return cache_key + b'@' + b'.'.join(generation or b'0' for generation in generations)
+
+    async def invalidate(self, menu_id: UUID | str | None = None, submenu_id: UUID | str | None = None) -> None:
+        """
+        Инвалидировать кэш, увеличив счётчики поколений затронутых областей.
+
+        Глобальный счётчик увеличивается всегда, счётчики меню и подменю - если переданы их идентификаторы.
+        Старые записи становятся недостижимыми и удаляются Redis по истечении TTL.
+
+        :param menu_id: Уникальный идентификатор меню.
+        :param submenu_id: Уникальный идентификатор подменю.
+        """
+        await self.invalidate_scopes([(menu_id, submenu_id)])
+
+    async def invalidate_scopes(self, scopes: Iterable[tuple[UUID | str | None, UUID | str | None]]) -> None:
+        """
+        Инвалидировать кэш сразу для нескольких областей одной транзакцией Redis.
+
+        В той же транзакции изменения публикуются в канал подписчиков (change_feed): клиент,
+        получивший событие, гарантированно прочитает уже инвалидированный кэш.
+
+        :param scopes: Пары (menu_id, submenu_id) изменённых сущностей.
+        """
+        scopes = list(scopes)
+        generations: dict[bytes, None] = {cache_keys.GENERATION_GLOBAL.key(): None}
+        for menu_id, submenu_id in scopes:
+            if menu_id is not None:
+                generations[cache_keys.GENERATION_MENU.key(menu_id)] = None
+            if submenu_id is not None:
+                generations[cache_keys.GENERATION_SUBMENU.key(submenu_id)] = None
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for generation in generations:
+                pipe.incr(namespaced(generation))
+            pipe.publish(CHANGES_CHANNEL, change_message(scopes))
+            await pipe.execute()
+
+    async def invalidate_all(self) -> None:
+        """
+        Инвалидировать весь кэш, увеличив счётчик эпохи.
+
+        Используется, когда часть уведомлений об изменениях могла быть потеряна
+        (например, после переподключения слушателя NOTIFY). Подписчики получают сигнал перезапросить данные.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(namespaced(cache_keys.GENERATION_EPOCH.key()))
+            pipe.publish(CHANGES_CHANNEL, REFETCH_MESSAGE)
+            await pipe.execute()
+
+    async def get_or_set(
+            self,
+            cache_key: bytes,
+            loader: Callable[[], Awaitable[Any]],
+            expiration: int = 3600,
+            stale_key: bytes | None = None
+    ) -> Any:
+        """
+        Получить данные из кэша или вычислить их, защищаясь от одновременных промахов.
+
+        Внутри процесса одновременные запросы одного ключа ждут одно вычисление, между процессами
+        вычисление выполняет только владелец короткой блокировки в Redis. Если включён режим
+        stale-while-revalidate и передан stale_key, ожидающие получают предыдущее значение.
+        Данные для кэша читаются из основной базы, а не с реплики.
+
+        :param cache_key: Ключ кэша.
+        :param loader: Функция, вычисляющая данные при промахе.
+        :param expiration: Время жизни кэша в секундах (по умолчанию 1 час).
+        :param stale_key: Базовый ключ (без поколений), под которым хранится предыдущее значение
+        для режима stale-while-revalidate.
+        :return: Данные из кэша или результат loader.
+        """
+        started: float = time.perf_counter()
+        result_cache: Any | None = await self.get_cache(cache_key)
+        if result_cache is not None:
+            observe_cache(cache_key, 'hit', started)
+            return result_cache
+
+        token = primary_reads.set(True)
+        try:
+            return await self._get_or_load(cache_key, loader, expiration, stale_key)
+        finally:
+            primary_reads.reset(token)
+            observe_cache(cache_key, 'miss', started)
+
+    async def _get_or_load(
+            self,
+            cache_key: bytes,
+            loader: Callable[[], Awaitable[Any]],
+            expiration: int,
+            stale_key: bytes | None
+    ) -> Any:
+        """
+        Дождаться вычисления, уже начатого в этом процессе, либо начать его.
+
+        :param cache_key: Ключ кэша.
+        :param loader: Функция, вычисляющая данные при промахе.
+        :param expiration: Время жизни кэша в секундах.
+        :param stale_key: Базовый ключ для режима stale-while-revalidate.
+        :return: Результат loader.
+        """
+        if not self.stale_while_revalidate:
+            stale_key = None
+        elif stale_key is not None:
+            stale_key = cache_keys.STALE.wrap(stale_key)
+
+        in_flight: asyncio.Future | None = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            if stale_key is not None:
+                stale: Any | None = await self.get_cache(stale_key)
+                if stale is not None:
+                    return stale
+            return await asyncio.shield(in_flight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            result: Any = await self._load(cache_key, loader, expiration, stale_key)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._in_flight.pop(cache_key, None)
+
+        return result
+
+    async def _load(
+            self,
+            cache_key: bytes,
+            loader: Callable[[], Awaitable[Any]],
+            expiration: int,
+            stale_key: bytes | None
+    ) -> Any:
+        """
+        Вычислить данные под блокировкой Redis либо дождаться вычисления в другом процессе.
+
+        :param cache_key: Ключ кэша.
+        :param loader: Функция, вычисляющая данные при промахе.
+        :param expiration: Время жизни кэша в секундах.
+        :param stale_key: Ключ предыдущего значения или None.
+        :return: Вычисленные или полученные из кэша данные.
+        """
+        lock_key: bytes = namespaced(cache_keys.LOCK.wrap(cache_key))
+        token: str = uuid.uuid4().hex
+
+        if await self.redis.set(lock_key, token, px=LOCK_EXPIRATION_MS, nx=True):
+            try:
+                result: Any = await loader()
+                await self.set_cache(result, cache_key, expiration)
+                if stale_key is not None:
+                    await self.set_cache(result, stale_key, STALE_EXPIRATION)
+                return result
+            finally:
+                await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+        if stale_key is not None:
+            stale: Any | None = await self.get_cache(stale_key)
+            if stale is not None:
+                return stale
+
+        deadline: float = time.monotonic() + LOCK_EXPIRATION_MS / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            result_cache: Any | None = await self.get_cache(cache_key)
+            if result_cache is not None:
+                return result_cache
+
+        return await loader()
+
+
+def invalidate_in_background(
+        background_tasks: BackgroundTasks,
+        cache_service: CacheService,
+        cache_warmer: 'CacheWarmer',
+        scopes: Iterable[tuple[UUID | None, UUID | None]]
+) -> None:
+    """
+    Запланировать инвалидацию и прогрев кэша после ответа на пишущий запрос.
+
+    В режиме CACHE_INVALIDATION=notify кэш инвалидирует слушатель уведомлений PostgreSQL
+    (InvalidationListener), поэтому запрос ничего не планирует.
+
+    :param background_tasks: Фоновые задачи запроса.
+    :param cache_service: Сервис кэша.
+    :param cache_warmer: Сервис прогрева кэша.
+    :param scopes: Пары (menu_id, submenu_id) изменённых сущностей.
+    """
+    if CACHE_INVALIDATION != 'inline':
+        return
+
+    background_tasks.add_task(cache_service.invalidate_scopes, scopes)
+    background_tasks.add_task(cache_warmer.schedule_scopes, scopes)
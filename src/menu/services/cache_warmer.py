@@ -0,0 +1,110 @@
+import asyncio
+from typing import Iterable
+from uuid import UUID
+
+from aioredis import Redis
+from starlette.background import BackgroundTasks
+from starlette.exceptions import HTTPException
+
+from src.config import CACHE_WARM_DEBOUNCE, CACHE_WARMING
+from src.database import USE_PRIMARY, async_session_maker
+from src.menu.repositories.dish_repository import DishRepository
+from src.menu.repositories.menu_repository import MenuRepository
+from src.menu.repositories.submenu_repository import SubmenuRepository
+from src.menu.services.cache_keys import WARM_DEBOUNCE, WARM_SCOPES, namespaced
+from src.menu.services.dish_service import DishService
+from src.menu.services.menu_service import MenuService
+from src.menu.services.submenu_service import SubmenuService
+
+WARM_SCOPES_KEY: bytes = namespaced(WARM_SCOPES.key())
+WARM_DEBOUNCE_KEY: bytes = namespaced(WARM_DEBOUNCE.key())
+
+Scope = tuple[UUID | None, UUID | None]
+
+
+class CacheWarmer:
+    _tasks: set[asyncio.Task] = set()
+
+    def __init__(self, redis: Redis):
+        self.redis: Redis = redis
+
+    async def schedule(self, menu_id: UUID | None = None, submenu_id: UUID | None = None) -> None:
+        """
+        Запланировать прогрев кэша после записи.
+
+        Области всех записей, пришедших за время задержки, накапливаются в Redis, и прогрев
+        выполняется один раз для всей пачки.
+
+        :param menu_id: Идентификатор изменённого меню.
+        :param submenu_id: Идентификатор изменённого подменю.
+        """
+        await self.schedule_scopes([(menu_id, submenu_id)])
+
+    async def schedule_scopes(self, scopes: Iterable[Scope]) -> None:
+        """
+        Запланировать прогрев кэша сразу для нескольких областей.
+
+        :param scopes: Пары (menu_id, submenu_id) изменённых сущностей.
+        """
+        members: set[str] = {f'{menu_id or ""}:{submenu_id or ""}' for menu_id, submenu_id in scopes}
+        if not CACHE_WARMING or not members:
+            return
+
+        await self.redis.sadd(WARM_SCOPES_KEY, *members)
+        debounce_ms: int = int(CACHE_WARM_DEBOUNCE * 1000)
+        if await self.redis.set(WARM_DEBOUNCE_KEY, 1, px=debounce_ms * 10, nx=True):
+            task: asyncio.Task = asyncio.create_task(self._warm_later())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _warm_later(self) -> None:
+        """
+        Дождаться окончания пачки записей и прогреть все накопленные области.
+        """
+        await asyncio.sleep(CACHE_WARM_DEBOUNCE)
+        await self.redis.delete(WARM_DEBOUNCE_KEY)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.smembers(WARM_SCOPES_KEY)
+            pipe.delete(WARM_SCOPES_KEY)
+            members, _ = await pipe.execute()
+
+        scopes: set[Scope] = set()
+        for member in members:
+            menu_id, submenu_id = member.decode('utf-8').split(':')
+            scopes.add((UUID(menu_id) if menu_id else None, UUID(submenu_id) if submenu_id else None))
+
+        await self.warm(scopes)
+
+    async def warm(self, scopes: Iterable[Scope] = ()) -> None:
+        """
+        Вычислить и сохранить в кэш списки меню, полное меню и записи затронутых областей.
+
+        :param scopes: Пары (menu_id, submenu_id) изменённых сущностей.
+        """
+        async with async_session_maker() as session:
+            session.info[USE_PRIMARY] = True
+            background_tasks: BackgroundTasks = BackgroundTasks()
+            menu_service: MenuService = MenuService(MenuRepository(session), self.redis, background_tasks, self)
+            submenu_service: SubmenuService = SubmenuService(
+                SubmenuRepository(session),
+                self.redis,
+                background_tasks,
+                self
+            )
+            dish_service: DishService = DishService(DishRepository(session), self.redis, background_tasks, self)
+
+            await menu_service.get_menus()
+            await menu_service.get_full_menu()
+
+            for menu_id, submenu_id in scopes:
+                if menu_id is None:
+                    continue
+                try:
+                    await menu_service.get_menu(menu_id)
+                    await submenu_service.get_submenus(menu_id)
+                    if submenu_id is not None:
+                        await submenu_service.get_submenu_detail(menu_id, submenu_id)
+                        await dish_service.get_dishes(menu_id, submenu_id)
+                except HTTPException:
+                    continue
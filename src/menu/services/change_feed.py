@@ -0,0 +1,200 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+
+from aioredis import from_url
+from aioredis.exceptions import RedisError
+
+from src.config import CHANGE_FEED_HEARTBEAT, CHANGE_FEED_MAX_PENDING
+from src.database import REDIS_URL
+from src.menu.services.cache_keys import CHANGES, namespaced
+from src.metrics import CHANGE_FEED_OVERFLOWS, CHANGE_FEED_SUBSCRIBERS
+
+CHANGES_CHANNEL: bytes = namespaced(CHANGES.key())
+REFETCH_MESSAGE: bytes = b'{"type":"refetch"}'
+RECONNECT_INTERVAL: float = 1.0
+READY_TIMEOUT: float = 5.0
+
+REFETCH_EVENT: bytes = b'event: refetch\ndata: {}\n\n'
+HEARTBEAT_EVENT: bytes = b': heartbeat\n\n'
+
+
+def change_message(scopes: Iterable[tuple[UUID | str | None, UUID | str | None]]) -> bytes:
+    """
+    Кодирует изменённые области для публикации в канал изменений.
+
+    :param scopes: Пары (menu_id, submenu_id) изменённых сущностей.
+    :return: JSON-сообщение.
+    """
+    return json.dumps(
+        {
+            'type': 'change',
+            'scopes': [
+                [str(menu_id) if menu_id is not None else None, str(submenu_id) if submenu_id is not None else None]
+                for menu_id, submenu_id in scopes
+            ]
+        },
+        separators=(',', ':')
+    ).encode()
+
+
+def change_event(scopes: list[list[str | None]]) -> bytes:
+    """
+    Кодирует изменённые области в событие Server-Sent Events.
+
+    :param scopes: Пары [menu_id, submenu_id] изменённых сущностей.
+    :return: Событие SSE.
+    """
+    return b'event: change\ndata: ' + json.dumps({'scopes': scopes}, separators=(',', ':')).encode() + b'\n\n'
+
+
+class ChangeSubscription:
+    """Подписка клиента на изменения всех меню (menu_id=None) или одного меню."""
+    __slots__ = ('menu_id', 'queue')
+
+    def __init__(self, menu_id: str | None, max_pending: int):
+        self.menu_id: str | None = menu_id
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(max_pending)
+
+    def push(self, event: bytes) -> None:
+        """
+        Добавляет событие в очередь подписчика.
+
+        Если клиент не успевает читать события и очередь заполнена, накопленные события
+        заменяются одним сигналом refetch: клиенту всё равно нужно перезапросить данные,
+        а память процесса на медленного клиента остаётся ограниченной.
+
+        :param event: Событие SSE.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            CHANGE_FEED_OVERFLOWS.inc()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(REFETCH_EVENT)
+
+
+class ChangeHub:
+    """
+    Раздаёт изменения меню подписчикам процесса.
+
+    Процесс держит одну подписку на канал Redis, пока у него есть хотя бы один подписчик,
+    и раскладывает сообщения по очередям подписчиков. Публикуют изменения все процессы
+    (CacheService.invalidate_scopes), поэтому события доходят до клиентов любого воркера.
+    """
+
+    def __init__(self, max_pending: int = CHANGE_FEED_MAX_PENDING):
+        self.max_pending: int = max_pending
+        self.ready: asyncio.Event = asyncio.Event()
+        self._subscriptions: set[ChangeSubscription] = set()
+        self._task: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, menu_id: UUID | None = None) -> AsyncIterator[ChangeSubscription]:
+        """
+        Подписаться на изменения.
+
+        :param menu_id: Идентификатор меню или None для изменений всех меню.
+        :return: Подписка, из очереди которой читаются события SSE.
+        """
+        subscription: ChangeSubscription = ChangeSubscription(
+            str(menu_id) if menu_id is not None else None,
+            self.max_pending
+        )
+        self._subscriptions.add(subscription)
+        CHANGE_FEED_SUBSCRIBERS.inc()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            CHANGE_FEED_SUBSCRIBERS.dec()
+            if not self._subscriptions and self._task is not None:
+                task, self._task = self._task, None
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    async def events(self, menu_id: UUID | None = None) -> AsyncIterator[bytes]:
+        """
+        Поток событий Server-Sent Events для одного клиента.
+
+        Первым событием после подписки на канал отправляется refetch: клиент загружает данные и дальше
+        получает только изменения. При простое раз в CHANGE_FEED_HEARTBEAT секунд отправляется комментарий,
+        чтобы прокси не закрывали соединение.
+
+        :param menu_id: Идентификатор меню или None для изменений всех меню.
+        :return: Асинхронный итератор событий SSE.
+        """
+        async with self.subscribe(menu_id) as subscription:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.ready.wait(), READY_TIMEOUT)
+            yield REFETCH_EVENT
+
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), CHANGE_FEED_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_EVENT
+
+    def dispatch(self, message: bytes) -> None:
+        """
+        Разослать сообщение канала изменений подписчикам.
+
+        Подписчики одного меню получают только его области; событие для каждого меню кодируется один раз.
+
+        :param message: Сообщение канала (см. change_message).
+        """
+        data: dict = json.loads(message)
+        if data['type'] != 'change':
+            self._broadcast(REFETCH_EVENT)
+            return
+
+        scopes: list[list[str | None]] = data['scopes']
+        events: dict[str | None, bytes | None] = {None: change_event(scopes)}
+        for subscription in self._subscriptions:
+            if subscription.menu_id not in events:
+                menu_scopes: list[list[str | None]] = [scope for scope in scopes if scope[0] == subscription.menu_id]
+                events[subscription.menu_id] = change_event(menu_scopes) if menu_scopes else None
+
+            event: bytes | None = events[subscription.menu_id]
+            if event is not None:
+                subscription.push(event)
+
+    def _broadcast(self, event: bytes) -> None:
+        for subscription in self._subscriptions:
+            subscription.push(event)
+
+    async def _run(self) -> None:
+        """
+        Читать канал изменений, переподключаясь к Redis при обрыве.
+
+        Сообщения, опубликованные во время обрыва, потеряны, поэтому после переподключения
+        подписчики получают сигнал refetch.
+        """
+        connected_before: bool = False
+        while True:
+            try:
+                async with await from_url(REDIS_URL) as redis:
+                    async with redis.pubsub() as pubsub:
+                        await pubsub.subscribe(CHANGES_CHANNEL)
+                        async for message in pubsub.listen():
+                            if message['type'] == 'subscribe':
+                                if connected_before:
+                                    self._broadcast(REFETCH_EVENT)
+                                connected_before = True
+                                self.ready.set()
+                            elif message['type'] == 'message':
+                                self.dispatch(message['data'])
+            except (OSError, RedisError) as e:
+                print('Change feed connection error: ', e)
+            finally:
+                self.ready.clear()
+            await asyncio.sleep(RECONNECT_INTERVAL)
+
+
+change_hub: ChangeHub = ChangeHub()
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from src.config import CHANGE_LOG_RETENTION
+from src.menu.models.change_log_model import ChangesModel
+from src.menu.repositories.change_log_repository import ChangeLogRepository
+
+
+class ChangeLogService:
+    def __init__(self, change_log_repository: ChangeLogRepository):
+        self.change_log_repository: ChangeLogRepository = change_log_repository
+
+    async def get_changes(self, since: int | None) -> ChangesModel:
+        """
+        Получить изменения каталога с указанной версии.
+
+        :param since: Версия из предыдущего ответа или None для первой синхронизации.
+        :return: Модель изменений.
+        """
+        return await self.change_log_repository.get_changes(since)
+
+    async def compact(self, retention: timedelta = CHANGE_LOG_RETENTION) -> int:
+        """
+        Удалить записи журнала изменений старше retention.
+
+        :param retention: Срок хранения записей.
+        :return: Количество удалённых записей.
+        """
+        return await self.change_log_repository.compact(retention)
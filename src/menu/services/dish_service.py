@@ -1,20 +1,33 @@
-from typing import Any
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from aioredis import Redis
-from fastapi import BackgroundTasks
+from starlette import status
+from starlette.background import BackgroundTasks
 
+from src.menu.models.bulk_model import BulkItemResult, BulkResult
 from src.menu.models.dish_model import DishModel
 from src.menu.repositories.dish_repository import DishRepository
-from src.menu.schemas.dish_schema import DishCreate, DishUpdate
-from src.menu.services.cache_service import CacheService
+from src.menu.schemas.dish_schema import DishBulk, DishCreate, DishUpdate
+from src.menu.services.cache_keys import DISH, DISHES
+from src.menu.services.cache_service import CacheService, invalidate_in_background
+
+if TYPE_CHECKING:
+    from src.menu.services.cache_warmer import CacheWarmer
 
 
 class DishService:
-    def __init__(self, dish_repository: DishRepository, redis: Redis, background_tasks: BackgroundTasks):
+    def __init__(
+            self,
+            dish_repository: DishRepository,
+            redis: Redis,
+            background_tasks: BackgroundTasks,
+            cache_warmer: 'CacheWarmer'
+    ):
         self.dish_repository = dish_repository
         self.cache_service: CacheService = CacheService(redis)
         self.background_tasks: BackgroundTasks = background_tasks
+        self.cache_warmer: 'CacheWarmer' = cache_warmer
 
     async def get_dishes(self, menu_id: UUID, submenu_id: UUID) -> list[DishModel]:
         """
@@ -24,45 +37,35 @@ class DishService:
         :param submenu_id: Идентификатор подменю.
         :return: Список блюд подменю.
         """
-        cache_key: str = f'get_dishes:{menu_id}:{submenu_id}'
-
-        result_cache: list[DishModel] | None = await self.cache_service.get_cache(cache_key)
-        if result_cache:
-            for index, dish in enumerate(result_cache):
-                discount: Any = await self.cache_service.get_cache(f'dish:{dish.id}')
-                if discount:
-                    result_cache[index].price = discount
-            return result_cache
-
-        result: list[DishModel] = await self.dish_repository.get_dishes(submenu_id)
-        for index, dish in enumerate(result):
-            discount = await self.cache_service.get_cache(f'dish:{dish.id}')
-            if discount:
-                result[index].price = discount
-
-        await self.cache_service.set_cache(cache_key=cache_key, result=result)
-        return result
+        cache_key: bytes = await self.cache_service.versioned_key(
+            DISHES.key(menu_id, submenu_id),
+            menu_id=menu_id,
+            submenu_id=submenu_id
+        )
+
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.dish_repository.get_dishes(submenu_id)
+        )
 
-    async def get_dish(self, url: str, dish_id: UUID) -> DishModel:
+    async def get_dish(self, menu_id: UUID, submenu_id: UUID, dish_id: UUID) -> DishModel:
         """
         Получить информацию о блюде по его идентификатору.
 
-        :param url: URL запроса.
+        :param menu_id: Идентификатор меню.
+        :param submenu_id: Идентификатор подменю.
         :param dish_id: Идентификатор блюда.
         :return: Модель блюда.
         """
-        result_cache: DishModel | None = await self.cache_service.get_cache(url)
-        discount: Any | None = await self.cache_service.get_cache(f'dish:{dish_id}')
-        if result_cache:
-            if discount:
-                result_cache.price = discount
-            return result_cache
-
-        result: DishModel = await self.dish_repository.get_dish(dish_id)
-        if discount:
-            result.price = discount
-        await self.cache_service.set_cache(cache_key=url, result=result)
-        return result
+        cache_key: bytes = await self.cache_service.versioned_key(
+            DISH.key(menu_id, submenu_id, dish_id),
+            menu_id=menu_id,
+            submenu_id=submenu_id
+        )
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.dish_repository.get_dish(dish_id)
+        )
 
     async def create_dish(self, menu_id: UUID, submenu_id: UUID, dish_update: DishCreate) -> DishModel:
         """
@@ -74,14 +77,7 @@ class DishService:
         :return: Модель созданного блюда.
         """
         result: DishModel = await self.dish_repository.create_dish(submenu_id, dish_update)
-        self.background_tasks.add_task(
-            self.cache_service.delete_cache,
-            f'/api/v1/menus/{menu_id}',
-            f'/api/v1/menus/{menu_id}/submenus/{submenu_id}',
-            f'get_dishes:{menu_id}:{submenu_id}',
-            f'get_submenus:{menu_id}',
-            'get_menus'
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, submenu_id)])
         return result
 
     async def update_dish(
@@ -101,11 +97,7 @@ class DishService:
         :return: Модель обновленного блюда.
         """
         result: DishModel = await self.dish_repository.update_dish(dish_id, dish_update)
-        self.background_tasks.add_task(
-            self.cache_service.delete_cache,
-            f'get_dishes:{menu_id}:{submenu_id}',
-            f'/api/v1/menus/{menu_id}/submenus/{submenu_id}/dishes/{dish_id}'
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, submenu_id)])
         return result
 
     async def delete_dish(self, menu_id: UUID, submenu_id: UUID, dish_id: UUID) -> DishModel:
@@ -118,11 +110,26 @@ class DishService:
         :return: Модель удаленного блюда.
         """
         result: DishModel = await self.dish_repository.delete_dish(dish_id)
-        self.background_tasks.add_task(
-            self.cache_service.delete_related_cache,
-            'dish',
-            menu_id=menu_id,
-            submenu_id=submenu_id,
-            dish_id=dish_id
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, submenu_id)])
         return result
+
+    async def bulk_dishes(self, menu_id: UUID, submenu_id: UUID, dish_bulk: DishBulk) -> BulkResult:
+        """
+        Пакетно создать, обновить и удалить блюда подменю.
+
+        Кэш инвалидируется один раз на весь запрос.
+
+        :param menu_id: Идентификатор меню.
+        :param submenu_id: Идентификатор подменю.
+        :param dish_bulk: Данные пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        """
+        results: list[BulkItemResult] = await self.dish_repository.bulk_dishes(submenu_id, dish_bulk)
+        if any(result.status_code < status.HTTP_400_BAD_REQUEST for result in results):
+            invalidate_in_background(
+                self.background_tasks,
+                self.cache_service,
+                self.cache_warmer,
+                [(menu_id, submenu_id)]
+            )
+        return BulkResult(results=results)
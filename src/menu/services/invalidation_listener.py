@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from aioredis import Redis
+
+from src.config import (
+    CACHE_INVALIDATION_BATCH_INTERVAL,
+    DB_HOST,
+    DB_NAME,
+    DB_PASS,
+    DB_PORT,
+    DB_USER,
+)
+from src.menu.services.cache_service import CacheService
+from src.menu.services.cache_warmer import CacheWarmer, Scope
+
+CHANNEL: str = 'menu_changes'
+KEEPALIVE_INTERVAL: float = 30.0
+RECONNECT_INTERVAL: float = 1.0
+# Ключ advisory-блокировки, которую держит единственный активный слушатель.
+LEADER_LOCK_KEY: int = 0x6D656E75
+LEADER_RETRY_INTERVAL: float = 5.0
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def parse_payload(payload: str) -> Scope:
+    """
+    Разбирает полезную нагрузку уведомления триггера notify_menu_change.
+
+    :param payload: Строка вида '<таблица>:<menu_id>:<submenu_id>'.
+    :return: Пара (menu_id, submenu_id) изменённой сущности.
+    """
+    _, menu_id, submenu_id = payload.split(':')
+    return UUID(menu_id) if menu_id else None, UUID(submenu_id) if submenu_id else None
+
+
+class InvalidationListener:
+    """
+    Слушает уведомления PostgreSQL об изменениях меню, подменю и блюд (LISTEN menu_changes)
+    и пачками инвалидирует и прогревает кэш.
+
+    Уведомления отправляют триггеры таблиц, поэтому кэш инвалидируется при любой записи:
+    через API, синхронизацию с Google Sheets, каскадное удаление или SQL вручную.
+
+    Слушатель запускается в каждом воркере приложения, но уведомления обрабатывает только один - владелец
+    advisory-блокировки PostgreSQL LEADER_LOCK_KEY; остальные ждут, пока она освободится. Блокировка
+    принадлежит соединению, поэтому при падении активного слушателя её сразу получает другой.
+    """
+
+    def __init__(self, redis: Redis, batch_interval: float = CACHE_INVALIDATION_BATCH_INTERVAL):
+        self.redis: Redis = redis
+        self.batch_interval: float = batch_interval
+        self.cache_service: CacheService = CacheService(redis)
+        self.cache_warmer: CacheWarmer = CacheWarmer(redis)
+        self.listening: asyncio.Event = asyncio.Event()
+        self._scopes: set[Scope] = set()
+        self._pending: asyncio.Event = asyncio.Event()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            self._scopes.add(parse_payload(payload))
+        except ValueError:
+            logger.warning('Invalid menu change notification: %s', payload)
+            return
+        self._pending.set()
+
+    async def flush(self) -> None:
+        """
+        Инвалидировать кэш для накопленных областей одной транзакцией Redis и запланировать прогрев.
+
+        При ошибке Redis области возвращаются в очередь и будут инвалидированы при следующей попытке.
+        """
+        scopes, self._scopes = self._scopes, set()
+        self._pending.clear()
+        if not scopes:
+            return
+
+        try:
+            await self.cache_service.invalidate_scopes(scopes)
+        except Exception:
+            self._scopes |= scopes
+            self._pending.set()
+            raise
+        await self.cache_warmer.schedule_scopes(scopes)
+
+    async def run(self) -> None:
+        """
+        Слушать уведомления, пока задача не будет отменена, переподключаясь при обрыве соединения.
+
+        После переподключения, а также если слушатель стал активным после ожидания блокировки, уведомления
+        за это время потеряны, поэтому инвалидируется весь кэш.
+        """
+        connected_before: bool = False
+        while True:
+            try:
+                connection: asyncpg.Connection = await asyncpg.connect(
+                    host=DB_HOST,
+                    port=DB_PORT,
+                    user=DB_USER,
+                    password=DB_PASS,
+                    database=DB_NAME
+                )
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning('Invalidation listener connection error: %s', e)
+                await asyncio.sleep(RECONNECT_INTERVAL)
+                continue
+
+            try:
+                waited: bool = await self._wait_for_leadership(connection)
+                await connection.add_listener(CHANNEL, self._on_notification)
+                if connected_before or waited:
+                    await self.cache_service.invalidate_all()
+                connected_before = True
+                self.listening.set()
+                await self._listen(connection)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning('Invalidation listener error: %s', e)
+            finally:
+                self.listening.clear()
+                await connection.close(timeout=1)
+
+            await asyncio.sleep(RECONNECT_INTERVAL)
+
+    @staticmethod
+    async def _wait_for_leadership(connection: asyncpg.Connection) -> bool:
+        """
+        Дождаться advisory-блокировки активного слушателя.
+
+        :param connection: Соединение, которому будет принадлежать блокировка.
+        :return: True, если блокировку держал другой слушатель и пришлось ждать.
+        """
+        waited: bool = False
+        while not await connection.fetchval('SELECT pg_try_advisory_lock($1)', LEADER_LOCK_KEY):
+            waited = True
+            await asyncio.sleep(LEADER_RETRY_INTERVAL)
+        return waited
+
+    async def _listen(self, connection: asyncpg.Connection) -> None:
+        """
+        Сбрасывать накопленные уведомления раз в batch_interval и проверять соединение при простое.
+
+        :param connection: Соединение с подпиской на канал.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._pending.wait(), KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                await connection.execute('SELECT 1')
+                continue
+
+            await asyncio.sleep(self.batch_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning('Cache invalidation error: %s', e)
@@ -1,21 +1,34 @@
-from typing import Any
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from aioredis import Redis
-from fastapi import BackgroundTasks
+from starlette import status
+from starlette.background import BackgroundTasks
 
+from src.menu.models.bulk_model import BulkItemResult, BulkResult
 from src.menu.models.menu_model import MenuDetailModel, MenuModel
-from src.menu.models.models_for_full_menu import AllMenuModel, MenuInfo
+from src.menu.models.models_for_full_menu import AllMenuModel
 from src.menu.repositories.menu_repository import MenuRepository
-from src.menu.schemas.menu_schema import MenuCreate, MenuUpdate
-from src.menu.services.cache_service import CacheService
+from src.menu.schemas.menu_schema import MenuBulk, MenuCreate, MenuUpdate
+from src.menu.services.cache_keys import FULL_MENU, MENU, MENUS
+from src.menu.services.cache_service import CacheService, invalidate_in_background
+
+if TYPE_CHECKING:
+    from src.menu.services.cache_warmer import CacheWarmer
 
 
 class MenuService:
-    def __init__(self, menu_repository: MenuRepository, redis: Redis, background_tasks: BackgroundTasks):
+    def __init__(
+            self,
+            menu_repository: MenuRepository,
+            redis: Redis,
+            background_tasks: BackgroundTasks,
+            cache_warmer: 'CacheWarmer'
+    ):
         self.menu_repository = menu_repository
         self.cache_service: CacheService = CacheService(redis)
         self.background_tasks: BackgroundTasks = background_tasks
+        self.cache_warmer: 'CacheWarmer' = cache_warmer
 
     async def get_menus(self) -> list[MenuDetailModel]:
         """
@@ -23,14 +36,8 @@ class MenuService:
 
         :return: Список моделей меню.
         """
-        result_cache: list[MenuDetailModel] | None = await self.cache_service.get_cache('get_menus')
-        if result_cache:
-            return result_cache
-
-        result: list[MenuDetailModel] = await self.menu_repository.get_menus()
-
-        await self.cache_service.set_cache(cache_key='get_menus', result=result)
-        return result
+        cache_key: bytes = await self.cache_service.versioned_key(MENUS.key())
+        return await self.cache_service.get_or_set(cache_key, self.menu_repository.get_menus, stale_key=MENUS.key())
 
     async def get_full_menu(self) -> list[AllMenuModel]:
         """
@@ -38,22 +45,12 @@ class MenuService:
 
         :return: Список моделей данных AllMenuModel.
         """
-        result_cache: list[AllMenuModel] | None = await self.cache_service.get_cache('get_full_menu')
-        if result_cache:
-            return result_cache
-
-        results = await self.menu_repository.get_full_menu()
-
-        for result in results:
-            menu: MenuInfo = result.menu
-            for submenu in menu.submenus:
-                for dish in submenu.dishes:
-                    cache: Any | None = await self.cache_service.get_cache(f'dish:{dish.id}')
-                    if cache:
-                        dish.price = cache
-
-        await self.cache_service.set_cache(cache_key='get_full_menu', result=results)
-        return results
+        cache_key: bytes = await self.cache_service.versioned_key(FULL_MENU.key())
+        return await self.cache_service.get_or_set(
+            cache_key,
+            self.menu_repository.get_full_menu,
+            stale_key=FULL_MENU.key()
+        )
 
     async def create_menu(self, menu_create: MenuCreate) -> MenuModel:
         """
@@ -62,37 +59,31 @@ class MenuService:
         :param menu_create: Данные для создания меню.
         :return: Модель созданного меню.
         """
-        self.background_tasks.add_task(self.cache_service.delete_cache, 'get_menus')
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(None, None)])
         return await self.menu_repository.create_menu(menu_create)
 
-    async def get_menu(self, url: str, menu_id: UUID) -> MenuDetailModel:
+    async def get_menu(self, menu_id: UUID) -> MenuDetailModel:
         """
         Получить детальную информацию о меню.
 
-        :param url: URL запроса.
         :param menu_id: Идентификатор меню.
         :return: Модель детальной информации о меню.
         """
-        result_cache: MenuDetailModel | None = await self.cache_service.get_cache(url)
-
-        if result_cache:
-            return result_cache
+        cache_key: bytes = await self.cache_service.versioned_key(MENU.key(menu_id), menu_id=menu_id)
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.menu_repository.get_menu_detail(menu_id)
+        )
 
-        result: MenuDetailModel = await self.menu_repository.get_menu_detail(menu_id)
-        await self.cache_service.set_cache(cache_key=url, result=result)
-
-        return result
-
-    async def update_menu(self, url: str, menu_id: UUID, menu_update: MenuUpdate) -> MenuModel:
+    async def update_menu(self, menu_id: UUID, menu_update: MenuUpdate) -> MenuModel:
         """
         Обновить информацию о меню.
 
-        :param url: URL запроса.
         :param menu_id: Идентификатор меню, которое нужно обновить.
         :param menu_update: Схема данных для обновления информации о меню.
         :return: Модель обновленного меню.
         """
-        self.background_tasks.add_task(self.cache_service.delete_cache, 'get_menus', url)
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, None)])
         return await self.menu_repository.update_menu(menu_id, menu_update)
 
     async def delete_menu(self, menu_id: UUID) -> MenuModel:
@@ -102,5 +93,22 @@ class MenuService:
         :param menu_id: Идентификатор меню, которое нужно удалить.
         :return: Модель удаленного меню.
         """
-        self.background_tasks.add_task(self.cache_service.delete_related_cache, service='menu', menu_id=menu_id)
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, None)])
         return await self.menu_repository.delete_menu(menu_id)
+
+    async def bulk_menus(self, menu_bulk: MenuBulk) -> BulkResult:
+        """
+        Пакетно создать, обновить и удалить меню.
+
+        Кэш инвалидируется один раз на весь запрос.
+
+        :param menu_bulk: Данные пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        """
+        results: list[BulkItemResult] = await self.menu_repository.bulk_menus(menu_bulk)
+        scopes: list[tuple[UUID | None, None]] = [
+            (result.id, None) for result in results if result.status_code < status.HTTP_400_BAD_REQUEST
+        ]
+        if scopes:
+            invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, scopes)
+        return BulkResult(results=results)
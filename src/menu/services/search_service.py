@@ -0,0 +1,35 @@
+import hashlib
+
+from aioredis import Redis
+
+from src.config import SEARCH_CACHE_TTL
+from src.menu.models.search_model import SearchResultModel
+from src.menu.repositories.search_repository import SearchRepository
+from src.menu.schemas.search_schema import SearchQuery
+from src.menu.services.cache_keys import SEARCH
+from src.menu.services.cache_service import CacheService
+
+
+class SearchService:
+    def __init__(self, search_repository: SearchRepository, redis: Redis):
+        self.search_repository: SearchRepository = search_repository
+        self.cache_service: CacheService = CacheService(redis)
+
+    async def search(self, search_query: SearchQuery) -> SearchResultModel:
+        """
+        Поиск меню, подменю и блюд.
+
+        Результаты кэшируются на SEARCH_CACHE_TTL секунд: короткий срок удерживает в кэше только
+        популярные запросы. Ключ зависит от глобального счётчика поколений, поэтому кэш поиска
+        инвалидируется при любом изменении меню, подменю или блюд вместе с остальным кэшем.
+
+        :param search_query: Схема данных поискового запроса.
+        :return: Модель результатов поиска.
+        """
+        digest: bytes = hashlib.blake2b(search_query.model_dump_json().encode(), digest_size=16).digest()
+        cache_key: bytes = await self.cache_service.versioned_key(SEARCH.wrap(digest))
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.search_repository.search(search_query),
+            SEARCH_CACHE_TTL
+        )
@@ -1,14 +1,37 @@
-from typing import Any
+from collections import defaultdict
+from typing import Any, Callable
+from uuid import UUID
 
 from aioredis import Redis
+from gspread.utils import extract_id_from_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.menu.models.dish_model import DishDiscountModel, DishModel
+from src.config import (
+    CACHE_INVALIDATION,
+    CACHE_WARMING,
+    SHEET_SYNC_CHUNK_SIZE,
+    SHEET_SYNC_LOCK_TIMEOUT,
+)
+from src.menu.models.dish_model import DishDiscountModel
 from src.menu.models.menu_model import MenuModel
 from src.menu.models.submenu_model import SubmenuModel
+from src.menu.repositories.change_log_repository import (
+    ChangeLogRepository,
+    tag_change_source,
+)
 from src.menu.repositories.sheet_repository import SheetRepository
+from src.menu.schemas.sheet_schema import SheetChunk
+from src.menu.services.cache_keys import SYNC_SNAPSHOT
 from src.menu.services.cache_service import CacheService
-from src.menu.tests.utils import reverse
+from src.menu.services.cache_warmer import CacheWarmer, Scope
+from src.menu.services.sync_schedule import SyncSchedule
+from src.metrics import SHEET_SYNC_RUNS, SYNC_PHASE_LATENCY
+
+CHANGE_SOURCE: str = 'sheet_sync'
+# Меньше срока хранения журнала изменений: записи, по которым проверяется снимок, не должны успеть удалиться.
+SYNC_SNAPSHOT_EXPIRATION: int = 3600
+# Ставит части изменений в очередь: ссылка на таблицу, части, токен блокировки и области удалений.
+ChunkDispatcher = Callable[[str, list[SheetChunk], str, dict[str, list]], None]
 
 
 class SheetService:
@@ -16,40 +39,326 @@ class SheetService:
             self,
             redis: Redis,
             session: AsyncSession,
+            spreadsheet_url: str,
+            dispatch_chunks: ChunkDispatcher | None = None,
     ):
         self.redis: Redis = redis
-        self.sheet_repository: SheetRepository = SheetRepository(session)
+        self.spreadsheet_url: str = spreadsheet_url
+        self.dispatch_chunks: ChunkDispatcher | None = dispatch_chunks
+        tag_change_source(session, CHANGE_SOURCE)
+        self.sheet_repository: SheetRepository = SheetRepository(session, spreadsheet_url)
+        self.change_log_repository: ChangeLogRepository = ChangeLogRepository(session)
         self.cache_service: CacheService = CacheService(redis)
+        self.cache_warmer: CacheWarmer = CacheWarmer(redis)
+        self.source: str = extract_id_from_url(spreadsheet_url)
+        self.snapshot_key: bytes = SYNC_SNAPSHOT.wrap(self.source.encode())
+        self.pending_snapshot_key: bytes = SYNC_SNAPSHOT.wrap(self.snapshot_key)
+        self.schedule: SyncSchedule = SyncSchedule(redis, self.source)
+        self.invalidate_scopes: set[Scope] = set()
+        self.warm_scopes: set[Scope] = set()
+
+    async def sync(self, force: bool = False) -> str:
+        """
+        Синхронизирует таблицу, если подошёл её срок по адаптивному расписанию.
 
-    async def check_data(self):
-        menu_data_offline, submenu_data_offline, dish_data_offline = self.sheet_repository.parse_sheet()
-        menu_data_online, submenu_data_online, dish_data_online = await self.sheet_repository.get_full_menu()
+        Синхронизация идёт под блокировкой Redis: запуск, начавшийся до окончания предыдущего,
+        эту таблицу пропускает. Ошибка синхронизации увеличивает интервал так же, как отсутствие изменений,
+        чтобы недоступная таблица не расходовала квоту Google API. Если изменения применяют задачи Celery,
+        блокировку снимает и расписание обновляет завершающая задача.
 
-        dish_data_online = await self.add_discount_to_dish_online(dish_data_online)
+        :param force: Синхронизировать независимо от расписания.
+        :return: Результат: applied, unchanged, dispatched, locked или skipped.
+        """
+        if not force and not await self.schedule.is_due():
+            return 'skipped'
+
+        lock_token: str | None = await self.cache_service.acquire_lock(self.snapshot_key, SHEET_SYNC_LOCK_TIMEOUT)
+        if lock_token is None:
+            SHEET_SYNC_RUNS.labels(self.source, 'locked').inc()
+            return 'locked'
+
+        result: str = 'failed'
+        try:
+            result = await self.check_data(lock_token)
+        finally:
+            if result != 'dispatched':
+                await self.cache_service.release_lock(self.snapshot_key, lock_token)
+                await self.schedule.record(changed=result == 'applied')
+            SHEET_SYNC_RUNS.labels(self.source, result).inc()
+        return result
 
-        await self.delete_dishes(dish_data_online, dish_data_offline)
-        await self.delete_submenus(submenu_data_online, submenu_data_offline)
-        await self.delete_menus(menu_data_online, menu_data_offline)
+    async def check_data(self, lock_token: str | None = None) -> str:
+        """
+        Сравнивает лист с базой и применяет различия.
 
-        menus_update, menus_create = await self.get_update_or_create_menu(menu_data_online, menu_data_offline)
-        await self.update_menu(menus_update)
-        await self.create_menu(menus_create)
+        Если изменений больше SHEET_SYNC_CHUNK_SIZE, они делятся на части по меню и применяются
+        группой задач Celery (chord), каждая часть - в своей транзакции. Задачи ставит dispatch_chunks,
+        переданный воркером; без него изменения применяются в этом процессе.
 
-        submenus_update, submenus_create = await self.get_update_or_create_submenu(
-            submenu_data_online,
-            submenu_data_offline
+        :param lock_token: Токен блокировки таблицы; передаётся задачам Celery, чтобы завершающая её сняла.
+        :return: applied, если база изменена, dispatched, если изменения применяют задачи Celery, иначе unchanged.
+        """
+        with SYNC_PHASE_LATENCY.labels(self.source, 'fetch').time():
+            values: list[list] = await self.sheet_repository.get_values()
+            fingerprint: bytes = self.sheet_repository.get_fingerprint(values)
+
+        with SYNC_PHASE_LATENCY.labels(self.source, 'diff').time():
+            version, snapshot = await self.get_snapshot()
+        if snapshot is not None and snapshot[0] == fingerprint:
+            return 'unchanged'
+
+        with SYNC_PHASE_LATENCY.labels(self.source, 'parse').time():
+            offline: tuple[list, list, list] = self.sheet_repository.parse_sheet(values)
+
+        with SYNC_PHASE_LATENCY.labels(self.source, 'diff').time():
+            # Новая строка листа может ссылаться на меню, созданное через API или другой таблицей,
+            # которого нет в снимке, поэтому меню закрепляются и при сравнении со снимком.
+            offline = await self.claim_menus(offline)
+            if snapshot is not None:
+                online: tuple[list, list, list] = snapshot[1]
+            else:
+                online = await self.sheet_repository.get_full_menu()
+            menu_data_online, submenu_data_online, dish_data_online = online
+            menu_data_offline, submenu_data_offline, dish_data_offline = offline
+            menus_update, menus_create = await self.get_update_or_create_menu(menu_data_online, menu_data_offline)
+            submenus_update, submenus_create = await self.get_update_or_create_submenu(
+                submenu_data_online,
+                submenu_data_offline
+            )
+            dish_update, dish_create = await self.get_update_or_create_dish(dish_data_online, dish_data_offline)
+            chunk: SheetChunk = SheetChunk(
+                menus_update=menus_update,
+                menus_create=menus_create,
+                submenus_update=submenus_update,
+                submenus_create=submenus_create,
+                dishes_update=dish_update,
+                dishes_create=dish_create
+            )
+
+        if not chunk.size and not self._has_deletions(online, offline):
+            await self.save_snapshot(self.snapshot_key, version, fingerprint, offline)
+            return 'unchanged'
+
+        with SYNC_PHASE_LATENCY.labels(self.source, 'apply').time():
+            # Снимок удаляется до записи: после частично применённой синхронизации он был бы неверен.
+            await self.cache_service.delete_cache(self.snapshot_key)
+            try:
+                await self.delete_dishes(dish_data_online, dish_data_offline)
+                await self.delete_submenus(submenu_data_online, submenu_data_offline)
+                await self.delete_menus(menu_data_online, menu_data_offline)
+
+                if chunk.size > SHEET_SYNC_CHUNK_SIZE and lock_token is not None and self.dispatch_chunks is not None:
+                    await self.save_snapshot(self.pending_snapshot_key, version, fingerprint, offline)
+                    # Области удалений, выполненных до постановки задач, инвалидирует завершающая задача.
+                    self.dispatch_chunks(
+                        self.spreadsheet_url,
+                        self.split_chunk(chunk),
+                        lock_token,
+                        self.dump_scopes()
+                    )
+                    return 'dispatched'
+
+                await self.apply_chunk(chunk)
+            except Exception:
+                # Репозитории фиксируют каждую запись, поэтому применённые до ошибки изменения остаются в базе.
+                if CACHE_INVALIDATION == 'inline' and self.invalidate_scopes:
+                    await self.cache_service.invalidate_scopes(self.invalidate_scopes)
+                raise
+            await self.save_snapshot(self.snapshot_key, version, fingerprint, offline)
+
+        if CACHE_INVALIDATION == 'inline':
+            await self.invalidate_and_warm()
+        return 'applied'
+
+    async def apply_chunk(self, chunk: SheetChunk) -> None:
+        """
+        Создаёт и обновляет меню, подменю и блюда части изменений.
+
+        :param chunk: Часть изменений листа.
+        """
+        await self.update_menu(chunk.menus_update)
+        await self.create_menu(chunk.menus_create)
+        await self.update_submenu(chunk.submenus_update)
+        await self.create_submenu(chunk.submenus_create)
+        await self.update_dish(chunk.dishes_update)
+        await self.create_dish(chunk.dishes_create)
+
+    @staticmethod
+    def split_chunk(chunk: SheetChunk) -> list[SheetChunk]:
+        """
+        Делит изменения листа на части не больше SHEET_SYNC_CHUNK_SIZE изменений.
+
+        Изменения одного меню не делятся, поэтому часть с большим меню может быть больше предела.
+
+        :param chunk: Все изменения листа.
+        :return: Список частей.
+        """
+        menu_chunks: defaultdict[UUID, SheetChunk] = defaultdict(SheetChunk)
+        for menu in chunk.menus_update:
+            menu_chunks[menu[0]].menus_update.append(menu)
+        for menu_create in chunk.menus_create:
+            menu_chunks[menu_create.id].menus_create.append(menu_create)
+        for submenu_update in chunk.submenus_update:
+            menu_chunks[submenu_update[0]].submenus_update.append(submenu_update)
+        for submenu_create in chunk.submenus_create:
+            menu_chunks[submenu_create[0]].submenus_create.append(submenu_create)
+        for dish_update in chunk.dishes_update:
+            menu_chunks[dish_update[0]].dishes_update.append(dish_update)
+        for dish_create in chunk.dishes_create:
+            menu_chunks[dish_create[0]].dishes_create.append(dish_create)
+
+        chunks: list[SheetChunk] = [SheetChunk()]
+        for menu_chunk in menu_chunks.values():
+            if chunks[-1].size and chunks[-1].size + menu_chunk.size > SHEET_SYNC_CHUNK_SIZE:
+                chunks.append(SheetChunk())
+            chunks[-1].extend(menu_chunk)
+        return chunks
+
+    async def finish_chunks(self, scopes: list[dict[str, list]], lock_token: str) -> None:
+        """
+        Завершает синхронизацию, изменения которой применили задачи Celery.
+
+        :param scopes: Затронутые области удалений и каждой части: invalidate и warm - списки пар
+        [menu_id, submenu_id].
+        :param lock_token: Токен блокировки таблицы.
+        """
+        await self.cache_service.rename_cache(self.pending_snapshot_key, self.snapshot_key)
+        for chunk_scopes in scopes:
+            self.invalidate_scopes.update(self._load_scopes(chunk_scopes['invalidate']))
+            self.warm_scopes.update(self._load_scopes(chunk_scopes['warm']))
+        if CACHE_INVALIDATION == 'inline':
+            await self.invalidate_and_warm()
+        await self.cache_service.release_lock(self.snapshot_key, lock_token)
+        await self.schedule.record(changed=True)
+        SHEET_SYNC_RUNS.labels(self.source, 'applied').inc()
+
+    async def fail_chunks(self, lock_token: str) -> None:
+        """
+        Завершает синхронизацию, часть изменений которой не применилась.
+
+        Снимок не сохраняется, поэтому следующий запуск сравнит лист с базой и применит оставшееся.
+        Какие части применились, неизвестно, поэтому в режиме CACHE_INVALIDATION=inline инвалидируется весь кэш.
+
+        :param lock_token: Токен блокировки таблицы.
+        """
+        await self.cache_service.delete_cache(self.pending_snapshot_key)
+        if CACHE_INVALIDATION == 'inline':
+            await self.cache_service.invalidate_all()
+        await self.cache_service.release_lock(self.snapshot_key, lock_token)
+        await self.schedule.record(changed=True)
+        SHEET_SYNC_RUNS.labels(self.source, 'failed').inc()
+
+    def dump_scopes(self) -> dict[str, list]:
+        """
+        Возвращает затронутые области в виде, пригодном для передачи между задачами Celery.
+
+        :return: Словарь: invalidate и warm - списки пар [menu_id, submenu_id].
+        """
+        return {'invalidate': self._dump_scopes(self.invalidate_scopes), 'warm': self._dump_scopes(self.warm_scopes)}
+
+    @staticmethod
+    def _dump_scopes(scopes: set[Scope]) -> list[list[str | None]]:
+        return [[str(scope_id) if scope_id else None for scope_id in scope] for scope in scopes]
+
+    @staticmethod
+    def _load_scopes(scopes: list[list[str | None]]) -> set[Scope]:
+        return {
+            (UUID(menu_id) if menu_id else None, UUID(submenu_id) if submenu_id else None)
+            for menu_id, submenu_id in scopes
+        }
+
+    async def invalidate_and_warm(self) -> None:
+        """
+        Инвалидирует и прогревает кэш затронутых областей (режим CACHE_INVALIDATION=inline).
+        """
+        with SYNC_PHASE_LATENCY.labels(self.source, 'invalidate').time():
+            if self.invalidate_scopes:
+                await self.cache_service.invalidate_scopes(self.invalidate_scopes)
+
+        with SYNC_PHASE_LATENCY.labels(self.source, 'warm').time():
+            if CACHE_WARMING and self.warm_scopes:
+                await self.cache_warmer.warm(self.warm_scopes)
+
+    async def get_snapshot(self) -> tuple[int, tuple[bytes, tuple[list, list, list]] | None]:
+        """
+        Получает снимок последнего применённого состояния таблицы, если он совпадает с базой.
+
+        После синхронизации применённое состояние и отпечаток листа сохраняются в Redis вместе с версией
+        журнала изменений, взятой до чтения базы. Если с этой версии базу меняла только сама синхронизация
+        (её записи помечены источником 'sheet_sync'), снимок совпадает с базой и используется вместо
+        загрузки дерева меню; проверка - один запрос по частичному индексу журнала изменений.
+
+        :return: Кортеж: версия журнала изменений и снимок (отпечаток листа и списки моделей меню,
+        подменю и блюд) или None.
+        """
+        snapshot: tuple[int, bytes, tuple[list, list, list]] | None = await self.cache_service.get_cache(
+            self.snapshot_key
+        )
+        version, changed = await self.change_log_repository.check_untagged_changes(
+            snapshot[0] if snapshot is not None else None
         )
-        await self.update_submenu(submenus_update)
-        await self.create_submenu(submenus_create)
+        if snapshot is not None and not changed:
+            return snapshot[0], snapshot[1:]
+        return version, None
 
-        dish_update, dish_create = await self.get_update_or_create_dish(dish_data_online, dish_data_offline)
-        await self.update_dish(dish_update)
-        await self.create_dish(dish_create)
+    async def save_snapshot(
+            self,
+            snapshot_key: bytes,
+            version: int,
+            fingerprint: bytes,
+            offline: tuple[list, list, list]
+    ) -> None:
+        """
+        Сохраняет применённое состояние таблицы.
+
+        :param snapshot_key: Ключ снимка или ключ снимка, ожидающего применения изменений задачами Celery.
+        :param version: Версия журнала изменений, взятая до чтения базы.
+        :param fingerprint: Отпечаток листа.
+        :param offline: Списки моделей меню, подменю и блюд из листа.
+        """
+        await self.cache_service.set_cache((version, fingerprint, offline), snapshot_key, SYNC_SNAPSHOT_EXPIRATION)
+
+    async def claim_menus(self, offline: tuple[list, list, list]) -> tuple[list, list, list]:
+        """
+        Закрепляет меню листа за таблицей и убирает из данных листа меню других таблиц.
+
+        :param offline: Списки моделей меню, подменю и блюд из листа.
+        :return: Списки моделей без меню, закреплённых за другими таблицами.
+        """
+        menus, submenus, dishes = offline
+        foreign: set[UUID] = await self.sheet_repository.claim_menus([menu.id for menu in menus])
+        if not foreign:
+            return offline
+        print('Меню других таблиц пропущены:', *foreign)
+        return (
+            [menu for menu in menus if menu.id not in foreign],
+            [submenu for submenu in submenus if submenu.menu_id not in foreign],
+            [dish for dish in dishes if dish[1] not in foreign]
+        )
+
+    @staticmethod
+    def _has_deletions(online: tuple[list, list, list], offline: tuple[list, list, list]) -> bool:
+        """
+        Проверяет, есть ли в базе меню, подменю или блюда, которых нет в листе.
+
+        :param online: Списки моделей меню, подменю и блюд из базы.
+        :param offline: Списки моделей меню, подменю и блюд из листа.
+        :return: True, если синхронизация что-то удалит.
+        """
+        menus_online, submenus_online, dishes_online = online
+        menus_offline, submenus_offline, dishes_offline = offline
+        menu_ids: set[Any] = {menu.id for menu in menus_offline}
+        submenu_ids: set[tuple] = {(submenu.id, submenu.menu_id) for submenu in submenus_offline}
+        dish_ids: set[tuple] = {(dish[0].id, dish[0].submenu_id, dish[1]) for dish in dishes_offline}
+        menus_deleted: bool = any(menu.id not in menu_ids for menu in menus_online)
+        submenus_deleted: bool = any((submenu.id, submenu.menu_id) not in submenu_ids for submenu in submenus_online)
+        dishes_deleted: bool = any((dish[0].id, dish[0].submenu_id, dish[1]) not in dish_ids for dish in dishes_online)
+        return menus_deleted or submenus_deleted or dishes_deleted
 
     async def delete_dishes(
             self,
-            dish_data_online: list[DishModel],
-            dish_data_offline: list[DishModel | Any]
+            dish_data_online: list[DishDiscountModel],
+            dish_data_offline: list[DishDiscountModel | Any]
     ) -> None:
         """
         Удаляет блюда, которых нет в списке оффлайн данных.
@@ -63,12 +372,8 @@ class SheetService:
         )
 
         for dish in dishes_to_delete_ids:
-            await self.cache_service.delete_related_cache(
-                'dish',
-                menu_id=dish[2],
-                submenu_id=dish[1],
-                dish_id=dish[0]
-            )
+            self.invalidate_scopes.add((dish[2], dish[1]))
+            self.warm_scopes.add((dish[2], dish[1]))
 
     async def delete_submenus(
             self,
@@ -87,11 +392,8 @@ class SheetService:
         )
 
         for submenu in submenus_to_delete:
-            await self.cache_service.delete_related_cache(
-                'submenu',
-                menu_id=submenu[0],
-                submenu_id=submenu[1]
-            )
+            self.invalidate_scopes.add((submenu[1], submenu[0]))
+            self.warm_scopes.add((submenu[1], None))
 
     async def delete_menus(self, menu_data_online: list[MenuModel], menu_data_offline: list[MenuModel]) -> None:
         """
@@ -100,13 +402,11 @@ class SheetService:
         :param menu_data_online: Список моделей данных меню онлайн.
         :param menu_data_offline: Список моделей данных меню оффлайн.
         """
-        menus_to_delete: list[str] = await self.sheet_repository.delete_menus(menu_data_online, menu_data_offline)
+        menus_to_delete: list[UUID] = await self.sheet_repository.delete_menus(menu_data_online, menu_data_offline)
 
         for menu in menus_to_delete:
-            await self.cache_service.delete_related_cache(
-                'menu',
-                menu_id=menu
-            )
+            self.invalidate_scopes.add((menu, None))
+            self.warm_scopes.add((None, None))
 
     async def get_update_or_create_menu(
             self,
@@ -123,13 +423,15 @@ class SheetService:
 
     async def update_menu(self, menus_to_update: list) -> None:
         for menu in menus_to_update:
-            await self.cache_service.delete_cache('get_menus', reverse('update_menu', menu[0]))
             await self.sheet_repository.update_menu(menu[0], menu[1])
+            self.invalidate_scopes.add((menu[0], None))
+            self.warm_scopes.add((menu[0], None))
 
     async def create_menu(self, menus_to_create: list) -> None:
         for menu in menus_to_create:
-            await self.cache_service.delete_cache('get_menus')
             await self.sheet_repository.create_menu(menu)
+            self.invalidate_scopes.add((None, None))
+            self.warm_scopes.add((menu.id, None))
 
     async def get_update_or_create_submenu(
             self,
@@ -147,21 +449,20 @@ class SheetService:
 
     async def update_submenu(self, submenus_to_update: list) -> None:
         for submenu in submenus_to_update:
-            await self.cache_service.delete_cache(reverse('update_submenu', submenu[0], submenu[1]))
             await self.sheet_repository.update_submenu(submenu[0], submenu[1], submenu[2])
+            self.invalidate_scopes.add((submenu[0], submenu[1]))
+            self.warm_scopes.add((submenu[0], submenu[1]))
 
     async def create_submenu(self, submenus_to_create: list) -> None:
         for submenu in submenus_to_create:
-            await self.cache_service.delete_cache(
-                reverse('create_submenu', submenu[0]),
-                f'get_submenus:{submenu[0]}'
-            )
             await self.sheet_repository.create_submenu(submenu[0], submenu[1])
+            self.invalidate_scopes.add((submenu[0], None))
+            self.warm_scopes.add((submenu[0], submenu[1].id))
 
     async def get_update_or_create_dish(
             self,
-            dish_data_online: list[DishModel],
-            dish_data_offline: list[DishModel | Any]
+            dish_data_online: list[DishDiscountModel],
+            dish_data_offline: list[DishDiscountModel | Any]
     ) -> tuple[list, list]:
         """
         Проверяет данные блюд, сравнивая данные онлайн и оффлайн.
@@ -174,44 +475,12 @@ class SheetService:
 
     async def update_dish(self, dishes_to_update: list) -> None:
         for dish in dishes_to_update:
-            await self.cache_service.delete_cache(
-                reverse('update_dish', dish[0], dish[1], dish[2]),
-                f'get_dishes:{dish[0]}:{dish[1]}'
-            )
-            await self.cache_service.delete_cache(f'dish:{dish[2]}')
-            if dish[4]:
-                await self.cache_service.set_cache(dish[4], f'dish:{dish[2]}', 99999999)
-
             await self.sheet_repository.update_dish(dish[2], dish[3])
+            self.invalidate_scopes.add((dish[0], dish[1]))
+            self.warm_scopes.add((dish[0], dish[1]))
 
     async def create_dish(self, dishes_to_create: list) -> None:
         for dish in dishes_to_create:
-            await self.cache_service.delete_cache(
-                f'/api/v1/menus/{dish[0]}',
-                f'/api/v1/menus/{dish[0]}/submenus/{dish[1]}',
-                f'get_dishes:{dish[0]}:{dish[1]}',
-                f'get_submenus:{dish[0]}',
-                'get_menus'
-            )
-            result: DishModel = await self.sheet_repository.create_dish(dish[1], dish[2])
-
-            await self.cache_service.delete_cache(f'dish:{result.id}')
-            if dish[3]:
-                await self.cache_service.set_cache(dish[3], f'dish:{result.id}', 99999999)
-
-    async def add_discount_to_dish_online(
-            self,
-            dish_data_online: list[DishModel | Any]
-    ) -> list[DishDiscountModel | Any]:
-        result: list[DishDiscountModel | Any] = []
-
-        for dish_data in dish_data_online:
-            dish_id: str = str(dish_data[0].id)
-            discount: Any | None = await self.cache_service.get_cache(f'dish:{dish_id}')
-
-            if discount == dish_data[0].price:
-                discount = None
-            result.append(
-                [DishDiscountModel(**dish_data[0].model_dump(), discount=discount), dish_data[1]]
-            )
-        return result
+            await self.sheet_repository.create_dish(dish[1], dish[2])
+            self.invalidate_scopes.add((dish[0], dish[1]))
+            self.warm_scopes.add((dish[0], dish[1]))
@@ -1,19 +1,33 @@
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from aioredis import Redis
-from fastapi import BackgroundTasks
+from starlette import status
+from starlette.background import BackgroundTasks
 
+from src.menu.models.bulk_model import BulkItemResult, BulkResult
 from src.menu.models.submenu_model import SubmenuDetailModel, SubmenuModel
 from src.menu.repositories.submenu_repository import SubmenuRepository
-from src.menu.schemas.submenu_schema import SubmenuCreate, SubmenuUpdate
-from src.menu.services.cache_service import CacheService
+from src.menu.schemas.submenu_schema import SubmenuBulk, SubmenuCreate, SubmenuUpdate
+from src.menu.services.cache_keys import SUBMENU, SUBMENUS
+from src.menu.services.cache_service import CacheService, invalidate_in_background
+
+if TYPE_CHECKING:
+    from src.menu.services.cache_warmer import CacheWarmer
 
 
 class SubmenuService:
-    def __init__(self, submenu_repository: SubmenuRepository, redis: Redis, background_tasks: BackgroundTasks):
+    def __init__(
+            self,
+            submenu_repository: SubmenuRepository,
+            redis: Redis,
+            background_tasks: BackgroundTasks,
+            cache_warmer: 'CacheWarmer'
+    ):
         self.submenu_repository = submenu_repository
         self.cache_service: CacheService = CacheService(redis)
         self.background_tasks: BackgroundTasks = background_tasks
+        self.cache_warmer: 'CacheWarmer' = cache_warmer
 
     async def get_submenus(self, menu_id: UUID) -> list[SubmenuDetailModel]:
         """
@@ -22,15 +36,11 @@ class SubmenuService:
         :param menu_id: Идентификатор меню.
         :return: Список моделей подменю.
         """
-        cache_key: str = f'get_submenus:{menu_id}'
-        result_cache: list[SubmenuDetailModel] | None = await self.cache_service.get_cache(cache_key)
-
-        if result_cache:
-            return result_cache
-
-        result: list[SubmenuDetailModel] = await self.submenu_repository.get_submenus(menu_id)
-        await self.cache_service.set_cache(cache_key=cache_key, result=result)
-        return result
+        cache_key: bytes = await self.cache_service.versioned_key(SUBMENUS.key(menu_id), menu_id=menu_id)
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.submenu_repository.get_submenus(menu_id)
+        )
 
     async def create_submenu(self, menu_id: UUID, submenu_create: SubmenuCreate) -> SubmenuModel:
         """
@@ -42,37 +52,30 @@ class SubmenuService:
         """
 
         result: SubmenuModel = await self.submenu_repository.create_submenu(menu_id, submenu_create)
-        self.background_tasks.add_task(
-            self.cache_service.delete_cache,
-            f'/api/v1/menus/{menu_id}',
-            f'get_submenus:{menu_id}',
-            'get_menus'
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, None)])
 
         return result
 
-    async def get_submenu_detail(self, url: str, menu_id: UUID, submenu_id: UUID) -> SubmenuDetailModel:
+    async def get_submenu_detail(self, menu_id: UUID, submenu_id: UUID) -> SubmenuDetailModel:
         """
         Получить детальную информацию о подменю.
 
-        :param url: URL запроса.
         :param menu_id: Идентификатор меню.
         :param submenu_id: Идентификатор подменю.
         :return: Модель детальной информации о подменю.
         """
-        result_cache: SubmenuDetailModel | None = await self.cache_service.get_cache(url)
-
-        if result_cache:
-            return result_cache
-
-        result: SubmenuDetailModel = await self.submenu_repository.get_submenu_detail(menu_id, submenu_id)
-        await self.cache_service.set_cache(result, url)
-
-        return await self.submenu_repository.get_submenu_detail(menu_id, submenu_id)
+        cache_key: bytes = await self.cache_service.versioned_key(
+            SUBMENU.key(menu_id, submenu_id),
+            menu_id=menu_id,
+            submenu_id=submenu_id
+        )
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self.submenu_repository.get_submenu_detail(menu_id, submenu_id)
+        )
 
     async def update_submenu(
             self,
-            url: str,
             menu_id: UUID,
             submenu_id: UUID,
             submenu_update: SubmenuUpdate
@@ -80,18 +83,13 @@ class SubmenuService:
         """
         Обновить информацию о подменю.
 
-        :param url: URL запроса.
         :param menu_id: Идентификатор меню, к которому привязано подменю.
         :param submenu_id: Идентификатор подменю, которое нужно обновить.
         :param submenu_update: Схема данных для обновления информации о подменю.
         :return: Модель обновленного подменю.
         """
         result: SubmenuModel = await self.submenu_repository.update_submenu(menu_id, submenu_id, submenu_update)
-        self.background_tasks.add_task(
-            self.cache_service.delete_cache,
-            url,
-            f'get_submenus:{menu_id}'
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, submenu_id)])
 
         return result
 
@@ -104,11 +102,24 @@ class SubmenuService:
         :return: Модель удаленного подменю
         """
         result: SubmenuModel = await self.submenu_repository.delete_submenu(menu_id, submenu_id)
-        self.background_tasks.add_task(
-            self.cache_service.delete_related_cache,
-            service='submenu',
-            menu_id=menu_id,
-            submenu_id=submenu_id
-        )
+        invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, [(menu_id, submenu_id)])
 
         return result
+
+    async def bulk_submenus(self, menu_id: UUID, submenu_bulk: SubmenuBulk) -> BulkResult:
+        """
+        Пакетно создать, обновить и удалить подменю.
+
+        Кэш инвалидируется один раз на весь запрос.
+
+        :param menu_id: Идентификатор меню.
+        :param submenu_bulk: Данные пакетного запроса.
+        :return: Результаты по каждому элементу запроса.
+        """
+        results: list[BulkItemResult] = await self.submenu_repository.bulk_submenus(menu_id, submenu_bulk)
+        scopes: list[tuple[UUID, UUID | None]] = [
+            (menu_id, result.id) for result in results if result.status_code < status.HTTP_400_BAD_REQUEST
+        ]
+        if scopes:
+            invalidate_in_background(self.background_tasks, self.cache_service, self.cache_warmer, scopes)
+        return BulkResult(results=results)
@@ -0,0 +1,80 @@
+import math
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from aioredis import Redis
+
+from src.config import (
+    SHEET_SYNC_BACKOFF_FACTOR,
+    SHEET_SYNC_MAX_INTERVAL,
+    SHEET_SYNC_MIN_INTERVAL,
+    SHEET_SYNC_QUIET_HOURS,
+    SHEET_SYNC_TIMEZONE,
+)
+from src.menu.services.cache_keys import SYNC_SCHEDULE
+from src.menu.services.cache_service import CacheService
+
+# Состояние хранится дольше самого длинного интервала: без него синхронизация начинается с минимального.
+SCHEDULE_EXPIRATION: int = math.ceil(SHEET_SYNC_MAX_INTERVAL) * 2
+
+
+def in_quiet_hours(now: datetime, quiet_hours: tuple[int, ...] | None) -> bool:
+    """
+    Проверяет, попадает ли время в тихие часы.
+
+    :param now: Время с часовым поясом синхронизации.
+    :param quiet_hours: Час начала и час окончания; интервал может переходить через полночь (23-7).
+    :return: True, если сейчас тихие часы.
+    """
+    if quiet_hours is None:
+        return False
+    start, end = quiet_hours
+    if start <= end:
+        return start <= now.hour < end
+    return now.hour >= start or now.hour < end
+
+
+class SyncSchedule:
+    """
+    Адаптивное расписание синхронизации таблицы.
+
+    Задача запускается каждые SHEET_SYNC_MIN_INTERVAL секунд, но таблицу обрабатывает, только когда подошёл
+    её срок. Пока изменений нет, интервал растёт в SHEET_SYNC_BACKOFF_FACTOR раз до SHEET_SYNC_MAX_INTERVAL;
+    после изменения возвращается к минимальному. В тихие часы интервал максимальный.
+    """
+
+    def __init__(self, redis: Redis, source: str, quiet_hours: tuple[int, ...] | None = SHEET_SYNC_QUIET_HOURS):
+        self.cache_service: CacheService = CacheService(redis)
+        self.key: bytes = SYNC_SCHEDULE.wrap(source.encode())
+        self.quiet_hours: tuple[int, ...] | None = quiet_hours
+
+    async def is_due(self) -> bool:
+        """
+        Проверяет, подошёл ли срок синхронизации таблицы.
+
+        Срок сравнивается с запасом в половину минимального интервала, чтобы из-за задержки запуска задачи
+        таблица не пропускала очередной тик.
+
+        :return: True, если таблицу пора синхронизировать.
+        """
+        state: tuple[float, float] | None = await self.cache_service.get_cache(self.key)
+        return state is None or state[1] <= time.time() + SHEET_SYNC_MIN_INTERVAL / 2
+
+    async def record(self, changed: bool) -> float:
+        """
+        Сохраняет результат синхронизации и назначает следующую.
+
+        :param changed: True, если синхронизация изменила базу.
+        :return: Время до следующей синхронизации в секундах.
+        """
+        state: tuple[float, float] | None = await self.cache_service.get_cache(self.key)
+        if changed or state is None:
+            interval: float = SHEET_SYNC_MIN_INTERVAL
+        else:
+            interval = min(state[0] * SHEET_SYNC_BACKOFF_FACTOR, SHEET_SYNC_MAX_INTERVAL)
+
+        quiet: bool = in_quiet_hours(datetime.now(ZoneInfo(SHEET_SYNC_TIMEZONE)), self.quiet_hours)
+        delay: float = SHEET_SYNC_MAX_INTERVAL if quiet else interval
+        await self.cache_service.set_cache((interval, time.time() + delay), self.key, SCHEDULE_EXPIRATION)
+        return delay
@@ -7,6 +7,11 @@ import pytest
 from httpx import AsyncClient
 
 from src.main import app
+from src.menu.tests.query_budget import (  # noqa: F401
+    pytest_configure,
+    query_budget,
+    query_budget_marker,
+)
 
 
 @pytest.fixture
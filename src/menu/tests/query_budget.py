@@ -0,0 +1,90 @@
+"""
+Плагин pytest для проверки бюджета SQL-запросов и обращений к Redis.
+
+Запросы к приложению через AsyncClient выполняются в контексте теста, поэтому счётчики
+трассировки (src.tracing) накапливаются в трассировке, начатой тестом.
+
+Использование:
+    @pytest.mark.query_budget(sql=1, redis=5)
+    async def test_get_menu(...): ...
+
+    async def test_get_full_menu(..., query_budget):
+        with query_budget(sql=3, redis=5):
+            await client.get(reverse('get_full_menu'))
+
+Бюджет включает фоновые задачи запроса: AsyncClient дожидается их выполнения.
+"""
+from typing import Any, Generator
+
+import pytest
+
+from src.tracing import RequestTrace, request_trace
+
+
+class QueryBudget:
+    """Контекстный менеджер, проверяющий число SQL-запросов и обращений к Redis внутри блока."""
+
+    def __init__(self, sql: int | None = None, redis: int | None = None):
+        self.sql: int | None = sql
+        self.redis: int | None = redis
+        self.trace: RequestTrace = RequestTrace(record_statements=True)
+
+    def __enter__(self) -> RequestTrace:
+        self.token = request_trace.set(self.trace)
+        return self.trace
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        request_trace.reset(self.token)
+        if exc_type is None:
+            self.check()
+
+    def check(self) -> None:
+        """
+        Проверяет, что бюджет не превышен.
+
+        :raises AssertionError: Если выполнено больше запросов, чем разрешено.
+        """
+        errors: list[str] = []
+        if self.sql is not None and self.trace.sql_statements > self.sql:
+            errors.append(f'{self.trace.sql_statements} SQL queries (budget {self.sql})')
+            errors.extend(
+                f'  {count} x {" ".join(statement.split())}'
+                for statement, count in self.trace.repeated_statements(2)
+            )
+        if self.redis is not None and self.trace.redis_round_trips > self.redis:
+            errors.append(f'{self.trace.redis_round_trips} redis round trips (budget {self.redis})')
+
+        assert not errors, 'Query budget exceeded:\n' + '\n'.join(errors)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        'markers',
+        'query_budget(sql=None, redis=None): максимальное число SQL-запросов и обращений к Redis за тест'
+    )
+
+
+@pytest.fixture
+def query_budget() -> type[QueryBudget]:
+    """
+    Фикстура предоставляет контекстный менеджер для проверки бюджета запросов внутри теста.
+
+    :return: Класс QueryBudget.
+    """
+    return QueryBudget
+
+
+@pytest.fixture(autouse=True)
+def query_budget_marker(request: pytest.FixtureRequest) -> Generator[None, Any, None]:
+    """
+    Фикстура проверяет бюджет запросов всего теста, отмеченного маркером query_budget.
+
+    :param request: Объект запроса Pytest.
+    """
+    marker: pytest.Mark | None = request.node.get_closest_marker('query_budget')
+    if marker is None:
+        yield
+        return
+
+    with QueryBudget(**marker.kwargs):
+        yield
@@ -0,0 +1,103 @@
+import uuid
+
+from httpx import AsyncClient, Response
+
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+
+async def test_bulk_create_menu_and_submenu(
+        client: AsyncClient,
+        menu_data: dict[str, str],
+        submenu_data: dict[str, str]
+) -> None:
+    response: Response = await client.post(reverse('bulk_menus'), json={'create': [menu_data]})
+    menu_result: dict[str, str | int] = response.json()['results'][0]
+
+    assert response.status_code == 200
+    assert menu_result['action'] == 'create'
+    assert menu_result['status_code'] == 201
+
+    response = await client.post(reverse('bulk_submenus', menu_result['id']), json={'create': [submenu_data]})
+    submenu_result: dict[str, str | int] = response.json()['results'][0]
+
+    assert response.status_code == 200
+    assert submenu_result['status_code'] == 201
+
+    set_env_variable('menu_id', str(menu_result['id']))
+    set_env_variable('submenu_id', str(submenu_result['id']))
+
+
+async def test_bulk_create_dishes(client: AsyncClient, menu_id: str, submenu_id: str) -> None:
+    dishes: list[dict[str, str]] = [
+        {'title': f'Dish {number}', 'description': 'Description', 'price': '10.50'}
+        for number in range(3)
+    ]
+    response: Response = await client.post(
+        reverse('bulk_dishes', menu_id, submenu_id),
+        json={'create': [*dishes, dishes[0]]}
+    )
+    results: list[dict[str, str | int]] = response.json()['results']
+
+    assert response.status_code == 200
+    assert [result['status_code'] for result in results] == [201, 201, 201, 409]
+
+    response = await client.get(reverse('get_dishes', menu_id, submenu_id))
+    assert len(response.json()) == 3
+
+    set_env_variable('dish_id', str(results[0]['id']))
+
+
+async def test_bulk_update_and_delete_dishes(
+        client: AsyncClient,
+        dish_update_data: dict[str, str],
+        menu_id: str,
+        submenu_id: str,
+        dish_id: str
+) -> None:
+    response: Response = await client.get(reverse('get_dishes', menu_id, submenu_id))
+    other_dish_ids: list[str] = [dish['id'] for dish in response.json() if dish['id'] != dish_id]
+    missing_id: str = str(uuid.uuid4())
+
+    response = await client.post(
+        reverse('bulk_dishes', menu_id, submenu_id),
+        json={
+            'update': [{'id': dish_id, **dish_update_data}, {'id': missing_id, **dish_update_data}],
+            'delete': [*other_dish_ids, missing_id]
+        }
+    )
+    results: list[dict[str, str | int]] = response.json()['results']
+
+    assert response.status_code == 200
+    assert [(result['action'], result['status_code']) for result in results] == [
+        ('update', 200), ('update', 404), ('delete', 200), ('delete', 200), ('delete', 404)
+    ]
+
+    response = await client.get(reverse('get_dishes', menu_id, submenu_id))
+    response_json: list[dict[str, str]] = response.json()
+
+    assert len(response_json) == 1
+    assert response_json[0]['title'] == dish_update_data['title']
+    assert response_json[0]['price'] == dish_update_data['price']
+
+
+async def test_bulk_dishes_submenu_not_found(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.post(
+        reverse('bulk_dishes', menu_id, uuid.uuid4()),
+        json={'delete': [str(uuid.uuid4())]}
+    )
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'submenu not found'
+
+
+async def test_bulk_delete_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.post(reverse('bulk_menus'), json={'delete': [menu_id]})
+
+    assert response.status_code == 200
+    assert response.json()['results'][0]['status_code'] == 200
+
+    response = await client.get(reverse('get_menus'))
+    assert response.json() == []
+
+    remove_environment_variable('menu_id', 'submenu_id', 'dish_id')
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any
+
+from httpx import AsyncClient, Response
+from sqlalchemy import event
+
+from src.database import engine
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+BURST_SIZE: int = 50
+
+
+class QueryCounter:
+    """Счётчик SQL-запросов, выполненных через engine."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def __call__(self, *args: Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> 'QueryCounter':
+        event.listen(engine.sync_engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        event.remove(engine.sync_engine, 'before_cursor_execute', self)
+
+
+async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    response_json: dict[str, str] = response.json()
+
+    assert response.status_code == 201
+
+    set_env_variable('menu_id', response_json['id'])
+
+
+async def test_full_menu_burst_of_misses(client: AsyncClient, menu_update_data: dict[str, str], menu_id: str) -> None:
+    response: Response = await client.patch(reverse('update_menu', menu_id), json=menu_update_data)
+    assert response.status_code == 200
+
+    with QueryCounter() as counter:
+        responses: list[Response] = await asyncio.gather(
+            *(client.get(reverse('get_full_menu')) for _ in range(BURST_SIZE))
+        )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert counter.count <= 3, f'{counter.count} queries for {BURST_SIZE} concurrent misses'
+
+
+async def test_menus_burst_of_misses(client: AsyncClient, menu_update_data: dict[str, str], menu_id: str) -> None:
+    response: Response = await client.patch(reverse('update_menu', menu_id), json=menu_update_data)
+    assert response.status_code == 200
+
+    with QueryCounter() as counter:
+        responses: list[Response] = await asyncio.gather(
+            *(client.get(reverse('get_menus')) for _ in range(BURST_SIZE))
+        )
+
+    assert all(len(response.json()) == 1 for response in responses)
+    assert counter.count <= 1, f'{counter.count} queries for {BURST_SIZE} concurrent misses'
+
+
+async def test_delete_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+
+    assert response.status_code == 200
+    remove_environment_variable('menu_id')
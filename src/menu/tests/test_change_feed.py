@@ -0,0 +1,84 @@
+import asyncio
+import json
+from uuid import UUID
+
+from aioredis import from_url
+from httpx import AsyncClient, Response
+
+from src.database import REDIS_URL, async_session_maker
+from src.menu.schemas.dish_schema import DishSheetUpdate
+from src.menu.services.change_feed import REFETCH_EVENT, ChangeSubscription, change_hub
+from src.menu.services.sheet_service import SheetService
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+SPREADSHEET_URL: str = 'https://docs.google.com/spreadsheets/d/change-feed-sheet/edit'
+WAIT_TIMEOUT: float = 2.0
+
+
+async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    response_json: dict[str, str] = response.json()
+
+    assert response.status_code == 201
+
+    set_env_variable('menu_id', response_json['id'])
+
+
+async def test_change_event_on_update(client: AsyncClient, menu_update_data: dict[str, str], menu_id: str) -> None:
+    async with change_hub.subscribe() as everything, change_hub.subscribe(UUID(menu_id)) as menu:
+        await asyncio.wait_for(change_hub.ready.wait(), WAIT_TIMEOUT)
+
+        response: Response = await client.patch(reverse('update_menu', menu_id), json=menu_update_data)
+        assert response.status_code == 200
+
+        for subscription in (everything, menu):
+            event: bytes = await asyncio.wait_for(subscription.queue.get(), WAIT_TIMEOUT)
+            name, data = event.decode().strip().split('\n')
+            assert name == 'event: change'
+            assert [menu_id, None] in json.loads(data.removeprefix('data: '))['scopes']
+
+
+async def test_sheet_dish_update_reaches_menu_subscription(
+        client: AsyncClient,
+        submenu_data: dict[str, str],
+        dish_data: dict[str, str],
+        dish_update_data: dict[str, str],
+        menu_id: str
+) -> None:
+    submenu_response: Response = await client.post(reverse('create_submenu', menu_id), json=submenu_data)
+    submenu_id: str = submenu_response.json()['id']
+    dish_response: Response = await client.post(reverse('create_dish', menu_id, submenu_id), json=dish_data)
+    dish_id: str = dish_response.json()['id']
+
+    async with change_hub.subscribe(UUID(menu_id)) as menu:
+        await asyncio.wait_for(change_hub.ready.wait(), WAIT_TIMEOUT)
+
+        async with await from_url(REDIS_URL) as redis, async_session_maker() as session:
+            sheet_service: SheetService = SheetService(redis, session, SPREADSHEET_URL)
+            await sheet_service.update_dish(
+                [(UUID(menu_id), UUID(submenu_id), UUID(dish_id), DishSheetUpdate(**dish_update_data))]
+            )
+            await session.commit()
+            await sheet_service.invalidate_and_warm()
+
+        event: bytes = await asyncio.wait_for(menu.queue.get(), WAIT_TIMEOUT)
+        name, data = event.decode().strip().split('\n')
+        assert name == 'event: change'
+        assert [menu_id, submenu_id] in json.loads(data.removeprefix('data: '))['scopes']
+
+
+async def test_slow_subscriber_gets_refetch() -> None:
+    subscription: ChangeSubscription = ChangeSubscription(None, 2)
+    for number in range(5):
+        subscription.push(f'event: change\ndata: {number}\n\n'.encode())
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait() == REFETCH_EVENT
+
+
+async def test_delete_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+
+    assert response.status_code == 200
+    remove_environment_variable('menu_id')
@@ -0,0 +1,74 @@
+import os
+from datetime import timedelta
+from typing import Any
+
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncTransaction
+
+from src.database import engine
+from src.menu.models.change_log_model import ChangesModel
+from src.menu.repositories.change_log_repository import ChangeLogRepository
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+
+async def test_changes_without_version(client: AsyncClient) -> None:
+    response: Response = await client.get(reverse('get_changes'))
+    response_json: dict[str, Any] = response.json()
+
+    assert response.status_code == 200
+    assert response_json['resync'] is True
+
+    set_env_variable('change_version', str(response_json['version']))
+
+
+async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    response_json: dict[str, str] = response.json()
+
+    assert response.status_code == 201
+
+    set_env_variable('menu_id', response_json['id'])
+
+
+async def test_changes_contain_created_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.get(reverse('get_changes'), params={'since': os.environ['change_version']})
+    response_json: dict[str, Any] = response.json()
+
+    assert response.status_code == 200
+    assert response_json['resync'] is False
+    assert [menu['id'] for menu in response_json['menus']['upserts']] == [menu_id]
+    assert response_json['menus']['deletes'] == []
+    assert response_json['version'] > int(os.environ['change_version'])
+
+    remove_environment_variable('change_version')
+    set_env_variable('change_version', str(response_json['version']))
+
+
+async def test_changes_contain_deleted_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+    assert response.status_code == 200
+
+    response = await client.get(reverse('get_changes'), params={'since': os.environ['change_version']})
+    response_json: dict[str, Any] = response.json()
+
+    assert response_json['menus']['upserts'] == []
+    assert response_json['menus']['deletes'] == [menu_id]
+    remove_environment_variable('menu_id')
+
+
+async def test_compacted_version_requires_resync() -> None:
+    # Сжатие выполняется в транзакции, которая откатывается: журнал общий для всех тестов.
+    async with engine.connect() as connection:
+        transaction: AsyncTransaction = await connection.begin()
+        try:
+            session: AsyncSession = AsyncSession(bind=connection, join_transaction_mode='create_savepoint')
+            change_log_repository: ChangeLogRepository = ChangeLogRepository(session)
+            assert await change_log_repository.compact(timedelta(0)) > 0
+
+            changes: ChangesModel = await change_log_repository.get_changes(int(os.environ['change_version']))
+            assert changes.resync is True
+        finally:
+            await transaction.rollback()
+
+    remove_environment_variable('change_version')
@@ -0,0 +1,74 @@
+import os
+
+from httpx import AsyncClient, Response
+
+from src.database import async_session_maker
+from src.menu.models.menu_model import MenuModel
+from src.menu.repositories.change_log_repository import (
+    ChangeLogRepository,
+    tag_change_source,
+)
+from src.menu.repositories.menu_repository import MenuRepository
+from src.menu.schemas.menu_schema import MenuCreate
+from src.menu.services.sheet_service import CHANGE_SOURCE
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+
+async def test_untagged_changes_without_version() -> None:
+    async with async_session_maker() as session:
+        version, changed = await ChangeLogRepository(session).check_untagged_changes(None)
+
+    assert changed is True
+    set_env_variable('change_version', str(version))
+
+
+async def test_api_change_is_untagged(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    assert response.status_code == 201
+    set_env_variable('menu_id', response.json()['id'])
+
+    async with async_session_maker() as session:
+        version, changed = await ChangeLogRepository(session).check_untagged_changes(
+            int(os.environ['change_version'])
+        )
+
+    assert changed is True
+    remove_environment_variable('change_version')
+    set_env_variable('change_version', str(version))
+
+
+async def test_tagged_change_is_ignored(menu_data: dict[str, str]) -> None:
+    async with async_session_maker() as session:
+        tag_change_source(session, CHANGE_SOURCE)
+        menu: MenuModel = await MenuRepository(session).create_menu(
+            MenuCreate(**{**menu_data, 'title': 'Tagged menu'})
+        )
+        set_env_variable('tagged_menu_id', str(menu.id))
+
+    async with async_session_maker() as session:
+        _, changed = await ChangeLogRepository(session).check_untagged_changes(int(os.environ['change_version']))
+
+    assert changed is False
+
+
+async def test_untagged_change_after_tagged(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(
+        reverse('create_menu'),
+        json={**menu_data, 'title': 'Untagged menu'}
+    )
+    assert response.status_code == 201
+    set_env_variable('untagged_menu_id', response.json()['id'])
+
+    async with async_session_maker() as session:
+        _, changed = await ChangeLogRepository(session).check_untagged_changes(int(os.environ['change_version']))
+
+    assert changed is True
+
+
+async def test_delete_menus(client: AsyncClient, menu_id: str) -> None:
+    for delete_id in (menu_id, os.environ['tagged_menu_id'], os.environ['untagged_menu_id']):
+        response: Response = await client.delete(reverse('delete_menu', delete_id))
+        assert response.status_code == 200
+
+    remove_environment_variable('menu_id', 'tagged_menu_id', 'untagged_menu_id', 'change_version')
@@ -1,5 +1,6 @@
 import uuid
 
+import pytest
 from httpx import AsyncClient, Response
 
 from src.menu.tests.conftest import remove_environment_variable, set_env_variable
@@ -43,6 +44,7 @@ async def test_create_dish(
     set_env_variable('dish_id', str(response_json['id']))
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_dishes(
         client: AsyncClient,
         dish_data: dict[str, str],
@@ -59,6 +61,7 @@ async def test_get_dishes(
     assert response_json[0]['submenu_id'] == submenu_id
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_dish(
         client: AsyncClient,
         submenu_data: dict[str, str],
@@ -0,0 +1,89 @@
+import asyncio
+from contextlib import suppress
+
+import pytest
+from aioredis import from_url
+from httpx import AsyncClient, Response
+from sqlalchemy import text
+
+from src.database import REDIS_URL, async_session_maker
+from src.menu.services import invalidation_listener
+from src.menu.services.invalidation_listener import InvalidationListener
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+WAIT_TIMEOUT: float = 2.0
+
+
+async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    response_json: dict[str, str] = response.json()
+
+    assert response.status_code == 201
+
+    set_env_variable('menu_id', response_json['id'])
+
+
+async def test_invalidate_on_direct_update(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.get(reverse('get_menu', menu_id))
+    assert response.json()['title'] == 'Title'
+
+    async with await from_url(REDIS_URL) as redis:
+        listener: InvalidationListener = InvalidationListener(redis)
+        task: asyncio.Task = asyncio.create_task(listener.run())
+        try:
+            await asyncio.wait_for(listener.listening.wait(), WAIT_TIMEOUT)
+
+            async with async_session_maker() as session:
+                await session.execute(
+                    text('UPDATE menu SET title = :title WHERE id = :id'),
+                    {'title': 'Title from SQL', 'id': menu_id}
+                )
+                await session.commit()
+
+            deadline: float = asyncio.get_running_loop().time() + WAIT_TIMEOUT
+            while asyncio.get_running_loop().time() < deadline:
+                response = await client.get(reverse('get_menu', menu_id))
+                if response.json()['title'] == 'Title from SQL':
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    assert response.json()['title'] == 'Title from SQL'
+
+
+async def test_single_listener_is_elected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(invalidation_listener, 'LEADER_RETRY_INTERVAL', 0.05)
+
+    async with await from_url(REDIS_URL) as redis:
+        leader: InvalidationListener = InvalidationListener(redis)
+        standby: InvalidationListener = InvalidationListener(redis)
+        leader_task: asyncio.Task = asyncio.create_task(leader.run())
+        standby_task: asyncio.Task | None = None
+        try:
+            await asyncio.wait_for(leader.listening.wait(), WAIT_TIMEOUT)
+            standby_task = asyncio.create_task(standby.run())
+            await asyncio.sleep(0.3)
+
+            assert not standby.listening.is_set()
+
+            leader_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await leader_task
+            await asyncio.wait_for(standby.listening.wait(), WAIT_TIMEOUT)
+        finally:
+            for task in (leader_task, standby_task):
+                if task is not None:
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
+
+
+async def test_delete_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+
+    assert response.status_code == 200
+    remove_environment_variable('menu_id')
@@ -1,8 +1,10 @@
 import uuid
 
+import pytest
 from httpx import AsyncClient, Response
 
 from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.query_budget import QueryBudget
 from src.menu.tests.utils import reverse
 
 
@@ -18,6 +20,7 @@ async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> No
     set_env_variable('menu_id', response_json['id'])
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_menus(client: AsyncClient, menu_data: dict[str, str]) -> None:
     response: Response = await client.get(reverse('get_menus'))
     response_json: list[dict[str, str | int]] = response.json()
@@ -28,6 +31,7 @@ async def test_get_menus(client: AsyncClient, menu_data: dict[str, str]) -> None
     assert response_json[0]['description'] == menu_data['description']
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_menu_detail(client: AsyncClient, menu_data: dict[str, str], menu_id: str) -> None:
     response: Response = await client.get(reverse('get_menu', menu_id))
     response_json: dict[str, str | int] = response.json()
@@ -44,7 +48,8 @@ async def test_get_full_menu(
         submenu_data: dict[str, str],
         menu_id: str,
         menu_data: dict[str, str],
-        dish_data: dict[str, str]
+        dish_data: dict[str, str],
+        query_budget: type[QueryBudget]
 ) -> None:
     response_submenu: Response = await client.post(
         reverse(
@@ -60,7 +65,8 @@ async def test_get_full_menu(
             response_submenu_json['id']
         ), json=dish_data
     )
-    response: Response = await client.get(reverse('get_full_menu'))
+    with query_budget(sql=3, redis=5):
+        response: Response = await client.get(reverse('get_full_menu'))
     response_json: list[dict] = response.json()
 
     assert response_json[0]['menu']['title'] == menu_data['title']
@@ -74,6 +80,7 @@ async def test_get_full_menu(
     assert response_json[0]['menu']['submenus'][0]['dishes'][0]['price'] == dish_data['price']
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_menu_invalid_id(client: AsyncClient) -> None:
     response: Response = await client.get(reverse('get_menu', uuid.uuid4()))
 
@@ -0,0 +1,77 @@
+from typing import Any
+
+from httpx import AsyncClient, Response
+
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+DISHES: list[dict[str, str]] = [
+    {'title': 'Borscht', 'description': 'Beetroot soup with sour cream', 'price': '7.50'},
+    {'title': 'Solyanka', 'description': 'Thick soup with smoked meat', 'price': '9.00'},
+    {'title': 'Pelmeni', 'description': 'Dumplings with beef', 'price': '11.25'},
+]
+
+
+async def test_create_catalogue(client: AsyncClient, menu_data: dict[str, str], submenu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+    assert response.status_code == 201
+    menu_id: str = response.json()['id']
+    set_env_variable('menu_id', menu_id)
+
+    response = await client.post(reverse('create_submenu', menu_id), json=submenu_data)
+    assert response.status_code == 201
+    submenu_id: str = response.json()['id']
+    set_env_variable('submenu_id', submenu_id)
+
+    for dish in DISHES:
+        response = await client.post(reverse('create_dish', menu_id, submenu_id), json=dish)
+        assert response.status_code == 201
+
+
+async def test_search_by_prefix(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.get(reverse('search'), params={'q': 'bors', 'menu_id': menu_id})
+    response_json: dict[str, Any] = response.json()
+
+    assert response.status_code == 200
+    assert [dish['title'] for dish in response_json['dishes']] == ['Borscht']
+    assert response_json['dishes'][0]['menu_id'] == menu_id
+
+
+async def test_search_with_typo(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.get(reverse('search'), params={'q': 'pelmeny', 'menu_id': menu_id})
+
+    assert [dish['title'] for dish in response.json()['dishes']] == ['Pelmeni']
+
+
+async def test_search_price_range_sorted(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.get(
+        reverse('search'),
+        params={'q': 'soup', 'menu_id': menu_id, 'max_price': '10', 'sort': '-price'}
+    )
+    response_json: dict[str, Any] = response.json()
+
+    assert [dish['title'] for dish in response_json['dishes']] == ['Solyanka', 'Borscht']
+    assert response_json['menus'] == []
+    assert response_json['submenus'] == []
+
+
+async def test_search_invalidated_on_update(client: AsyncClient, menu_id: str, submenu_id: str) -> None:
+    params: dict[str, str] = {'q': 'pelmeni', 'menu_id': menu_id}
+    response: Response = await client.get(reverse('search'), params=params)
+    dish_id: str = response.json()['dishes'][0]['id']
+
+    response = await client.patch(
+        reverse('update_dish', menu_id, submenu_id, dish_id),
+        json={'title': 'Vareniki', 'description': 'Dumplings with cherries', 'price': '8.00'}
+    )
+    assert response.status_code == 200
+
+    response = await client.get(reverse('search'), params=params)
+    assert response.json()['dishes'] == []
+
+
+async def test_delete_catalogue(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+
+    assert response.status_code == 200
+    remove_environment_variable('menu_id', 'submenu_id')
@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy.exc import IntegrityError
+
+from src.menu.schemas.menu_schema import MenuCreate
+from src.menu.schemas.sheet_schema import SheetChunk
+from src.menu.schemas.submenu_schema import SubmenuCreate
+from src.menu.services.sheet_service import SheetService
+from src.menu.tests.utils import reverse
+from src.menu.worker.tasks.sheet_chunk_task import apply_chunk
+
+SPREADSHEET_URL: str = 'https://docs.google.com/spreadsheets/d/chunked-sheet/edit'
+
+
+def test_split_chunk_keeps_menu_together() -> None:
+    menus: list[MenuCreate] = [MenuCreate(title=f'Menu {number}', description='Description') for number in range(3)]
+    chunk: SheetChunk = SheetChunk(
+        menus_create=menus,
+        submenus_create=[[menu.id, SubmenuCreate(title='Submenu', description='Description')] for menu in menus]
+    )
+
+    chunks: list[SheetChunk] = SheetService.split_chunk(chunk)
+
+    assert sum(part.size for part in chunks) == chunk.size
+    for part in chunks:
+        assert {menu.id for menu in part.menus_create} == {submenu[0] for submenu in part.submenus_create}
+        assert SheetChunk.model_validate(part.model_dump(mode='json')) == part
+
+
+async def test_chunk_applied_in_one_transaction(client: AsyncClient) -> None:
+    menu: MenuCreate = MenuCreate(title='Chunk menu', description='Description')
+    chunk: SheetChunk = SheetChunk(
+        menus_create=[menu],
+        submenus_create=[[uuid4(), SubmenuCreate(title='Orphan submenu', description='Description')]]
+    )
+
+    with pytest.raises(IntegrityError):
+        await apply_chunk(SPREADSHEET_URL, chunk.model_dump(mode='json'))
+
+    response: Response = await client.get(reverse('get_menu', menu.id))
+    assert response.status_code == 404
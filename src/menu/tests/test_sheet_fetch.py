@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+import pytest
+from gspread.exceptions import APIError
+from requests import ConnectionError, Response
+
+from src.menu.repositories import sheet_repository
+from src.menu.repositories.sheet_repository import SheetFetchError, SheetRepository
+
+SPREADSHEET_URL: str = 'https://docs.google.com/spreadsheets/d/fetch-sheet/edit'
+VALUES: list[list] = [['menu-id', 'Menu', 'Description']]
+
+
+def api_error(status_code: int, retry_after: str | None = None) -> APIError:
+    response: Response = Response()
+    response.status_code = status_code
+    response._content = json.dumps({'error': {'code': status_code, 'message': 'error', 'status': 'ERROR'}}).encode()
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return APIError(response)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """
+    Фикстура подменяет asyncio.sleep в репозитории листа и записывает задержки между попытками.
+
+    :return: Список задержек в секундах.
+    """
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(sheet_repository.asyncio, 'sleep', sleep)
+    return delays
+
+
+def fetch_results(monkeypatch: pytest.MonkeyPatch, *results: Any) -> list[int]:
+    """
+    Подменяет загрузку листа: каждая попытка возвращает следующий результат или выбрасывает его, если это ошибка.
+
+    :param results: Результаты попыток.
+    :return: Список с числом выполненных попыток.
+    """
+    calls: list[int] = [0]
+
+    def fetch_values(self: SheetRepository) -> list[list]:
+        result: Any = results[calls[0]]
+        calls[0] += 1
+        if isinstance(result, Exception):
+            raise result
+        if callable(result):
+            return result()
+        return result
+
+    monkeypatch.setattr(SheetRepository, '_fetch_values', fetch_values)
+    return calls
+
+
+async def get_values() -> list[list]:
+    return await SheetRepository(None, SPREADSHEET_URL).get_values()
+
+
+@pytest.mark.parametrize(
+    ('error', 'reason'),
+    [
+        (asyncio.TimeoutError(), 'timeout'),
+        (ConnectionError(), 'network'),
+        (api_error(429), 'quota'),
+        (api_error(500), 'server'),
+        (api_error(503), 'server'),
+        (api_error(403), None),
+        (api_error(404), None),
+    ]
+)
+def test_retry_reason(error: Exception, reason: str | None) -> None:
+    assert SheetRepository._get_retry_reason(error) == reason
+
+
+@pytest.mark.parametrize('error', [asyncio.TimeoutError(), ConnectionError(), api_error(429), api_error(502)])
+async def test_transient_errors_are_retried(
+        monkeypatch: pytest.MonkeyPatch,
+        sleeps: list[float],
+        error: Exception
+) -> None:
+    calls: list[int] = fetch_results(monkeypatch, error, error, VALUES)
+
+    assert await get_values() == VALUES
+    assert calls[0] == 3
+    assert len(sleeps) == 2
+
+
+async def test_client_error_is_not_retried(monkeypatch: pytest.MonkeyPatch, sleeps: list[float]) -> None:
+    calls: list[int] = fetch_results(monkeypatch, api_error(403), VALUES)
+
+    with pytest.raises(SheetFetchError):
+        await get_values()
+    assert calls[0] == 1
+    assert sleeps == []
+
+
+async def test_exhausted_retries_raise_instead_of_empty_sheet(
+        monkeypatch: pytest.MonkeyPatch,
+        sleeps: list[float]
+) -> None:
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_RETRIES', 2)
+    calls: list[int] = fetch_results(monkeypatch, *[api_error(503)] * 3)
+
+    with pytest.raises(SheetFetchError):
+        await get_values()
+    assert calls[0] == 3
+    assert len(sleeps) == 2
+
+
+async def test_empty_sheet_is_returned(monkeypatch: pytest.MonkeyPatch, sleeps: list[float]) -> None:
+    fetch_results(monkeypatch, [])
+
+    assert await get_values() == []
+
+
+async def test_hung_fetch_times_out(monkeypatch: pytest.MonkeyPatch, sleeps: list[float]) -> None:
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_TIMEOUT', 0.05)
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_RETRIES', 1)
+
+    def hang() -> list[list]:
+        time.sleep(0.2)
+        return VALUES
+
+    fetch_results(monkeypatch, hang, VALUES)
+
+    assert await get_values() == VALUES
+    assert len(sleeps) == 1
+
+
+async def test_retry_after_is_a_floor(monkeypatch: pytest.MonkeyPatch, sleeps: list[float]) -> None:
+    fetch_results(monkeypatch, api_error(429, retry_after='7'), VALUES)
+
+    assert await get_values() == VALUES
+    assert sleeps[0] >= 7
+
+
+async def test_retry_after_beyond_backoff_max_is_not_waited(
+        monkeypatch: pytest.MonkeyPatch,
+        sleeps: list[float]
+) -> None:
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_BACKOFF_MAX', 30)
+    calls: list[int] = fetch_results(monkeypatch, api_error(429, retry_after='60'), VALUES)
+
+    with pytest.raises(SheetFetchError):
+        await get_values()
+    assert calls[0] == 1
+    assert sleeps == []
+
+
+def test_backoff_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_BACKOFF', 1)
+    monkeypatch.setattr(sheet_repository, 'SHEET_FETCH_BACKOFF_MAX', 5)
+
+    assert 1 <= SheetRepository._get_retry_delay(api_error(503), 0) <= 2
+    assert SheetRepository._get_retry_delay(api_error(503), 10) == 5
@@ -0,0 +1,43 @@
+from uuid import UUID
+
+from httpx import AsyncClient, Response
+
+from src.database import async_session_maker
+from src.menu.repositories.sheet_repository import SheetRepository
+from src.menu.tests.conftest import remove_environment_variable, set_env_variable
+from src.menu.tests.utils import reverse
+
+FIRST_SPREADSHEET_URL: str = 'https://docs.google.com/spreadsheets/d/first-restaurant-sheet/edit'
+SECOND_SPREADSHEET_URL: str = 'https://docs.google.com/spreadsheets/d/second-restaurant-sheet/edit'
+
+
+async def test_create_menu(client: AsyncClient, menu_data: dict[str, str]) -> None:
+    response: Response = await client.post(reverse('create_menu'), json=menu_data)
+
+    assert response.status_code == 201
+    set_env_variable('menu_id', response.json()['id'])
+
+
+async def test_claim_menu(menu_id: str) -> None:
+    async with async_session_maker() as session:
+        sheet_repository: SheetRepository = SheetRepository(session, FIRST_SPREADSHEET_URL)
+        assert await sheet_repository.claim_menus([UUID(menu_id)]) == set()
+
+        menus, _, _ = await sheet_repository.get_full_menu()
+        assert [str(menu.id) for menu in menus] == [menu_id]
+
+
+async def test_menu_of_other_sheet_is_not_claimed(menu_id: str) -> None:
+    async with async_session_maker() as session:
+        sheet_repository: SheetRepository = SheetRepository(session, SECOND_SPREADSHEET_URL)
+        assert {str(foreign_id) for foreign_id in await sheet_repository.claim_menus([UUID(menu_id)])} == {menu_id}
+
+        menus, _, _ = await sheet_repository.get_full_menu()
+        assert menus == []
+
+
+async def test_delete_menu(client: AsyncClient, menu_id: str) -> None:
+    response: Response = await client.delete(reverse('delete_menu', menu_id))
+
+    assert response.status_code == 200
+    remove_environment_variable('menu_id')
@@ -1,5 +1,6 @@
 import uuid
 
+import pytest
 from httpx import AsyncClient, Response
 
 from src.menu.tests.conftest import remove_environment_variable, set_env_variable
@@ -33,6 +34,7 @@ async def test_create_submenu(
     set_env_variable('submenu_id', response_json['id'])
 
 
+@pytest.mark.query_budget(sql=1, redis=5)
 async def test_get_submenus(client: AsyncClient, submenu_data: dict[str, str], menu_id: str) -> None:
     response: Response = await client.get(reverse('get_submenus', menu_id))
     response_json: list[dict[str, str | int]] = response.json()
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from aioredis import from_url
+from httpx import AsyncClient, Response
+
+from src.config import (
+    SHEET_SYNC_BACKOFF_FACTOR,
+    SHEET_SYNC_MAX_INTERVAL,
+    SHEET_SYNC_MIN_INTERVAL,
+)
+from src.database import REDIS_URL
+from src.menu.api.sync_api import SYNC_TASK_NAME
+from src.menu.services.sync_schedule import SyncSchedule
+from src.menu.tests.utils import reverse
+from src.menu.worker.celery_app import celery_app
+
+SOURCE: str = 'test-sync-schedule'
+ALL_DAY: tuple[int, int] = (0, 24)
+
+
+async def test_schedule_backs_off_and_resets() -> None:
+    async with await from_url(REDIS_URL) as redis:
+        schedule: SyncSchedule = SyncSchedule(redis, SOURCE, quiet_hours=None)
+        await schedule.cache_service.delete_cache(schedule.key)
+        assert await schedule.is_due() is True
+
+        assert await schedule.record(changed=False) == SHEET_SYNC_MIN_INTERVAL
+        assert await schedule.record(changed=False) == SHEET_SYNC_MIN_INTERVAL * SHEET_SYNC_BACKOFF_FACTOR
+        assert await schedule.is_due() is False
+
+        assert await schedule.record(changed=True) == SHEET_SYNC_MIN_INTERVAL
+
+        await schedule.cache_service.delete_cache(schedule.key)
+
+
+async def test_schedule_quiet_hours() -> None:
+    async with await from_url(REDIS_URL) as redis:
+        schedule: SyncSchedule = SyncSchedule(redis, SOURCE, quiet_hours=ALL_DAY)
+
+        assert await schedule.record(changed=True) == SHEET_SYNC_MAX_INTERVAL
+
+        await schedule.cache_service.delete_cache(schedule.key)
+
+
+async def test_sync_now_queues_forced_sync(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[tuple[str, dict[str, Any]]] = []
+
+    def send_task(name: str, kwargs: dict[str, Any]) -> SimpleNamespace:
+        sent.append((name, kwargs))
+        return SimpleNamespace(id='sync-task-id')
+
+    monkeypatch.setattr(celery_app, 'send_task', send_task)
+    response: Response = await client.post(reverse('sync_now'))
+
+    assert response.status_code == 202
+    assert response.json() == {'task_id': 'sync-task-id'}
+    assert sent == [(SYNC_TASK_NAME, {'force': True})]
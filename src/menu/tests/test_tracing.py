@@ -0,0 +1,39 @@
+import logging
+
+import pytest
+
+from src.tracing import RequestTrace, TracingMiddleware
+
+STATEMENT: str = 'SELECT menu.id FROM menu WHERE menu.id = $1'
+
+
+def test_statements_recorded_on_request() -> None:
+    trace: RequestTrace = RequestTrace(record_statements=True)
+    for _ in range(3):
+        trace.add_query(STATEMENT, 0.001)
+
+    assert trace.sql_statements == 3
+    assert trace.repeated_statements(3) == [(STATEMENT, 3)]
+
+
+def test_statements_not_recorded_by_default() -> None:
+    trace: RequestTrace = RequestTrace(record_statements=False)
+    for _ in range(3):
+        trace.add_query(STATEMENT, 0.001)
+
+    assert trace.sql_statements == 3
+    assert trace.statements is None
+    assert trace.repeated_statements(1) == []
+
+
+def test_check_budget_logs_n_plus_one(caplog: pytest.LogCaptureFixture) -> None:
+    trace: RequestTrace = RequestTrace(record_statements=True)
+    for _ in range(10):
+        trace.add_query(STATEMENT, 0.001)
+
+    with caplog.at_level(logging.WARNING, logger='src.tracing'):
+        TracingMiddleware.check_budget({'method': 'GET', 'path': '/api/v1/menus'}, trace)
+
+    messages: list[str] = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith('Request budget exceeded: GET /api/v1/menus: 10/') for message in messages)
+    assert f'Possible N+1 in GET /api/v1/menus: 10 x {STATEMENT}' in messages
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+WORKER_IMPORTS: str = '''
+import sys
+from src.menu.worker.celery_app import celery_app
+for name in celery_app.conf.include:
+    __import__(name)
+print(','.join(sorted(name for name in ('fastapi', 'src.main', 'src.menu.api') if name in sys.modules)))
+'''
+
+
+def test_worker_does_not_import_web_app() -> None:
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', WORKER_IMPORTS],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.strip() == ''
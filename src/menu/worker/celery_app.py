@@ -1,11 +1,22 @@
+from typing import Any
+
 from celery import Celery
+from celery.signals import worker_process_init
+from prometheus_client import start_http_server
 
-from src.database import RABBITMQ_URL
+from src.config import METRICS_WORKER_PORT, SHEET_SYNC_MIN_INTERVAL
+from src.database import RABBITMQ_URL, REDIS_URL
 
 celery_app: Celery = Celery(
     'RestaurantMenuApi',
     broker=RABBITMQ_URL,
-    include=['src.menu.worker.tasks.excel_sync_task']
+    # Результаты нужны только группе задач применения листа (chord), остальные задачи их не сохраняют.
+    backend=REDIS_URL,
+    include=[
+        'src.menu.worker.tasks.excel_sync_task',
+        'src.menu.worker.tasks.sheet_chunk_task',
+        'src.menu.worker.tasks.change_log_task'
+    ]
 )
 
 celery_app.conf.update(
@@ -14,11 +25,31 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='Europe/Minsk',
     enable_utc=True,
+    task_ignore_result=True,
+    result_expires=3600,
 )
 
 celery_app.conf.beat_schedule = {
     'sync_excel_to_db': {
         'task': 'src.menu.worker.tasks.excel_sync_task.sync_excel_to_db',
-        'schedule': 15.0,
+        'schedule': SHEET_SYNC_MIN_INTERVAL,
+    },
+    'compact_change_log': {
+        'task': 'src.menu.worker.tasks.change_log_task.compact_change_log_task',
+        'schedule': 3600.0,
     },
 }
+
+
+@worker_process_init.connect
+def start_metrics_server(**kwargs: Any) -> None:
+    """
+    Запускает HTTP-сервер с метриками Prometheus в процессе воркера.
+
+    Метрики синхронизации собираются в дочернем процессе, выполняющем задачу, поэтому сервер
+    поднимается в нём. При нескольких дочерних процессах порт получает только первый.
+    """
+    try:
+        start_http_server(METRICS_WORKER_PORT)
+    except OSError as e:
+        print('Metrics server error: ', e)
@@ -0,0 +1,26 @@
+import asyncio
+
+from src.database import USE_PRIMARY, async_session_maker
+from src.menu.repositories.change_log_repository import ChangeLogRepository
+from src.menu.services.change_log_service import ChangeLogService
+from src.menu.worker.celery_app import celery_app
+
+
+async def compact_change_log() -> int:
+    async with async_session_maker() as session:
+        session.info[USE_PRIMARY] = True
+        return await ChangeLogService(ChangeLogRepository(session)).compact()
+
+
+@celery_app.task()
+def compact_change_log_task() -> None:
+    """
+    Удаляет записи журнала изменений старше CHANGE_LOG_RETENTION_HOURS.
+
+    Клиенты, запрашивающие изменения с удалённой версии, получают resync=True.
+    """
+    try:
+        deleted: int = asyncio.get_event_loop().run_until_complete(compact_change_log())
+        print('Change log compacted: ', deleted)
+    except Exception as e:
+        print('Exception: ', e)
@@ -1,40 +1,70 @@
 import asyncio
 
-from aioredis import from_url
+from aioredis import Redis, from_url
 
-from src.database import REDIS_URL, async_session_maker
+from src.config import SHEET_SYNC_CONCURRENCY, SPREADSHEET_URLS
+from src.database import REDIS_URL, USE_PRIMARY, async_session_maker
+from src.menu.repositories.sheet_repository import SheetFetchError
 from src.menu.services.sheet_service import SheetService
 from src.menu.worker.celery_app import celery_app
+from src.menu.worker.tasks.sheet_chunk_task import dispatch_sheet_chunks
 
 
-async def sync_db_sheet():
-    async with async_session_maker() as session:
+async def sync_sheet(redis: Redis, spreadsheet_url: str, semaphore: asyncio.Semaphore, force: bool) -> None:
+    """
+    Синхронизирует одну таблицу в отдельной сессии базы данных.
+
+    :param redis: Клиент Redis.
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param semaphore: Ограничение числа таблиц, синхронизируемых одновременно.
+    :param force: Синхронизировать независимо от расписания.
+    """
+    async with semaphore, async_session_maker() as session:
+        session.info[USE_PRIMARY] = True
         try:
-            redis = from_url(REDIS_URL)
-            sheet_service = SheetService(redis, session)
-            await sheet_service.check_data()
-            print('SYNC')
+            sheet_service = SheetService(redis, session, spreadsheet_url, dispatch_sheet_chunks)
+            result: str = await sheet_service.sync(force)
+            if result != 'skipped':
+                print('SYNC', sheet_service.source, result)
+        except SheetFetchError as e:
+            print('Синхронизация пропущена', spreadsheet_url, e)
         except IndexError as e:
-            print('Ошибка', e)
+            print('Ошибка', spreadsheet_url, e)
+
+
+async def sync_db_sheet(force: bool = False):
+    redis = from_url(REDIS_URL)
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(SHEET_SYNC_CONCURRENCY)
+    results: list = await asyncio.gather(
+        *(sync_sheet(redis, spreadsheet_url, semaphore, force) for spreadsheet_url in SPREADSHEET_URLS),
+        return_exceptions=True
+    )
+    for spreadsheet_url, result in zip(SPREADSHEET_URLS, results):
+        if isinstance(result, Exception):
+            print('Exception: ', spreadsheet_url, result)
 
 
 @celery_app.task()
-def sync_excel_to_db() -> None:
+def sync_excel_to_db(force: bool = False) -> None:
     """
     Синхронизирует данные из Google Sheets с базой данных.
 
     Получает данные из Google Sheets, парсит их, получает текущие данные из базы данных,
     затем сравнивает и обновляет базу данных в соответствии с данными из таблицы.
+    Таблицы из SPREADSHEET_URLS обрабатываются параллельно, не больше SHEET_SYNC_CONCURRENCY одновременно;
+    каждая таблица обновляет только свои меню. Задача запускается часто, а таблица обрабатывается,
+    только когда подошёл её срок по адаптивному расписанию (SyncSchedule).
 
     Обработчик исключений добавлен для обработки ошибок, таких как отсутствие файла,
     некорректное содержимое таблицы или другие исключения, которые могут возникнуть при работе с данными.
 
+    :param force: Синхронизировать все таблицы независимо от расписания (запрос POST /api/v1/sync).
     :raises FileNotFoundError: Если файл не найден.
     :raises IndexError: Если произошла ошибка в структуре таблицы.
     """
     try:
         loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(sync_db_sheet())
+        result = loop.run_until_complete(sync_db_sheet(force))
         return result
     except FileNotFoundError:
         print('No such file')
@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any
+
+from aioredis import from_url
+from celery import chord
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import REDIS_URL, USE_PRIMARY, async_session_maker, engine
+from src.menu.schemas.sheet_schema import SheetChunk
+from src.menu.services.sheet_service import SheetService
+from src.menu.worker.celery_app import celery_app
+
+
+async def apply_chunk(spreadsheet_url: str, chunk: dict[str, Any]) -> dict[str, list]:
+    """
+    Применяет часть изменений листа в одной транзакции.
+
+    Репозитории фиксируют каждую запись; сессия, привязанная к соединению с открытой транзакцией,
+    превращает эти фиксации в точки сохранения, и часть применяется целиком или не применяется вовсе.
+
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param chunk: Часть изменений (SheetChunk в JSON).
+    :return: Затронутые области: invalidate и warm - списки пар [menu_id, submenu_id].
+    """
+    redis = from_url(REDIS_URL)
+    async with engine.connect() as connection, connection.begin():
+        async with AsyncSession(
+                bind=connection,
+                join_transaction_mode='create_savepoint',
+                expire_on_commit=False
+        ) as session:
+            sheet_service = SheetService(redis, session, spreadsheet_url)
+            await sheet_service.apply_chunk(SheetChunk.model_validate(chunk))
+    return sheet_service.dump_scopes()
+
+
+async def finish_sync(
+        scopes: list[dict[str, list]],
+        spreadsheet_url: str,
+        lock_token: str,
+        deletion_scopes: dict[str, list]
+) -> None:
+    async with async_session_maker() as session:
+        session.info[USE_PRIMARY] = True
+        await SheetService(from_url(REDIS_URL), session, spreadsheet_url).finish_chunks(
+            [deletion_scopes, *scopes],
+            lock_token
+        )
+
+
+async def fail_sync(spreadsheet_url: str, lock_token: str) -> None:
+    async with async_session_maker() as session:
+        session.info[USE_PRIMARY] = True
+        await SheetService(from_url(REDIS_URL), session, spreadsheet_url).fail_chunks(lock_token)
+
+
+@celery_app.task(ignore_result=False)
+def apply_sheet_chunk(spreadsheet_url: str, chunk: dict[str, Any]) -> dict[str, list]:
+    """
+    Применяет часть изменений листа (заголовок chord из dispatch_sheet_chunks).
+
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param chunk: Часть изменений (SheetChunk в JSON).
+    :return: Затронутые области части.
+    """
+    return asyncio.get_event_loop().run_until_complete(apply_chunk(spreadsheet_url, chunk))
+
+
+@celery_app.task()
+def finish_sheet_sync(
+        scopes: list[dict[str, list]],
+        spreadsheet_url: str,
+        lock_token: str,
+        deletion_scopes: dict[str, list]
+) -> None:
+    """
+    Завершает синхронизацию после применения всех частей: сохраняет снимок и версию журнала изменений,
+    инвалидирует кэш затронутых областей одним вызовом и снимает блокировку таблицы.
+
+    :param scopes: Результаты задач apply_sheet_chunk.
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param lock_token: Токен блокировки таблицы.
+    :param deletion_scopes: Затронутые области удалений, выполненных до постановки задач.
+    """
+    asyncio.get_event_loop().run_until_complete(finish_sync(scopes, spreadsheet_url, lock_token, deletion_scopes))
+    print('SYNC', spreadsheet_url, 'applied', len(scopes), 'chunks')
+
+
+@celery_app.task()
+def fail_sheet_sync(request: Any, exc: Exception, traceback: Any, spreadsheet_url: str, lock_token: str) -> None:
+    """
+    Обрабатывает ошибку применения части изменений: снимает блокировку таблицы без сохранения снимка.
+
+    :param request: Контекст упавшей задачи.
+    :param exc: Исключение.
+    :param traceback: Трассировка.
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param lock_token: Токен блокировки таблицы.
+    """
+    print('Exception: ', spreadsheet_url, exc)
+    asyncio.get_event_loop().run_until_complete(fail_sync(spreadsheet_url, lock_token))
+
+
+def dispatch_sheet_chunks(
+        spreadsheet_url: str,
+        chunks: list[SheetChunk],
+        lock_token: str,
+        deletion_scopes: dict[str, list]
+) -> None:
+    """
+    Ставит применение частей изменений в очередь Celery (передаётся в SheetService как dispatch_chunks).
+
+    Когда все части применены, завершающая задача переносит снимок, инвалидирует кэш и снимает блокировку;
+    если часть не применилась, блокировку снимает обработчик ошибки, а снимок не сохраняется.
+
+    :param spreadsheet_url: Ссылка на таблицу Google Sheets.
+    :param chunks: Части изменений листа.
+    :param lock_token: Токен блокировки таблицы.
+    :param deletion_scopes: Затронутые области удалений, выполненных до постановки задач.
+    """
+    callback = finish_sheet_sync.s(spreadsheet_url, lock_token, deletion_scopes)
+    callback.on_error(fail_sheet_sync.s(spreadsheet_url, lock_token))
+    chord([apply_sheet_chunk.s(spreadsheet_url, chunk.model_dump(mode='json')) for chunk in chunks])(callback)
@@ -0,0 +1,195 @@
+import functools
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable
+
+from aioredis.connection import Connection
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.menu.services.cache_keys import CODE_LENGTH, family_of
+from src.tracing import RequestTrace, finish_trace, request_trace, start_trace
+
+REQUEST_LATENCY: Histogram = Histogram(
+    'http_request_duration_seconds',
+    'Время обработки HTTP-запроса до отправки ответа.',
+    ('route', 'method')
+)
+DB_QUERY_LATENCY: Histogram = Histogram(
+    'db_query_duration_seconds',
+    'Время выполнения SQL-запроса по методу репозитория.',
+    ('repository_method',)
+)
+CACHE_REQUESTS: Counter = Counter(
+    'cache_requests',
+    'Обращения к кэшу по семейству ключей и результату (hit/miss).',
+    ('family', 'result')
+)
+CACHE_LATENCY: Histogram = Histogram(
+    'cache_get_or_set_duration_seconds',
+    'Время CacheService.get_or_set по семейству ключей и результату (hit/miss).',
+    ('family', 'result')
+)
+REDIS_ROUND_TRIPS: Histogram = Histogram(
+    'redis_round_trips_per_request',
+    'Количество обращений к Redis за HTTP-запрос, включая фоновые задачи.',
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64)
+)
+SYNC_PHASE_LATENCY: Histogram = Histogram(
+    'sheet_sync_phase_duration_seconds',
+    'Длительность этапов синхронизации с Google Sheets по таблице.',
+    ('source', 'phase'),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+SHEET_FETCH_RETRY_ATTEMPTS: Counter = Counter(
+    'sheet_fetch_retries_total',
+    'Повторные попытки получения данных Google Sheets по таблице и причине (timeout, quota, server, network).',
+    ('source', 'reason')
+)
+SHEET_SYNC_RUNS: Counter = Counter(
+    'sheet_sync_runs_total',
+    'Запуски синхронизации по таблице и результату (applied, unchanged, locked, failed).',
+    ('source', 'result')
+)
+CHANGE_FEED_SUBSCRIBERS: Gauge = Gauge(
+    'change_feed_subscribers',
+    'Количество клиентов, подписанных на изменения меню.'
+)
+CHANGE_FEED_OVERFLOWS: Counter = Counter(
+    'change_feed_overflows_total',
+    'Количество переполнений очереди медленного подписчика (события заменены сигналом refetch).'
+)
+
+repository_method: ContextVar[str] = ContextVar('repository_method', default='unknown')
+
+_cache_metrics: dict[tuple[bytes, str], tuple[Any, Any]] = {}
+
+
+def observe_cache(cache_key: bytes, result: str, started: float) -> None:
+    """
+    Учесть обращение к кэшу.
+
+    Дочерние метрики с метками кэшируются по коду семейства, чтобы не искать их на каждом обращении.
+
+    :param cache_key: Ключ кэша без префикса.
+    :param result: Результат обращения: hit или miss.
+    :param started: Время начала обращения (time.perf_counter()).
+    """
+    children: tuple[Any, Any] | None = _cache_metrics.get((cache_key[:CODE_LENGTH], result))
+    if children is None:
+        family_name: str = getattr(family_of(cache_key), 'name', 'unknown')
+        children = (CACHE_REQUESTS.labels(family_name, result), CACHE_LATENCY.labels(family_name, result))
+        _cache_metrics[(cache_key[:CODE_LENGTH], result)] = children
+
+    children[0].inc()
+    children[1].observe(time.perf_counter() - started)
+
+
+def track_repository_method(name: str, method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Оборачивает метод репозитория, чтобы SQL-запросы внутри него учитывались под его именем.
+
+    :param name: Имя метода для метки метрики, например 'DishRepository.get_dish'.
+    :param method: Асинхронный метод репозитория.
+    :return: Обёрнутый метод.
+    """
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = repository_method.set(name)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            repository_method.reset(token)
+
+    return wrapper
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                           executemany: bool) -> None:
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                          executemany: bool) -> None:
+    duration: float = time.perf_counter() - conn.info['query_started'].pop()
+    DB_QUERY_LATENCY.labels(repository_method.get()).observe(duration)
+    trace: RequestTrace | None = request_trace.get()
+    if trace is not None:
+        trace.add_query(statement, duration)
+
+
+def instrument_engines(engines: Iterable[AsyncEngine]) -> None:
+    """
+    Подписывается на события выполнения SQL-запросов.
+
+    :param engines: Движки основной базы и реплик.
+    """
+    for engine in engines:
+        event.listen(engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+class InstrumentedConnection(Connection):
+    """
+    Соединение Redis, считающее отправленные пакеты команд (одна отправка - один round trip)
+    и время отправки команд и чтения ответов.
+    """
+
+    async def send_packed_command(self, command: Any, check_health: bool = True) -> None:
+        trace: RequestTrace | None = request_trace.get()
+        if trace is None:
+            await super().send_packed_command(command, check_health)
+            return
+
+        trace.redis_round_trips += 1
+        started: float = time.perf_counter()
+        try:
+            await super().send_packed_command(command, check_health)
+        finally:
+            trace.redis_time += time.perf_counter() - started
+
+    async def read_response(self) -> Any:
+        trace: RequestTrace | None = request_trace.get()
+        if trace is None:
+            return await super().read_response()
+
+        started: float = time.perf_counter()
+        try:
+            return await super().read_response()
+        finally:
+            trace.redis_time += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware, измеряющее время HTTP-запроса до отправки ответа и число обращений к Redis.
+
+    Фоновые задачи выполняются после отправки ответа, поэтому в задержку не попадают,
+    но их обращения к Redis учитываются.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started: float = time.perf_counter()
+        trace, token = start_trace()
+        round_trips: int = trace.redis_round_trips
+
+        async def send_wrapper(message: Message) -> None:
+            await send(message)
+            if message['type'] == 'http.response.body' and not message.get('more_body', False):
+                route_name: str = getattr(scope.get('route'), 'name', None) or 'unmatched'
+                REQUEST_LATENCY.labels(route_name, scope['method']).observe(time.perf_counter() - started)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REDIS_ROUND_TRIPS.observe(trace.redis_round_trips - round_trips)
+            finish_trace(token)
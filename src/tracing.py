@@ -0,0 +1,141 @@
+import logging
+from collections import Counter
+from contextvars import ContextVar, Token
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import (
+    TRACING_ENABLED,
+    TRACING_N_PLUS_ONE_THRESHOLD,
+    TRACING_REDIS_BUDGET,
+    TRACING_SQL_BUDGET,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestTrace:
+    """
+    Счётчики SQL-запросов и обращений к Redis, накопленные в рамках одного HTTP-запроса.
+
+    Трассировка запускается для каждого запроса ради метрик, поэтому тексты SQL-запросов для поиска N+1
+    собираются, только если включена трассировка (TRACING_ENABLED) или это запрошено явно.
+    """
+    __slots__ = ('sql_statements', 'sql_time', 'redis_round_trips', 'redis_time', 'statements')
+
+    def __init__(self, record_statements: bool = TRACING_ENABLED) -> None:
+        self.sql_statements: int = 0
+        self.sql_time: float = 0.0
+        self.redis_round_trips: int = 0
+        self.redis_time: float = 0.0
+        self.statements: Counter[str] | None = Counter() if record_statements else None
+
+    def add_query(self, statement: str, duration: float) -> None:
+        """
+        Учесть выполненный SQL-запрос.
+
+        :param statement: Текст запроса.
+        :param duration: Время выполнения в секундах.
+        """
+        self.sql_statements += 1
+        self.sql_time += duration
+        if self.statements is not None:
+            self.statements[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Возвращает запросы, выполненные не меньше threshold раз (признак N+1).
+
+        :param threshold: Минимальное число повторов.
+        :return: Пары (запрос, число выполнений); пустой список, если тексты запросов не собираются.
+        """
+        if self.statements is None:
+            return []
+        return [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+
+    def server_timing(self) -> bytes:
+        """
+        Формирует значение заголовка Server-Timing.
+
+        :return: Значение заголовка, например b'db;dur=1.20;desc="2 queries", redis;dur=0.31;desc="3 round trips"'.
+        """
+        return (
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.sql_statements} queries", '
+            f'redis;dur={self.redis_time * 1000:.2f};desc="{self.redis_round_trips} round trips"'
+        ).encode()
+
+
+request_trace: ContextVar[RequestTrace | None] = ContextVar('request_trace', default=None)
+
+
+def start_trace() -> tuple[RequestTrace, Token | None]:
+    """
+    Начинает трассировку запроса или продолжает уже начатую выше по стеку (другим middleware или тестом).
+
+    :return: Трассировка и токен для сброса контекстной переменной (None, если трассировка не новая).
+    """
+    trace: RequestTrace | None = request_trace.get()
+    if trace is not None:
+        return trace, None
+    trace = RequestTrace()
+    return trace, request_trace.set(trace)
+
+
+def finish_trace(token: Token | None) -> None:
+    """
+    Завершает трассировку, начатую start_trace.
+
+    :param token: Токен, возвращённый start_trace.
+    """
+    if token is not None:
+        request_trace.reset(token)
+
+
+class TracingMiddleware:
+    """
+    ASGI-middleware, добавляющее к ответу заголовок Server-Timing и сообщающее о запросах,
+    превысивших бюджет SQL-запросов или обращений к Redis, а также о повторяющихся запросах (N+1).
+
+    Учитывается работа до отправки ответа; фоновые задачи в заголовок и проверку бюджета не попадают.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        trace, token = start_trace()
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                message['headers'] = [*message.get('headers', ()), (b'server-timing', trace.server_timing())]
+            elif message['type'] == 'http.response.body' and not message.get('more_body', False):
+                self.check_budget(scope, trace)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish_trace(token)
+
+    @staticmethod
+    def check_budget(scope: Scope, trace: RequestTrace) -> None:
+        """
+        Сообщает о превышении бюджета запросов.
+
+        :param scope: ASGI scope запроса.
+        :param trace: Трассировка запроса.
+        """
+        request: str = f"{scope['method']} {scope['path']}"
+        if trace.sql_statements > TRACING_SQL_BUDGET or trace.redis_round_trips > TRACING_REDIS_BUDGET:
+            logger.warning(
+                'Request budget exceeded: %s: %d/%d queries (%.2f ms), %d/%d redis round trips (%.2f ms)',
+                request,
+                trace.sql_statements, TRACING_SQL_BUDGET, trace.sql_time * 1000,
+                trace.redis_round_trips, TRACING_REDIS_BUDGET, trace.redis_time * 1000
+            )
+        for statement, count in trace.repeated_statements(TRACING_N_PLUS_ONE_THRESHOLD):
+            logger.warning('Possible N+1 in %s: %d x %s', request, count, ' '.join(statement.split())[:200])